@@ -0,0 +1,66 @@
+import os
+
+from tests.api.api_methods.auth_methods_api import AuthApi
+from tests.utils.shared_store import SharedStore
+from tests.utils.step_logger import StepLogger
+from tests.utils.utils import check_response_status
+
+
+class AuthHelperApi:
+    """
+    Хелпер авторизации по API с кэшем результатов между тестами и воркерами xdist.
+
+    OTP-рукопожатие (POST /login/code + PUT /login/code) выполняется один раз на email за прогон,
+    результат (hash_code, токены и cookies ответа) хранится в SharedStore с TTL (AUTH_CACHE_TTL_S).
+    """
+
+    def __init__(self, store: SharedStore = None, fresh: bool = False):
+        """
+        :param store: Хранилище кэша (None — кэш не используется).
+        :param fresh: Всегда выполнять авторизацию заново, обновляя запись в кэше.
+        """
+        self.auth_api = AuthApi()
+        self.store = store
+        self.fresh = fresh
+        self.ttl = float(os.getenv("AUTH_CACHE_TTL_S", "600"))
+
+    def login(self, email: str, code: str) -> dict:
+        """
+        Возвращает результат авторизации для email, используя кэш, если это разрешено.
+
+        :param email: Email пользователя.
+        :param code: Код подтверждения.
+        :return: Словарь {email, hash_code, response, cookies}, где cookies — список {name, value, domain, path}.
+        """
+        if self.store is None:
+            return self._login(email, code)
+
+        # Адрес API входит в ключ: у каждого воркера свой локальный стенд (API_STUB), и его hash_code чужим не подходит
+        key = f"auth:{self.auth_api.http_client.base_url}:{email}"
+        if self.fresh:
+            self.store.delete(key)
+        return self.store.get_or_create(key, lambda: self._login(email, code), ttl=self.ttl)
+
+    def _login(self, email: str, code: str) -> dict:
+        with StepLogger(f"Авторизуемся по API под '{email}'"):
+            response_email = self.auth_api.post_email(email=email)
+            check_response_status(response_email, 200)
+
+            response_code = self.auth_api.put_code(data={"email": email, "code": code})
+            check_response_status(response_code, 200)
+
+        payload = response_code.json().get("response") or {}
+        cookies = {}
+        for cookie in list(response_email.cookies) + list(response_code.cookies):
+            cookies[cookie.name] = {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path or "/"
+            }
+        return {
+            "email": email,
+            "hash_code": payload.get("hash_code"),
+            "response": payload,
+            "cookies": list(cookies.values())
+        }
@@ -0,0 +1,137 @@
+import logging
+import queue
+import random
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.api.api_helpers.auth_helper_api import AuthHelperApi
+from tests.api.api_methods.auth_methods_api import AuthApi
+from tests.utils.utils import check_response_status
+
+logger = logging.getLogger(__name__)
+
+
+class WorkspacePool:
+    """
+    Пул заранее созданных через API воркспейсов.
+
+    При старте параллельно создаёт до size воркспейсов и после каждой выдачи в фоне создаёт замену,
+    поэтому тесты получают готовый воркспейс (domain, invite token) без ожидания.
+    Воркспейсы одноразовые: выданный воркспейс в пул не возвращается. API удаления воркспейсов нет,
+    поэтому пул не создаёт больше, чем ожидается выдач (demand): невыданные воркспейсы остаются на стенде.
+    """
+
+    def __init__(self, size: int, email: str, code: str, auth_helper: AuthHelperApi = None, demand: int = None):
+        """
+        :param size: Количество готовых воркспейсов, которое поддерживается в пуле.
+        :param email: Email владельца воркспейсов.
+        :param code: Код подтверждения.
+        :param auth_helper: Хелпер авторизации (по умолчанию — без кэша).
+        :param demand: Ожидаемое количество выдач за сессию (None — пополнять без ограничения).
+        """
+        self.size = size
+        self.demand = demand
+        self.email = email
+        self.code = code
+        self.auth_helper = auth_helper or AuthHelperApi()
+        self.auth_api = AuthApi()
+        self._ready = queue.Queue()
+        self._executor = None
+        self._lock = threading.Lock()
+        self._last_error = None
+        self._stopped = False
+        self._in_flight = 0
+        self._checked_out = 0
+
+    def start(self):
+        """
+        Запускает параллельное создание воркспейсов (не блокирует вызывающий поток).
+
+        :return: None
+        """
+        with self._lock:
+            if self._executor is not None:
+                return
+            self._stopped = False
+            self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="workspace-pool")
+        self._refill()
+
+    def checkout(self, timeout: float = 60) -> dict:
+        """
+        Выдаёт готовый воркспейс и запускает создание замены.
+
+        :param timeout: Максимальное время ожидания готового воркспейса в секундах.
+        :return: Словарь {domain, invite_token, hash_code, email}.
+        :raises TimeoutError: Если за отведённое время воркспейс не был создан.
+        """
+        self.start()
+        with self._lock:
+            # Выдач больше, чем ожидалось: создаём воркспейс под этот запрос, даже если лимит исчерпан
+            if self._ready.empty() and self._in_flight == 0:
+                self._submit(1)
+        try:
+            workspace = self._ready.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"Пул не выдал воркспейс за {timeout} с. Последняя ошибка создания: {self._last_error}"
+            )
+        with self._lock:
+            self._checked_out += 1
+        self._refill()
+        return workspace
+
+    def stop(self):
+        """
+        Останавливает фоновое создание воркспейсов.
+
+        :return: None
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._stopped = True
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _refill(self):
+        # Держим в пуле до size воркспейсов, но не больше, чем осталось ожидаемых выдач
+        with self._lock:
+            target = self.size if self.demand is None else min(self.size, self.demand - self._checked_out)
+            self._submit(target - self._ready.qsize() - self._in_flight)
+
+    def _submit(self, count: int):
+        if self._executor is None:
+            return
+        for _ in range(count):
+            self._in_flight += 1
+            self._executor.submit(self._provision)
+
+    def _provision(self):
+        try:
+            self._ready.put(self._create_workspace())
+        except Exception as error:
+            if self._stopped:
+                # Создание прервано остановкой пула в конце сессии
+                return
+            self._last_error = error
+            logger.error(f"Не удалось создать воркспейс для пула: {error}")
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _create_workspace(self) -> dict:
+        hash_code = self.auth_helper.login(self.email, self.code)["hash_code"]
+        domain = "autotest_" + ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
+
+        response_check_domain = self.auth_api.get_domain_check(hash_code=hash_code, domain=domain)
+        check_response_status(response_check_domain, 200)
+
+        response_create_workspace = self.auth_api.post_create_workspace(hash_code=hash_code, domain=domain)
+        check_response_status(response_create_workspace, 200)
+
+        return {
+            "domain": domain,
+            "invite_token": response_create_workspace.json().get("token"),
+            "hash_code": hash_code,
+            "email": self.email
+        }
@@ -0,0 +1,224 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.utils.utils import percentile
+
+
+class LoadScenario:
+    """
+    Базовый класс сценария виртуального пользователя.
+
+    Сценарий — упорядоченный список шагов. Каждый шаг получает общий для итерации словарь context
+    (в него шаги складывают hash_code, token и т.д.) и возвращает HTTP-ответ.
+    Если шаг завершился ошибкой, оставшиеся шаги итерации пропускаются.
+    """
+
+    def steps(self) -> list:
+        """
+        :return: Список пар (имя шага, функция шага).
+        """
+        raise NotImplementedError
+
+
+class LoadStats:
+    """
+    Потокобезопасный накопитель результатов шагов.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._steps = {}
+        self.iterations = 0
+        self.failed_iterations = 0
+        self.dropped_iterations = 0
+
+    def add_step(self, name: str, latency: float, ok: bool):
+        with self._lock:
+            self._steps.setdefault(name, []).append((latency, ok))
+
+    def add_iteration(self, ok: bool):
+        with self._lock:
+            self.iterations += 1
+            if not ok:
+                self.failed_iterations += 1
+
+    def add_dropped(self):
+        with self._lock:
+            self.dropped_iterations += 1
+
+    def build_report(self, elapsed: float) -> dict:
+        """
+        Формирует отчёт: пропускная способность, доля ошибок и перцентили задержки по шагам.
+
+        :param elapsed: Фактическая длительность прогона в секундах.
+        :return: Словарь с итогами прогона.
+        """
+        with self._lock:
+            steps = {name: list(results) for name, results in self._steps.items()}
+
+        report_steps = {}
+        for name, results in steps.items():
+            latencies = [latency for latency, _ in results]
+            errors = sum(1 for _, ok in results if not ok)
+            report_steps[name] = {
+                "count": len(results),
+                "errors": errors,
+                "error_rate": errors / len(results),
+                "rps": len(results) / elapsed if elapsed else 0.0,
+                "p50_ms": percentile(latencies, 50) * 1000,
+                "p95_ms": percentile(latencies, 95) * 1000,
+                "p99_ms": percentile(latencies, 99) * 1000,
+                "max_ms": max(latencies) * 1000
+            }
+
+        return {
+            "elapsed_s": elapsed,
+            "iterations": self.iterations,
+            "failed_iterations": self.failed_iterations,
+            "dropped_iterations": self.dropped_iterations,
+            "iterations_per_s": self.iterations / elapsed if elapsed else 0.0,
+            "error_rate": self.failed_iterations / self.iterations if self.iterations else 0.0,
+            "steps": report_steps
+        }
+
+
+class LoadRunner:
+    """
+    Запускает сценарий от имени N виртуальных пользователей.
+
+    Поддерживаются две модели нагрузки:
+        закрытая (arrival_rate=None) — users пользователей стартуют равномерно в течение ramp_up
+            и выполняют сценарий в цикле до окончания duration;
+        открытая (arrival_rate задан) — новые итерации запускаются с постоянной частотой arrival_rate
+            в секунду (частота линейно растёт в течение ramp_up), users ограничивает число
+            одновременных итераций; итерации, для которых не нашлось свободного пользователя,
+            считаются отброшенными.
+    """
+
+    def __init__(
+        self,
+        scenario_factory,
+        users: int,
+        duration: float,
+        ramp_up: float = 0,
+        arrival_rate: float = None,
+        max_iterations: int = None
+    ):
+        """
+        :param scenario_factory: Фабрика сценария (вызывается один раз на виртуального пользователя).
+        :param users: Количество виртуальных пользователей.
+        :param duration: Ограничение длительности прогона в секундах.
+        :param ramp_up: Время разгона в секундах.
+        :param arrival_rate: Частота запуска итераций в секунду (открытая модель).
+        :param max_iterations: Ограничение общего числа итераций (необязательно).
+        """
+        self.scenario_factory = scenario_factory
+        self.users = users
+        self.duration = duration
+        self.ramp_up = ramp_up
+        self.arrival_rate = arrival_rate
+        self.max_iterations = max_iterations
+        self.stats = LoadStats()
+        self._started_iterations = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def run(self) -> dict:
+        """
+        Выполняет прогон.
+
+        :return: Отчёт LoadStats.build_report.
+        """
+        started = time.perf_counter()
+        deadline = started + self.duration
+
+        if self.arrival_rate:
+            self._run_open_model(started, deadline)
+        else:
+            self._run_closed_model(started, deadline)
+
+        return self.stats.build_report(time.perf_counter() - started)
+
+    def _run_closed_model(self, started: float, deadline: float):
+        def virtual_user(index: int):
+            start_at = started + (self.ramp_up * index / self.users if self.users else 0)
+            time.sleep(max(0.0, start_at - time.perf_counter()))
+            scenario = self.scenario_factory()
+            while time.perf_counter() < deadline and self._reserve_iteration():
+                self._run_iteration(scenario)
+
+        threads = [
+            threading.Thread(target=virtual_user, args=(index,), name=f"vu-{index}", daemon=True)
+            for index in range(self.users)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _run_open_model(self, started: float, deadline: float):
+        in_flight = threading.Semaphore(self.users)
+
+        def iteration():
+            try:
+                self._run_iteration(self._get_thread_scenario())
+            finally:
+                in_flight.release()
+
+        with ThreadPoolExecutor(max_workers=self.users, thread_name_prefix="vu") as executor:
+            arrival_index = 0
+            next_arrival = started
+            while next_arrival < deadline and self._reserve_iteration():
+                time.sleep(max(0.0, next_arrival - time.perf_counter()))
+                if in_flight.acquire(blocking=False):
+                    executor.submit(iteration)
+                else:
+                    self.stats.add_dropped()
+
+                arrival_index += 1
+                next_arrival = started + self._get_arrival_offset(arrival_index)
+
+    def _get_arrival_offset(self, index: int) -> float:
+        """
+        Вычисляет момент запуска index-й итерации в открытой модели.
+
+        Во время разгона частота растёт линейно (r(t) = rate * t / ramp_up), поэтому число запущенных
+        итераций растёт квадратично, после разгона — линейно.
+
+        :param index: Порядковый номер итерации (с нуля).
+        :return: Смещение от начала прогона в секундах.
+        """
+        ramp_up_arrivals = self.arrival_rate * self.ramp_up / 2
+        if index <= ramp_up_arrivals:
+            return (2 * index * self.ramp_up / self.arrival_rate) ** 0.5
+        return self.ramp_up + (index - ramp_up_arrivals) / self.arrival_rate
+
+    def _get_thread_scenario(self) -> LoadScenario:
+        scenario = getattr(self._local, "scenario", None)
+        if scenario is None:
+            scenario = self._local.scenario = self.scenario_factory()
+        return scenario
+
+    def _reserve_iteration(self) -> bool:
+        with self._lock:
+            if self.max_iterations is not None and self._started_iterations >= self.max_iterations:
+                return False
+            self._started_iterations += 1
+            return True
+
+    def _run_iteration(self, scenario: LoadScenario):
+        context = {}
+        iteration_ok = True
+        for name, step_func in scenario.steps():
+            step_started = time.perf_counter()
+            try:
+                response = step_func(context)
+                ok = response.status_code < 400
+            except Exception:
+                ok = False
+            self.stats.add_step(name, time.perf_counter() - step_started, ok)
+            if not ok:
+                iteration_ok = False
+                break
+        self.stats.add_iteration(iteration_ok)
@@ -0,0 +1,49 @@
+import random
+import string
+
+from tests.api.api_load.load_runner import LoadScenario
+from tests.api.api_methods.auth_methods_api import AuthApi
+from tests.api.api_methods.invite_methods_api import InviteApi
+from tests.api.data.auth_data import AuthData
+
+
+class OnboardingScenario(LoadScenario):
+    """
+    Сценарий онбординга из test_full_auth_cross_case: email → код → домен → воркспейс → профиль.
+    """
+
+    def __init__(self):
+        self.auth_api = AuthApi()
+        self.invite_api = InviteApi()
+        self.auth_data = AuthData()
+
+    def steps(self) -> list:
+        return [
+            ("post_email", self.post_email),
+            ("put_code", self.put_code),
+            ("get_domain_check", self.get_domain_check),
+            ("post_create_workspace", self.post_create_workspace),
+            ("put_fill_profile", self.put_fill_profile),
+        ]
+
+    def post_email(self, context: dict):
+        context["domain"] = "autotest_" + ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
+        return self.auth_api.post_email(email=self.auth_data.email)
+
+    def put_code(self, context: dict):
+        response = self.auth_api.put_code(data=self.auth_data.data)
+        if response.ok:
+            context["hash_code"] = response.json().get("response").get("hash_code")
+        return response
+
+    def get_domain_check(self, context: dict):
+        return self.auth_api.get_domain_check(hash_code=context["hash_code"], domain=context["domain"])
+
+    def post_create_workspace(self, context: dict):
+        response = self.auth_api.post_create_workspace(hash_code=context["hash_code"], domain=context["domain"])
+        if response.ok:
+            context["invite_token"] = response.json().get("token")
+        return response
+
+    def put_fill_profile(self, context: dict):
+        return self.invite_api.put_fill_profile(invite_token=context["invite_token"])
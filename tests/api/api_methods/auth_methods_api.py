@@ -1,5 +1,7 @@
+import httpx
 import requests
 
+from tests.utils.http_client.async_http_client import AsyncHttpClient
 from tests.utils.http_client.http_client import HttpClient
 
 
@@ -44,7 +46,8 @@ class AuthApi:
         GET /login/{hash_code}/domain?domain=... — проверка доступности домена.
         """
         return self.http_client.get(
-            path=f"/{hash_code}/domain",
+            path="/{hash_code}/domain",
+            path_params={"hash_code": hash_code},
             params={"domain": domain}
         )
 
@@ -53,10 +56,66 @@ class AuthApi:
         POST /login/{hash_code}/new — создание нового воркспейса.
         """
         return self.http_client.post(
-            path=f"/{hash_code}/new",
+            path="/{hash_code}/new",
+            path_params={"hash_code": hash_code},
             json_data={
                 "domain": domain,
                 "description": "",
                 "lang": lang
             }
-        )
\ No newline at end of file
+        )
+
+
+class AsyncAuthApi:
+    """
+    Асинхронный клиент для взаимодействия с Auth API.
+    """
+
+    def __init__(self, max_in_flight: int = None):
+        self.http_client = AsyncHttpClient(controller_path="login", max_in_flight=max_in_flight)
+
+    async def close(self):
+        """Закрывает соединения клиента."""
+        await self.http_client.close()
+
+    async def post_email(self, email: str) -> httpx.Response:
+        """
+        POST /login/code — начало авторизации по email.
+        """
+        return await self.http_client.post(
+            path="/code",
+            json_data={"email": email}
+        )
+
+    async def put_code(self, data: dict) -> httpx.Response:
+        """
+        PUT /login/code — подтверждение кода авторизации.
+        """
+        return await self.http_client.put(
+            path="/code",
+            json_data=data
+        )
+
+    async def get_domain_check(self, hash_code: str, domain: str) -> httpx.Response:
+        """
+        GET /login/{hash_code}/domain?domain=... — проверка доступности домена.
+        """
+        return await self.http_client.get(
+            path="/{hash_code}/domain",
+            path_params={"hash_code": hash_code},
+            params={"domain": domain}
+        )
+
+    async def post_create_workspace(self, hash_code: str, domain: str, lang: str = "LANG_4") -> httpx.Response:
+        """
+        POST /login/{hash_code}/new — создание нового воркспейса.
+        """
+        return await self.http_client.post(
+            path="/{hash_code}/new",
+            path_params={"hash_code": hash_code},
+            json_data={
+                "domain": domain,
+                "description": "",
+                "lang": lang
+            }
+        )
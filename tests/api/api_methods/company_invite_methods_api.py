@@ -1,5 +1,7 @@
+import httpx
 import requests
 
+from tests.utils.http_client.async_http_client import AsyncHttpClient
 from tests.utils.http_client.http_client import HttpClient
 
 
@@ -17,7 +19,8 @@ class CompanyInviteApi:
         GET /invite/{invite_token} — получение информации по приглашению.
         """
         return self.http_client.get(
-            path=f"/{invite_token}"
+            path="/{invite_token}",
+            path_params={"invite_token": invite_token}
         )
 
     def post_invite_link(self, token: str, count: int = 12) -> requests.Response:
@@ -33,4 +36,41 @@ class CompanyInviteApi:
             path="/invite/link",
             json_data={"count": count},
             headers=headers
-        )
\ No newline at end of file
+        )
+
+
+class AsyncCompanyInviteApi:
+    """
+    Асинхронный клиент для взаимодействия с CompanyInvite API.
+    """
+
+    def __init__(self, max_in_flight: int = None):
+        self.http_client = AsyncHttpClient(controller_path="company", max_in_flight=max_in_flight)
+
+    async def close(self):
+        """Закрывает соединения клиента."""
+        await self.http_client.close()
+
+    async def get_invite_info(self, invite_token: str) -> httpx.Response:
+        """
+        GET /invite/{invite_token} — получение информации по приглашению.
+        """
+        return await self.http_client.get(
+            path="/{invite_token}",
+            path_params={"invite_token": invite_token}
+        )
+
+    async def post_invite_link(self, token: str, count: int = 12) -> httpx.Response:
+        """
+        POST /company/invite/link — генерация ссылки-приглашения.
+        """
+        headers = {
+            "token": token,
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
+        return await self.http_client.post(
+            path="/invite/link",
+            json_data={"count": count},
+            headers=headers
+        )
@@ -1,5 +1,7 @@
+import httpx
 import requests
 
+from tests.utils.http_client.async_http_client import AsyncHttpClient
 from tests.utils.http_client.http_client import HttpClient
 
 
@@ -17,7 +19,8 @@ class InviteApi:
         GET /invite/{invite_token} — получение информации по приглашению.
         """
         return self.http_client.get(
-            path=f"/{invite_token}"
+            path="/{invite_token}",
+            path_params={"invite_token": invite_token}
         )
 
     def put_fill_profile(
@@ -35,7 +38,8 @@ class InviteApi:
         PUT /invite/{invite_token}?name=...&surname=... — заполнение профиля пользователя.
         """
         return self.http_client.put(
-            path=f"/{invite_token}",
+            path="/{invite_token}",
+            path_params={"invite_token": invite_token},
             params={
                 "name": name,
                 "surname": surname,
@@ -46,4 +50,55 @@ class InviteApi:
                 "lang": lang
             },
             json_data={}
-        )
\ No newline at end of file
+        )
+
+
+class AsyncInviteApi:
+    """
+    Асинхронный клиент для взаимодействия с Invite API.
+    """
+
+    def __init__(self, max_in_flight: int = None):
+        self.http_client = AsyncHttpClient(controller_path="invite", max_in_flight=max_in_flight)
+
+    async def close(self):
+        """Закрывает соединения клиента."""
+        await self.http_client.close()
+
+    async def get_invite_info(self, invite_token: str) -> httpx.Response:
+        """
+        GET /invite/{invite_token} — получение информации по приглашению.
+        """
+        return await self.http_client.get(
+            path="/{invite_token}",
+            path_params={"invite_token": invite_token}
+        )
+
+    async def put_fill_profile(
+        self,
+        invite_token: str,
+        name: str = "Test",
+        surname: str = "User",
+        birthday: str = "01-01-1999",
+        who_see_birthday: str = "ALL",
+        city_id: str = "",
+        lang: str = "LANG_4",
+        avatar_hash: str = "null"
+    ) -> httpx.Response:
+        """
+        PUT /invite/{invite_token}?name=...&surname=... — заполнение профиля пользователя.
+        """
+        return await self.http_client.put(
+            path="/{invite_token}",
+            path_params={"invite_token": invite_token},
+            params={
+                "name": name,
+                "surname": surname,
+                "avatar_hash": avatar_hash,
+                "birthday": birthday,
+                "who_see_birthday": who_see_birthday,
+                "city_id": city_id,
+                "lang": lang
+            },
+            json_data={}
+        )
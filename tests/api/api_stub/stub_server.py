@@ -0,0 +1,241 @@
+import json
+import os
+import re
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+VALID_CODE = "666555"
+DOMAIN_PATTERN = re.compile(r"^[a-z0-9_-]{3,63}$")
+
+
+class StubState:
+    """
+    Состояние локального стенда: цепочка email -> hash_code -> воркспейс -> invite token.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pending_emails = set()
+        self.hash_codes = {}
+        self.workspaces = {}
+        self.invites = {}
+
+    def request_code(self, email: str):
+        with self.lock:
+            self.pending_emails.add(email)
+
+    def confirm_code(self, email: str, code: str):
+        with self.lock:
+            if email not in self.pending_emails or code != VALID_CODE:
+                return None
+            hash_code = secrets.token_hex(16)
+            self.hash_codes[hash_code] = email
+            return hash_code
+
+    def is_domain_free(self, domain: str) -> bool:
+        with self.lock:
+            return domain not in self.workspaces
+
+    def create_workspace(self, hash_code: str, domain: str, lang: str):
+        with self.lock:
+            if domain in self.workspaces:
+                return None
+            token = secrets.token_hex(16)
+            self.workspaces[domain] = {"domain": domain, "owner": self.hash_codes[hash_code], "lang": lang}
+            self.invites[token] = {"domain": domain, "email": self.hash_codes[hash_code], "profile": None}
+            return token
+
+    def create_invite_link(self, token: str, count: int):
+        with self.lock:
+            invite = self.invites.get(token)
+            if invite is None:
+                return None
+            new_token = secrets.token_hex(16)
+            self.invites[new_token] = {"domain": invite["domain"], "email": None, "profile": None, "count": count}
+            return new_token
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик эндпоинтов login / invite / company, которые вызывают AuthApi, InviteApi и CompanyInviteApi.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "LenzaStub/1.0"
+    # Заголовки и тело уходят отдельными write(): без TCP_NODELAY keep-alive упирается в delayed ACK (~40 мс)
+    disable_nagle_algorithm = True
+
+    routes = [
+        ("POST", re.compile(r"^/login/code$"), "_post_login_code"),
+        ("PUT", re.compile(r"^/login/code$"), "_put_login_code"),
+        ("GET", re.compile(r"^/login/(?P<hash_code>[^/]+)/domain$"), "_get_domain_check"),
+        ("POST", re.compile(r"^/login/(?P<hash_code>[^/]+)/new$"), "_post_create_workspace"),
+        ("POST", re.compile(r"^/company/invite/link$"), "_post_invite_link"),
+        ("GET", re.compile(r"^/(?:invite|company)/(?P<token>[^/]+)$"), "_get_invite_info"),
+        ("PUT", re.compile(r"^/invite/(?P<token>[^/]+)$"), "_put_fill_profile"),
+    ]
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def log_message(self, format, *args):
+        # Логи каждого запроса только мешают при нагрузочных прогонах
+        pass
+
+    @property
+    def state(self) -> StubState:
+        return self.server.state
+
+    def _dispatch(self, method: str):
+        parts = urlsplit(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(parts.query, keep_blank_values=True).items()}
+        self.body = self._read_json_body()
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        for route_method, pattern, handler_name in self.routes:
+            match = pattern.match(parts.path)
+            if match and route_method == method:
+                status, payload = getattr(self, handler_name)(**match.groupdict())
+                self._send_json(status, payload)
+                return
+
+        self._send_json(404, {"error": f"Unknown endpoint {method} {parts.path}"})
+
+    def _read_json_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        raw = self.rfile.read(length)
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return {}
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _post_login_code(self):
+        email = self.body.get("email", "")
+        if "@" not in email:
+            return 400, {"error": "Invalid email address"}
+        self.state.request_code(email)
+        return 200, {"response": {"email": email}}
+
+    def _put_login_code(self):
+        hash_code = self.state.confirm_code(self.body.get("email", ""), self.body.get("code", ""))
+        if hash_code is None:
+            return 400, {"error": "The code is entered incorrectly"}
+        return 200, {"response": {"hash_code": hash_code}}
+
+    def _get_domain_check(self, hash_code: str):
+        if hash_code not in self.state.hash_codes:
+            return 404, {"error": "Unknown hash_code"}
+        domain = self.query.get("domain", "")
+        if not DOMAIN_PATTERN.match(domain):
+            return 400, {"error": "Invalid domain"}
+        if not self.state.is_domain_free(domain):
+            return 409, {"error": "Domain is already taken"}
+        return 200, {"response": {"domain": domain, "free": True}}
+
+    def _post_create_workspace(self, hash_code: str):
+        if hash_code not in self.state.hash_codes:
+            return 404, {"error": "Unknown hash_code"}
+        domain = self.body.get("domain", "")
+        if not DOMAIN_PATTERN.match(domain):
+            return 400, {"error": "Invalid domain"}
+        token = self.state.create_workspace(hash_code, domain, self.body.get("lang", "LANG_4"))
+        if token is None:
+            return 409, {"error": "Domain is already taken"}
+        return 200, {"token": token, "domain": domain}
+
+    def _get_invite_info(self, token: str):
+        invite = self.state.invites.get(token)
+        if invite is None:
+            return 404, {"error": "Invite not found"}
+        return 200, {"response": {"domain": invite["domain"], "email": invite["email"]}}
+
+    def _put_fill_profile(self, token: str):
+        if token not in self.state.invites:
+            return 404, {"error": "Invite not found"}
+        if not self.query.get("name") or not self.query.get("surname"):
+            return 400, {"error": "Name and surname are required"}
+        with self.state.lock:
+            self.state.invites[token]["profile"] = dict(self.query)
+        return 200, {"response": {"token": token}}
+
+    def _post_invite_link(self):
+        new_token = self.state.create_invite_link(self.headers.get("token", ""), int(self.body.get("count", 12)))
+        if new_token is None:
+            return 401, {"error": "Invalid token"}
+        return 200, {"response": {"link": f"{self.server.base_url}invite/{new_token}"}}
+
+
+class StubServer:
+    """
+    Локальный многопоточный HTTP-стенд, заменяющий боевой API для контроллеров login / invite / company.
+
+    Запускается лениво в текущем процессе (у каждого воркера xdist свой стенд на свободном порту).
+    Включается переменной API_STUB=True — тогда utils.get_controller_url указывает на стенд.
+    STUB_LATENCY_MS добавляет искусственную задержку к каждому ответу.
+    """
+
+    _server = None
+    _thread = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def ensure_started(cls) -> str:
+        """
+        Запускает стенд, если он ещё не запущен.
+
+        :return: Базовый URL стенда (например, 'http://127.0.0.1:54321/').
+        """
+        with cls._lock:
+            if cls._server is None:
+                server = ThreadingHTTPServer(("127.0.0.1", 0), StubRequestHandler)
+                server.daemon_threads = True
+                server.state = StubState()
+                server.latency = int(os.getenv("STUB_LATENCY_MS", "0")) / 1000
+                server.base_url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+                cls._thread = threading.Thread(target=server.serve_forever, name="lenza-stub", daemon=True)
+                cls._thread.start()
+                cls._server = server
+        return cls._server.base_url
+
+    @classmethod
+    def stop(cls):
+        """
+        Останавливает стенд и сбрасывает его состояние.
+
+        :return: None
+        """
+        with cls._lock:
+            if cls._server is not None:
+                cls._server.shutdown()
+                cls._server.server_close()
+                cls._thread.join()
+                cls._server = None
+                cls._thread = None
@@ -0,0 +1,62 @@
+import logging
+import os
+
+import pytest
+
+from tests.api.api_load.load_runner import LoadRunner
+from tests.api.api_load.scenarios import OnboardingScenario
+from tests.utils.custom_assertions import assert_greater, assert_less_equal
+from tests.utils.plugins.xdist_reports import write_report
+from tests.utils.step_logger import StepLogger
+from tests.utils.test_logger import TestMetadata
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.api
+@pytest.mark.load
+class TestOnboardingLoadApi:
+    """
+    Нагрузочный прогон сценария онбординга теми же клиентами AuthApi / InviteApi, что и smoke-тесты.
+
+    Параметры берутся из .env: LOAD_USERS, LOAD_DURATION_S, LOAD_RAMP_UP_S, LOAD_ARRIVAL_RATE,
+    LOAD_MAX_ERROR_RATE.
+    """
+
+    @TestMetadata(
+        name="Нагрузка: сценарий онбординга email → код → домен → воркспейс → профиль",
+        id="6f0c8b8e-2a41-4a9e-9d0e-7c35f1b2d6a4"
+    )
+    def test_onboarding_load(self, request):
+        # Arrange
+        arrival_rate = float(os.getenv("LOAD_ARRIVAL_RATE", "0")) or None
+        max_error_rate = float(os.getenv("LOAD_MAX_ERROR_RATE", "0.01"))
+        runner = LoadRunner(
+            scenario_factory=OnboardingScenario,
+            users=int(os.getenv("LOAD_USERS", "10")),
+            duration=float(os.getenv("LOAD_DURATION_S", "30")),
+            ramp_up=float(os.getenv("LOAD_RAMP_UP_S", "5")),
+            arrival_rate=arrival_rate
+        )
+
+        # Act
+        with StepLogger("Запускаем виртуальных пользователей"):
+            report = runner.run()
+
+        with StepLogger("Сохраняем отчёт нагрузочного прогона"):
+            report_path = write_report(request.config, "load_onboarding.json", report)
+            for name, stats in report["steps"].items():
+                logger.info(
+                    f"{name:<24} rps={stats['rps']:.1f} errors={stats['error_rate']:.2%} "
+                    f"p50={stats['p50_ms']:.0f}ms p95={stats['p95_ms']:.0f}ms p99={stats['p99_ms']:.0f}ms"
+                )
+            logger.info(f"Итераций: {report['iterations']}, отчёт: {report_path}")
+
+        # Assert
+        with StepLogger("Проверяем, что сценарий выполнялся и доля ошибок в пределах нормы"):
+            assert_greater(report["iterations"], 0, "Не выполнено ни одной итерации сценария.")
+            assert_less_equal(
+                report["error_rate"],
+                max_error_rate,
+                f"Доля ошибок {report['error_rate']:.2%} превышает {max_error_rate:.2%}."
+            )
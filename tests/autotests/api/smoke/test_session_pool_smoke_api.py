@@ -0,0 +1,84 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from tests.utils.custom_assertions import assert_equal, assert_true
+from tests.utils.http_client.http_client import HttpClient
+from tests.utils.http_client.session_pool import SessionPool
+from tests.utils.step_logger import StepLogger
+from tests.utils.test_logger import TestMetadata
+from tests.utils.utils import check_response_status
+
+
+class _CookieHandler(BaseHTTPRequestHandler):
+    """
+    /set выставляет cookie сессии, /echo возвращает заголовок Cookie полученного запроса.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"{}"
+        if self.path == "/echo":
+            body = (self.headers.get("Cookie") or "").encode("utf-8")
+        self.send_response(200)
+        if self.path == "/set":
+            self.send_header("Set-Cookie", "session_id=secret; Path=/")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def cookie_server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CookieHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.mark.api
+@pytest.mark.smoke
+class TestSessionPoolApi:
+    """
+    Тесты общего пула HTTP-сессий.
+    """
+
+    @TestMetadata(
+        name="Пул сессий: cookie одного клиента не уходят в запросы другого",
+        id="3f6c1d2e-8a47-4b5e-9c1f-27d0e6a4b813"
+    )
+    def test_cookies_are_not_shared_between_clients(self, cookie_server_url):
+        # Arrange
+        first_client = HttpClient("cookies")
+        second_client = HttpClient("cookies")
+        first_client.base_url = second_client.base_url = cookie_server_url
+
+        # Act
+        with StepLogger("Получаем cookie первым клиентом"):
+            response_set = first_client.get("/set")
+
+        with StepLogger("Отправляем запрос вторым клиентом"):
+            response_echo = second_client.get("/echo")
+
+        # Assert
+        with StepLogger("Проверяем, что клиенты используют одну сессию пула"):
+            assert_true(
+                SessionPool.get_session(first_client.base_url) is SessionPool.get_session(second_client.base_url),
+                "Клиенты одного origin должны использовать общую сессию"
+            )
+
+        with StepLogger("Проверяем, что cookie доступна в ответе первого клиента"):
+            check_response_status(response_set, 200)
+            assert_equal(response_set.cookies.get("session_id"), "secret")
+
+        with StepLogger("Проверяем, что второй клиент не отправил cookie"):
+            check_response_status(response_echo, 200)
+            assert_equal(response_echo.text, "", "Cookie первого клиента ушла в запрос второго")
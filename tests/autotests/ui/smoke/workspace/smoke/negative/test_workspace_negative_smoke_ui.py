@@ -7,7 +7,6 @@ from tests.ui.ui_pages.workspace_page import WorkspacePage
 from tests.utils.step_logger import StepLogger
 from tests.utils.test_logger import TestMetadata
 from tests.utils.custom_assertions import assert_true
-from tests.utils.ui_settings.browser_settings import wait_seconds
 
 
 @pytest.mark.ui
@@ -15,22 +14,21 @@ from tests.utils.ui_settings.browser_settings import wait_seconds
 @pytest.mark.workspace
 class TestWorkspaceProfileNegativeSmokeUi:
     @pytest.fixture(autouse=True)
-    def setup(self, browser):
+    def setup(self, browser, auth_helper_api):
         self.auth_page = AuthPage(browser=browser)
         self.auth_helper_ui = AuthHelperUi(browser=browser)
         self.workspace_page = WorkspacePage(browser=browser)
 
         with StepLogger("Подготавливаем тестовые данные"):
             self.auth_data = AuthData()
-
-        with StepLogger("Открываем страницу авторизации"):
-            self.auth_page.open_page()
+            self.auth_helper_api = auth_helper_api
 
     @TestMetadata(name="Негативный кейс: пустое имя воркспейса", id="2a6c2a29-b152-4d34-878c-b43960c23352")
     def test_create_workspace_empty_name(self):
         # Act
         with StepLogger("Выполняем авторизацию до экрана выбора воркспейса"):
-            self.auth_helper_ui.login_with_code(
+            self.auth_helper_ui.login_via_api(
+                auth_helper_api=self.auth_helper_api,
                 email=self.auth_data.data["email"],
                 code=self.auth_data.data["code"]
             )
@@ -42,12 +40,10 @@ class TestWorkspaceProfileNegativeSmokeUi:
             self.workspace_page.enter_workspace_name("")
             self.workspace_page.blur_workspace_input()
 
-            wait_seconds(2)
-
         # Assert
-        with StepLogger("Проверяем, что кнопка Continue неактивна"):
+        with StepLogger("Проверяем, что кнопка Continue не активируется после валидации"):
             assert_true(
-                not self.workspace_page.is_continue_button_enabled(),
+                not self.workspace_page.is_continue_button_enabled(timeout=2, expect_disabled=True),
                 "Кнопка 'Continue' активна при пустом поле."
             )
 
@@ -10,7 +10,6 @@ from tests.ui.ui_pages.workspace_page import WorkspacePage
 from tests.utils.step_logger import StepLogger
 from tests.utils.test_logger import TestMetadata
 from tests.utils.custom_assertions import assert_true
-from tests.utils.ui_settings.browser_settings import wait_seconds
 
 
 @pytest.mark.ui
@@ -18,7 +17,7 @@ from tests.utils.ui_settings.browser_settings import wait_seconds
 @pytest.mark.workspace
 class TestWorkspaceProfileSmokeUi:
     @pytest.fixture(autouse=True)
-    def setup(self, browser):
+    def setup(self, browser, auth_helper_api):
         self.auth_page = AuthPage(browser=browser)
         self.workspace_page = WorkspacePage(browser=browser)
         self.chat_page = ChatPage(browser=browser)
@@ -30,14 +29,12 @@ class TestWorkspaceProfileSmokeUi:
             self.auth_data = AuthData()
             self.workspace_data = WorkspaceData()
 
-        with StepLogger("Открываем страницу авторизации"):
-            self.auth_page.open_page()
-
-            with StepLogger("Выполняем авторизацию"):
-                self.auth_helper_ui.login_with_code(
-                    email=self.auth_data.data.get('email'),
-                    code=self.auth_data.data.get('code')
-                )
+        with StepLogger("Выполняем авторизацию"):
+            self.auth_helper_ui.login_via_api(
+                auth_helper_api=auth_helper_api,
+                email=self.auth_data.data.get('email'),
+                code=self.auth_data.data.get('code')
+            )
 
     @TestMetadata(name="Воркспейс: создания нового воркспейса", id="cd807945-2d3a-47f2-be18-0995cf96e9ec")
     def test_create_workspace_positive_flow(self):
@@ -46,7 +43,6 @@ class TestWorkspaceProfileSmokeUi:
             self.workspace_page.click_create_new_space()
             self.workspace_page.enter_workspace_name(self.workspace_data.data["workspace_name"])
             self.workspace_page.blur_workspace_input()
-            wait_seconds(2)
 
         with StepLogger("Проверяем, что кнопка Continue активна"):
             assert_true(
@@ -72,12 +68,10 @@ class TestWorkspaceProfileSmokeUi:
             )
 
     @TestMetadata(name="Профиль: заполнение профиля - имя, фамилия, аватар", id="137351d0-00a1-4f49-b0c6-581d99f1a723")
-    def test_fill_profile_with_avatar_and_valid_names(self):
+    def test_fill_profile_with_avatar_and_valid_names(self, pooled_workspace):
         # Arrange
-        with StepLogger("Создаем воркспейс"):
-            self.workspace_helper_ui.create_workspace(
-                name=self.workspace_data.data.get('workspace_name')
-            )
+        with StepLogger("Берём готовый воркспейс из пула"):
+            self.workspace_helper_ui.open_pooled_workspace(pooled_workspace)
 
         # Act
         with StepLogger("Заполняем профиль"):
@@ -95,12 +89,10 @@ class TestWorkspaceProfileSmokeUi:
             )
 
     @TestMetadata(name="Профиль: установка даты рождения", id="e6cf866e-c095-47c5-a092-e5e43003dc44")
-    def test_birthday_selection(self):
+    def test_birthday_selection(self, pooled_workspace):
         # Arrange
-        with StepLogger("Создаем воркспейс и заполняем профиль"):
-            self.workspace_helper_ui.create_workspace(
-                name=self.workspace_data.data.get('workspace_name')
-            )
+        with StepLogger("Берём готовый воркспейс из пула и заполняем профиль"):
+            self.workspace_helper_ui.open_pooled_workspace(pooled_workspace)
             self.workspace_helper_ui.fill_profile(
                 first_name=self.workspace_data.data.get('first_name'),
                 last_name=self.workspace_data.data.get('last_name'),
@@ -119,12 +111,10 @@ class TestWorkspaceProfileSmokeUi:
             )
 
     @TestMetadata(name="Финальный экран: валидация профиля", id="bde0982b-dff7-476f-ad30-2a574096ec4c")
-    def test_final_authorization_check(self):
+    def test_final_authorization_check(self, pooled_workspace):
         # Arrange
-        with StepLogger("Создаем воркспейс и заполняем профиль"):
-            self.workspace_helper_ui.create_workspace(
-                name=self.workspace_data.data.get('workspace_name')
-            )
+        with StepLogger("Берём готовый воркспейс из пула и заполняем профиль"):
+            self.workspace_helper_ui.open_pooled_workspace(pooled_workspace)
             self.workspace_helper_ui.fill_profile(
                 first_name=self.workspace_data.data.get('first_name'),
                 last_name=self.workspace_data.data.get('last_name'),
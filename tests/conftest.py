@@ -8,12 +8,58 @@ for key, value in env_vars.items():
 
 import pytest
 
+from tests.api.api_stub.stub_server import StubServer
+from tests.utils.http_client.session_pool import SessionPool
 from tests.utils.ui_settings.browser_settings import get_browser
+from tests.utils.ui_settings.reusable_browser import ReusableBrowser
+from tests.utils.ui_settings.selenoid.chromedriver_service import SharedChromeDriverService
+
+pytest_plugins = [
+    "tests.utils.plugins.adaptive_timeouts_plugin",
+    "tests.utils.plugins.auth_cache_plugin",
+    "tests.utils.plugins.browser_profile_plugin",
+    "tests.utils.plugins.http_timing_plugin",
+    "tests.utils.plugins.lpt_scheduler_plugin",
+    "tests.utils.plugins.sleep_audit_plugin",
+    "tests.utils.plugins.step_trace_plugin",
+    "tests.utils.plugins.swagger_coverage_plugin",
+    "tests.utils.plugins.wait_profile_plugin",
+    "tests.utils.plugins.webdriver_commands_plugin",
+    "tests.utils.plugins.workspace_pool_plugin",
+]
+
+@pytest.fixture(scope="session")
+def reusable_browser():
+    manager = ReusableBrowser(factory=get_browser)
+    yield manager
+    manager.quit()
+
 
 @pytest.fixture
-def browser():
+def browser(request):
+    # WEBDRIVER_REUSE=True — один браузер на воркер со сбросом состояния между тестами
+    if os.getenv("WEBDRIVER_REUSE", "false").lower() == "true":
+        manager = request.getfixturevalue("reusable_browser")
+        yield manager.acquire()
+        manager.release()
+        return
+
     browser = get_browser()
     yield browser
     browser.quit()
 
 
+def pytest_collection_modifyitems(session, config, items):
+    # Нагрузочные тесты бьют по живому бэкенду: запускаются только явно (-m "load" или LOAD_TEST=True)
+    if os.getenv("LOAD_TEST", "False").lower() == "true" or "load" in (config.option.markexpr or ""):
+        return
+    skip_load = pytest.mark.skip(reason='Нагрузочный тест: запустите с -m "load" или LOAD_TEST=True')
+    for item in items:
+        if item.get_closest_marker("load"):
+            item.add_marker(skip_load)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    SessionPool.close_all()
+    StubServer.stop()
+    SharedChromeDriverService.stop()
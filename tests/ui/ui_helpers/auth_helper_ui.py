@@ -1,5 +1,9 @@
+import os
+
+from tests.api.api_helpers.auth_helper_api import AuthHelperApi
 from tests.ui.ui_pages.auth_page import AuthPage
 from tests.ui.ui_pages.workspace_page import WorkspacePage
+from tests.utils.custom_assertions import assert_true
 from tests.utils.step_logger import StepLogger
 
 class AuthHelperUi:
@@ -38,6 +42,48 @@ class AuthHelperUi:
             self.auth_page.enter_confirmation_code(code)
             self.auth_page.click_code_continue()
 
+    def login_via_api(self, auth_helper_api: AuthHelperApi, email: str, code: str):
+        """
+        Авторизует браузер без прохождения UI-флоу: логин выполняется по API (с кэшем),
+        а полученные cookies и значения localStorage переносятся в браузер.
+
+        Соответствие ключей localStorage полям ответа PUT /login/code задаётся в UI_AUTH_LOCAL_STORAGE
+        (формат 'ключ=поле,ключ2=поле2'). Перенос включается UI_SEED_AUTH=True; при UI_SEED_AUTH=False
+        выполняется обычная авторизация через UI.
+
+        :param auth_helper_api: Хелпер авторизации по API.
+        :param email: Email для входа.
+        :param code: Код подтверждения.
+        :raises AssertionError: Если после переноса сессии не открылся экран выбора воркспейса
+                                (значит, UI_AUTH_LOCAL_STORAGE или cookies не соответствуют фронтенду).
+        """
+        if os.getenv("UI_SEED_AUTH", "false").lower() == "true":
+            with StepLogger("Авторизуемся по API и переносим сессию в браузер"):
+                auth = auth_helper_api.login(email=email, code=code)
+                self.auth_page.seed_session(
+                    cookies=auth["cookies"],
+                    local_storage=self._build_local_storage(auth["response"])
+                )
+
+            assert_true(
+                self.auth_page.is_workspace_selection_visible(),
+                "Сессия из API не применилась в браузере: проверьте UI_AUTH_LOCAL_STORAGE или отключите UI_SEED_AUTH."
+            )
+            return
+
+        self.auth_page.open_page()
+        self.login_with_code(email=email, code=code)
+
+    @staticmethod
+    def _build_local_storage(response: dict) -> dict:
+        mapping = os.getenv("UI_AUTH_LOCAL_STORAGE", "")
+        local_storage = {}
+        for pair in mapping.split(","):
+            storage_key, _, field = pair.partition("=")
+            if storage_key.strip() and response.get(field.strip()) is not None:
+                local_storage[storage_key.strip()] = str(response[field.strip()])
+        return local_storage
+
     def login_and_complete_profile(self, data: dict):
         """
         Выполняет авторизация, создание нового пространства и заполнение профиля.
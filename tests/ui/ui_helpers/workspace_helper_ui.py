@@ -1,4 +1,5 @@
 from tests.ui.ui_pages.workspace_page import WorkspacePage
+from tests.utils.custom_assertions import assert_true
 from tests.utils.step_logger import StepLogger
 
 
@@ -24,6 +25,21 @@ class WorkspaceHelperUi:
             self.workspace_page.blur_workspace_input()
             self.workspace_page.click_continue()
 
+    def open_pooled_workspace(self, workspace: dict):
+        """
+        Открывает экран профиля воркспейса, созданного заранее через API (фикстура pooled_workspace).
+
+        :param workspace: Воркспейс из пула: {domain, invite_token, hash_code, email}.
+        :raises AssertionError: Если по ссылке не открылся экран заполнения профиля.
+        """
+        with StepLogger(f"Открываем воркспейс '{workspace['domain']}' из пула по invite-ссылке"):
+            self.workspace_page.open_invite(workspace["invite_token"])
+
+        assert_true(
+            self.workspace_page.is_profile_title_visible(),
+            "По invite-ссылке воркспейса из пула не открылся экран профиля (проверьте UI_INVITE_URL)."
+        )
+
     def fill_profile(self, first_name: str, last_name: str, avatar_path: str):
         """
         Заполняет профиль пользователя.
@@ -127,13 +127,28 @@ class AuthPage(BasePage):
         """
         self.actions.click(locator=self.locator_code_continue_button)
 
-    def is_workspace_selection_visible(self) -> bool:
+    def is_workspace_selection_visible(self, timeout: int = 10) -> bool:
         """
         Проверяет, что отображается экран выбора рабочего пространства.
 
+        :param timeout: Максимальное время ожидания в секундах.
         :return: True, если экран с заголовком "Selecting a workspace" видим, иначе False.
         """
-        return self.actions.is_visible(locator=self.locator_workspace_title)
+        return self.actions.is_visible(locator=self.locator_workspace_title, timeout=timeout)
+
+    def seed_session(self, cookies: list, local_storage: dict):
+        """
+        Переносит авторизацию, полученную по API, в браузер и открывает страницу заново.
+
+        :param cookies: Список cookies {name, value, domain, path}.
+        :param local_storage: Значения для localStorage.
+        """
+        self.open_page()
+        if cookies:
+            self.framework.add_cookies(cookies)
+        if local_storage:
+            self.framework.set_local_storage(local_storage)
+        self.framework.refresh()
 
 
     def is_invalid_email_error_visible(self) -> bool:
@@ -154,6 +169,22 @@ class AuthPage(BasePage):
         """
         return self.actions.is_visible(locator=self.locator_continue_disabled_button)
 
+    def get_email_step_state(self) -> dict:
+        """
+        Читает состояние экрана ввода email одним запросом к браузеру.
+
+        :return: Словарь {"email_input", "email_error", "continue_button"} с полями
+                 present, visible, enabled, text и attributes (значение поля — attributes["value"]).
+        """
+        return self.actions.get_elements_state(
+            locators={
+                "email_input": self.locator_email_input,
+                "email_error": self.locator_email_error,
+                "continue_button": self.locator_continue_button,
+            },
+            attributes=("value",)
+        )
+
 
     def blur_email_input(self):
         """
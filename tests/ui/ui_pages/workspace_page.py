@@ -1,7 +1,8 @@
 import os
 
+from selenium.common.exceptions import TimeoutException
+
 from tests.utils.ui_settings.base_page import BasePage
-from tests.utils.ui_settings.browser_settings import wait_seconds
 
 
 class WorkspacePage(BasePage):
@@ -17,6 +18,7 @@ class WorkspacePage(BasePage):
         self.locator_continue_button = "//button//span[text()='Continue']/.."
         self.locator_back_button = "//p[text()='Back']"
         self.locator_title = "//h2[text()='Specify a workspace name']"
+        self.locator_screen_title = f"{self.input_point}//h2"
 
         self.locator_profile_title = "//h2[text()='Set up your personal profile']"
         self.locator_birthday_title = "//h2[contains(text(),'your birthday')]"
@@ -24,6 +26,8 @@ class WorkspacePage(BasePage):
         self.locator_day_select = "//select[@name='day']"
         self.locator_month_select = "//select[@name='month']"
         self.locator_year_select = "//select[@name='year']"
+        self.locator_dropdown_input = "//p[.//span[text()='{label}']]/ancestor::label//input"
+        self.locator_dropdown_option = "//span[contains(@class, 'list-item__title') and normalize-space(text())='{value}']"
 
 
     def open_page(self):
@@ -38,6 +42,15 @@ class WorkspacePage(BasePage):
         """
         self.framework.wait_until_loaded()
 
+    def open_invite(self, invite_token: str) -> None:
+        """
+        Открывает онбординг уже созданного воркспейса по invite token (шаблон ссылки — UI_INVITE_URL).
+
+        :param invite_token: Токен из ответа POST создания воркспейса.
+        """
+        url_template = os.getenv("UI_INVITE_URL", "https://auth.....com/invite/{invite_token}")
+        self.framework.open_page(url_template.format(invite_token=invite_token))
+
     def click_create_new_space(self) -> None:
         """Кликает по кнопке создания нового пространства."""
         self.actions.wait_until_clickable(self.locator_create_new_space)
@@ -51,13 +64,18 @@ class WorkspacePage(BasePage):
         """
         self.actions.fill_input(locator=self.locator_workspace_name_input, value=name)
 
-    def is_continue_button_enabled(self) -> bool:
+    def is_continue_button_enabled(self, timeout: int = 10, expect_disabled: bool = False) -> bool:
         """
-        Проверяет, активна ли кнопка 'Continue'.
+        Проверяет, активна ли кнопка 'Continue', дожидаясь завершения валидации формы.
 
+        :param timeout: Сколько ждать активации кнопки в секундах.
+        :param expect_disabled: Отрицательная проверка: кнопка должна остаться неактивной
+                                (при UI_ADAPTIVE_TIMEOUTS=on ожидание сокращается по истории).
         :return: True, если кнопка активна.
         """
-        return self.actions.is_enabled(locator=self.locator_continue_button)
+        return self.actions.wait_until_enabled(
+            locator=self.locator_continue_button, timeout=timeout, expect_absent=expect_disabled
+        )
 
     def is_name_input_visible(self) -> bool:
         """
@@ -67,11 +85,18 @@ class WorkspacePage(BasePage):
         """
         return self.actions.is_visible(locator=self.locator_workspace_name_input)
 
-    def click_continue(self) -> None:
-        """Кликает по кнопке 'Continue'."""
+    def click_continue(self, timeout: int = 10) -> None:
+        """
+        Кликает по кнопке 'Continue' и ждёт перехода на следующий экран (смены заголовка).
+
+        :param timeout: Сколько ждать смены экрана в секундах.
+        :raises TimeoutException: Если после клика экран не сменился.
+        """
         self.actions.wait_until_clickable(self.locator_continue_button)
+        previous_title = self.actions.get_text(self.locator_screen_title)
         self.actions.click(self.locator_continue_button)
-        wait_seconds(2)
+        if not self.actions.wait_for_text_change(self.locator_screen_title, previous_title, timeout=timeout):
+            raise TimeoutException(f"После нажатия 'Continue' экран '{previous_title}' не сменился за {timeout} с")
 
     def click_back(self) -> None:
         """Кликает по кнопке 'Back'."""
@@ -154,13 +179,13 @@ class WorkspacePage(BasePage):
         :param label_text: Текст label (например: Day, Month, Year).
         :param value: Значение, которое нужно выбрать.
         """
-        input_locator = f"//p[.//span[text()='{label_text}']]/ancestor::label//input"
+        input_locator = self.locator_dropdown_input.format(label=label_text)
         self.actions.scroll_to_element(locator=input_locator)
         self.actions.click(locator=input_locator)
-        wait_seconds(1)
 
-        option_locator = f"//span[contains(@class, 'list-item__title') and normalize-space(text())='{value}']"
+        option_locator = self.locator_dropdown_option.format(value=value)
 
+        self.actions.wait_until_visible(locator=option_locator)
         self.actions.scroll_to_element(locator=option_locator)
         self.actions.click(locator=option_locator)
 
@@ -0,0 +1,222 @@
+import asyncio
+import json
+import os
+import time
+
+import httpx
+
+from tests.utils import utils
+from tests.utils.http_client.cassette import Cassette
+from tests.utils.http_client.swagger_coverage import SwaggerCoverageRecorder
+from tests.utils.http_client.timing import TimingRecorder
+
+
+class AsyncHttpClient:
+    """
+    Асинхронный REST API клиент с тем же интерфейсом, что и HttpClient.
+
+    Позволяет одному воркеру выполнять сотни запросов одновременно. Количество запросов
+    «в полёте» ограничено семафором (HTTP_ASYNC_MAX_IN_FLIGHT, по умолчанию 100).
+
+    Пример:
+        async with AsyncHttpClient("login") as client:
+            responses = await asyncio.gather(*(client.get(f"/{h}/domain") for h in hashes))
+    """
+
+    def __init__(self, controller_path: str, max_in_flight: int = None):
+        """
+        Инициализирует клиент для указанного сервиса.
+
+        :param controller_path: Контроллер, на который будут отправляться запросы.
+        :param max_in_flight: Максимальное число одновременных запросов (по умолчанию из .env).
+        """
+        self.controller_path = controller_path
+        self.base_url = utils.get_controller_url(name=controller_path)
+        self.headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
+        self.max_in_flight = max_in_flight or int(os.getenv("HTTP_ASYNC_MAX_IN_FLIGHT", "100"))
+        self._client = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+        return False
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Лениво создаёт httpx.AsyncClient внутри работающего event loop.
+
+        :return: Объект httpx.AsyncClient с пулом соединений под max_in_flight.
+        """
+        if self._client is None:
+            limits = httpx.Limits(
+                max_connections=self.max_in_flight,
+                max_keepalive_connections=self.max_in_flight
+            )
+            self._client = httpx.AsyncClient(limits=limits, timeout=20)
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        return self._client
+
+    async def close(self):
+        """
+        Закрывает соединения клиента.
+
+        :return: None
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._semaphore = None
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint_path: str,
+        path_params: dict = None,
+        params: dict = None,
+        headers: dict = None,
+        json_data: json = None,
+        data: dict = None,
+        files: dict = None
+    ) -> httpx.Response:
+        """
+        Внутренний метод для выполнения асинхронного HTTP-запроса.
+
+        :param method: HTTP-метод (GET, POST и т.д.).
+        :param endpoint_path: Шаблон пути эндпоинта относительно base_url (например, '/{hash_code}/domain').
+        :param path_params: Значения для подстановки в шаблон пути.
+        :return: Объект ответа httpx.Response.
+        """
+
+        if headers is None:
+            headers = self.headers
+
+        url_path = endpoint_path.format(**path_params) if path_params else endpoint_path
+        url = f"{self.base_url}{url_path}"
+
+        cassette = Cassette.from_env()
+        if cassette:
+            cassette_key = cassette.build_key(method, url, params, json_data, data)
+            if cassette.should_replay():
+                entry = cassette.load(cassette_key, method, url)
+                if entry is not None:
+                    return self._build_replayed_response(method, entry)
+
+        client = self._get_client()
+        async with self._semaphore:
+            marks = {}
+
+            async def trace(event_name, info):
+                marks[event_name] = time.perf_counter()
+
+            started = time.perf_counter()
+            response = await client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+                json=json_data,
+                data=data,
+                files=files,
+                extensions={"trace": trace}
+            )
+            finished = time.perf_counter()
+
+        TimingRecorder.record(
+            controller=self.controller_path,
+            method=method,
+            endpoint=endpoint_path,
+            status=response.status_code,
+            connect=self._get_connect_time(marks),
+            ttfb=self._get_ttfb(marks, started, finished),
+            total=finished - started,
+            size=len(response.content),
+            server_timing=response.headers.get("Server-Timing")
+        )
+        SwaggerCoverageRecorder.record(
+            method=method,
+            path_template=f"/{self.controller_path}{endpoint_path}",
+            status=response.status_code,
+            params=params,
+            body=json_data if json_data is not None else data
+        )
+
+        if cassette:
+            cassette.save(
+                key=cassette_key,
+                method=method,
+                url=url,
+                status=response.status_code,
+                reason=response.reason_phrase,
+                headers=response.headers,
+                body=response.content
+            )
+
+        return response
+
+    @staticmethod
+    def _build_replayed_response(method: str, entry: dict) -> httpx.Response:
+        """
+        Восстанавливает httpx.Response из записи кассеты.
+
+        :param method: HTTP-метод запроса.
+        :param entry: Запись, полученная из Cassette.load.
+        :return: Объект ответа httpx.Response.
+        """
+        return httpx.Response(
+            status_code=entry["status"],
+            headers=entry["headers"],
+            content=entry["body"],
+            request=httpx.Request(method, entry["url"])
+        )
+
+    @staticmethod
+    def _get_connect_time(marks: dict) -> float:
+        """
+        Вычисляет время установки соединения (TCP + TLS) по событиям трассировки httpcore.
+
+        :return: Длительность в секундах (0.0, если соединение было переиспользовано).
+        """
+        seconds = 0.0
+        for stage in ("connection.connect_tcp", "connection.start_tls"):
+            if f"{stage}.complete" in marks and f"{stage}.started" in marks:
+                seconds += marks[f"{stage}.complete"] - marks[f"{stage}.started"]
+        return seconds
+
+    @staticmethod
+    def _get_ttfb(marks: dict, started: float, finished: float) -> float:
+        """
+        Вычисляет время до получения заголовков ответа по событиям трассировки httpcore.
+
+        :return: Длительность в секундах (полное время, если событие не пришло).
+        """
+        for protocol in ("http11", "http2"):
+            headers_received = marks.get(f"{protocol}.receive_response_headers.complete")
+            if headers_received is not None:
+                return headers_received - started
+        return finished - started
+
+    async def get(self, path: str, **kwargs) -> httpx.Response:
+        """Выполняет GET-запрос по указанному пути."""
+        return await self._send_request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> httpx.Response:
+        """Выполняет POST-запрос по указанному пути."""
+        return await self._send_request("POST", path, **kwargs)
+
+    async def put(self, path: str, **kwargs) -> httpx.Response:
+        """Выполняет PUT-запрос по указанному пути."""
+        return await self._send_request("PUT", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs) -> httpx.Response:
+        """Выполняет DELETE-запрос по указанному пути."""
+        return await self._send_request("DELETE", path, **kwargs)
+
+    async def patch(self, path: str, **kwargs) -> httpx.Response:
+        """Выполняет PATCH-запрос по указанному пути."""
+        return await self._send_request("PATCH", path, **kwargs)
@@ -0,0 +1,160 @@
+import base64
+import hashlib
+import json
+import os
+from pathlib import Path
+from urllib.parse import urlsplit
+
+
+class CassetteMissError(Exception):
+    """
+    Запрос не найден в кассете при включённом строгом режиме.
+    """
+
+
+class Cassette:
+    """
+    Запись и воспроизведение пар запрос/ответ для HTTP-клиентов.
+
+    Запрос сопоставляется по методу, пути, query-параметрам и хэшу тела. Каждая запись хранится
+    в отдельном файле, имя которого — хэш ключа (`<dir>/<ab>/<abcdef...>.json`), поэтому
+    сама структура директорий служит индексом: поиск — одно обращение к файлу, без сканирования,
+    а запись из нескольких воркеров xdist не конфликтует.
+
+    Режимы (HTTP_CASSETTE_MODE):
+        off — кассета не используется (по умолчанию);
+        record — все запросы уходят в сеть, ответы сохраняются;
+        replay — ответы берутся из кассеты; при промахе запрос уходит в сеть и дописывается
+                 в кассету, а при HTTP_CASSETTE_STRICT=True выбрасывается CassetteMissError.
+
+    HTTP_CASSETTE_IGNORE — поля параметров/тела через запятую, которые не участвуют в сопоставлении
+    (например, случайно сгенерированный domain).
+    """
+
+    # Тело сохраняется уже раскодированным, поэтому заголовки транспортного кодирования не нужны
+    DROPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length"}
+
+    _instance = None
+
+    def __init__(self, mode: str, directory: str, strict: bool = False, ignore_fields: list = None):
+        """
+        :param mode: Режим работы: 'record' или 'replay'.
+        :param directory: Директория с записями.
+        :param strict: Выбрасывать ошибку при промахе в режиме replay.
+        :param ignore_fields: Поля, исключаемые из ключа сопоставления.
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Неизвестный режим кассеты: {mode}")
+
+        self.mode = mode
+        self.directory = Path(directory)
+        self.strict = strict
+        self.ignore_fields = set(ignore_fields or [])
+
+    @classmethod
+    def from_env(cls):
+        """
+        Возвращает кассету процесса согласно настройкам из .env.
+
+        :return: Объект Cassette или None, если режим выключен.
+        """
+        mode = os.getenv("HTTP_CASSETTE_MODE", "off").lower()
+        if mode == "off":
+            return None
+
+        if cls._instance is None or cls._instance.mode != mode:
+            ignore = os.getenv("HTTP_CASSETTE_IGNORE", "")
+            cls._instance = cls(
+                mode=mode,
+                directory=os.getenv("HTTP_CASSETTE_DIR", "./cassettes"),
+                strict=os.getenv("HTTP_CASSETTE_STRICT", "false").lower() == "true",
+                ignore_fields=[field.strip() for field in ignore.split(",") if field.strip()]
+            )
+        return cls._instance
+
+    def build_key(self, method: str, url: str, params: dict = None, json_data=None, data=None) -> str:
+        """
+        Формирует ключ сопоставления запроса.
+
+        :param method: HTTP-метод.
+        :param url: Полный URL запроса (без query-строки).
+        :param params: Query-параметры.
+        :param json_data: JSON-тело запроса.
+        :param data: Form-тело запроса.
+        :return: Хэш (sha256) ключа сопоставления.
+        """
+        body = json_data if json_data is not None else data
+        parts = {
+            "method": method.upper(),
+            "path": urlsplit(url).path,
+            "params": self._without_ignored(params),
+            "body": hashlib.sha256(self._canonical(self._without_ignored(body)).encode()).hexdigest()
+        }
+        return hashlib.sha256(self._canonical(parts).encode()).hexdigest()
+
+    def should_replay(self) -> bool:
+        """
+        :return: True, если ответы нужно искать в кассете перед запросом в сеть.
+        """
+        return self.mode == "replay"
+
+    def load(self, key: str, method: str, url: str):
+        """
+        Ищет запись по ключу.
+
+        :param key: Ключ из build_key.
+        :param method: HTTP-метод (для сообщения об ошибке).
+        :param url: URL запроса (для сообщения об ошибке).
+        :return: Словарь записи или None при промахе в нестрогом режиме.
+        :raises CassetteMissError: При промахе в строгом режиме.
+        """
+        path = self._get_path(key)
+        if path.exists():
+            with open(path, encoding="utf-8") as file:
+                entry = json.load(file)
+            entry["body"] = base64.b64decode(entry["body"])
+            return entry
+
+        if self.strict:
+            raise CassetteMissError(f"Запрос {method} {url} отсутствует в кассете {self.directory} (ключ {key})")
+        return None
+
+    def save(self, key: str, method: str, url: str, status: int, reason: str, headers: dict, body: bytes):
+        """
+        Сохраняет ответ в кассету (атомарно, через временный файл).
+
+        :param key: Ключ из build_key.
+        :param method: HTTP-метод.
+        :param url: Полный URL запроса.
+        :param status: HTTP-статус ответа.
+        :param reason: Текст статуса.
+        :param headers: Заголовки ответа.
+        :param body: Тело ответа.
+        :return: None
+        """
+        path = self._get_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "method": method,
+            "url": url,
+            "status": status,
+            "reason": reason,
+            "headers": {k: v for k, v in dict(headers).items() if k.lower() not in self.DROPPED_HEADERS},
+            "body": base64.b64encode(body).decode("ascii")
+        }
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(entry, file, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def _get_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _without_ignored(self, value):
+        if isinstance(value, dict) and self.ignore_fields:
+            return {k: v for k, v in value.items() if k not in self.ignore_fields}
+        return value
+
+    @staticmethod
+    def _canonical(value) -> str:
+        return json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
@@ -1,7 +1,15 @@
 import json
+import time
+from datetime import timedelta
+
 import requests
+from requests.structures import CaseInsensitiveDict
 
 from tests.utils import utils
+from tests.utils.http_client.cassette import Cassette
+from tests.utils.http_client.swagger_coverage import SwaggerCoverageRecorder
+from tests.utils.http_client.session_pool import SessionPool
+from tests.utils.http_client.timing import TimingRecorder, pop_connect_time, reset_connect_time
 
 
 class HttpClient:
@@ -27,6 +35,7 @@ class HttpClient:
         self,
         method: str,
         endpoint_path: str,
+        path_params: dict = None,
         params: dict = None,
         headers: dict = None,
         json_data: json = None,
@@ -37,27 +46,89 @@ class HttpClient:
         Внутренний метод для выполнения HTTP-запроса и записи покрытия Swagger (если включено).
 
         :param method: HTTP-метод (GET, POST и т.д.).
-        :param endpoint_path: Путь эндпоинта относительно base_url.
+        :param endpoint_path: Шаблон пути эндпоинта относительно base_url (например, '/{hash_code}/domain').
+        :param path_params: Значения для подстановки в шаблон пути.
         :return: Объект ответа requests.Response.
         """
 
         if headers is None:
             headers = self.headers
 
-        with requests.sessions.Session() as session:
-            response = session.request(
+        url_path = endpoint_path.format(**path_params) if path_params else endpoint_path
+        url = f"{self.base_url}{url_path}"
+
+        cassette = Cassette.from_env()
+        if cassette:
+            cassette_key = cassette.build_key(method, url, params, json_data, data)
+            if cassette.should_replay():
+                entry = cassette.load(cassette_key, method, url)
+                if entry is not None:
+                    return self._build_replayed_response(entry)
+
+        session = SessionPool.get_session(self.base_url)
+        reset_connect_time()
+        started = time.perf_counter()
+        response = session.request(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            json=json_data,
+            data=data,
+            files=files,
+            timeout=20
+        )
+
+        TimingRecorder.record(
+            controller=self.controller_path,
+            method=method,
+            endpoint=endpoint_path,
+            status=response.status_code,
+            connect=pop_connect_time(),
+            ttfb=response.elapsed.total_seconds(),
+            total=time.perf_counter() - started,
+            size=len(response.content),
+            server_timing=response.headers.get("Server-Timing")
+        )
+        SwaggerCoverageRecorder.record(
+            method=method,
+            path_template=f"/{self.controller_path}{endpoint_path}",
+            status=response.status_code,
+            params=params,
+            body=json_data if json_data is not None else data
+        )
+
+        if cassette:
+            cassette.save(
+                key=cassette_key,
                 method=method,
-                url=f"{self.base_url}{endpoint_path}",
-                headers=headers,
-                params=params,
-                json=json_data,
-                data=data,
-                files=files,
-                timeout=20
+                url=url,
+                status=response.status_code,
+                reason=response.reason,
+                headers=response.headers,
+                body=response.content
             )
 
         return response
 
+    @staticmethod
+    def _build_replayed_response(entry: dict) -> requests.Response:
+        """
+        Восстанавливает requests.Response из записи кассеты.
+
+        :param entry: Запись, полученная из Cassette.load.
+        :return: Объект ответа requests.Response.
+        """
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry["reason"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["body"]
+        response.url = entry["url"]
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.elapsed = timedelta(0)
+        return response
+
     def get(self, path: str, **kwargs) -> requests.Response:
         """Выполняет GET-запрос по указанному пути."""
         return self._send_request("GET", path, **kwargs)
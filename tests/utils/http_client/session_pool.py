@@ -0,0 +1,144 @@
+import os
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from tests.utils.http_client.timing import add_connect_time
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        add_connect_time(time.perf_counter() - started)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        add_connect_time(time.perf_counter() - started)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter, замеряющий время установки новых соединений (TCP + TLS).
+
+    Переиспользованные из пула соединения не замеряются, поэтому connect = 0 означает keep-alive.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool
+        }
+
+
+class _RejectAllCookiePolicy(DefaultCookiePolicy):
+    def set_ok(self, cookie, request):
+        return False
+
+
+class SessionPool:
+    """
+    Пул HTTP-сессий, общий для всех клиентов внутри одного процесса.
+
+    Сессии кэшируются по origin (схема + хост), поэтому AuthApi, InviteApi и CompanyInviteApi
+    переиспользуют одни и те же TCP/TLS-соединения. Каждый воркер pytest-xdist — отдельный процесс,
+    поэтому пул привязан к PID и пересоздаётся после fork.
+
+    Сессия общая для всех тестов воркера, поэтому cookie в ней не сохраняются: иначе авторизация
+    одного теста уходила бы в запросы следующего. Cookie ответа доступны в response.cookies.
+
+    Настройки берутся из переменных окружения:
+        HTTP_POOL_SIZE — максимальное число соединений к одному хосту (по умолчанию 10);
+        HTTP_KEEP_ALIVE — держать соединения открытыми между запросами (по умолчанию True);
+        HTTP_WARMUP — открыть соединение заранее, при создании сессии (по умолчанию False).
+    """
+
+    _sessions: dict = {}
+    _lock = threading.Lock()
+    _pid = None
+
+    @classmethod
+    def get_session(cls, url: str) -> requests.Session:
+        """
+        Возвращает сессию для origin указанного URL, создавая её при первом обращении.
+
+        :param url: Любой URL сервиса (используются только схема и хост).
+        :return: Объект requests.Session с настроенным пулом соединений.
+        """
+        origin = cls._get_origin(url)
+        with cls._lock:
+            if cls._pid != os.getpid():
+                # После fork соединения родителя использовать нельзя
+                cls._sessions = {}
+                cls._pid = os.getpid()
+
+            session = cls._sessions.get(origin)
+            if session is None:
+                session = cls._create_session(origin)
+                cls._sessions[origin] = session
+        return session
+
+    @classmethod
+    def close_all(cls):
+        """
+        Закрывает все сессии пула и освобождает соединения.
+
+        :return: None
+        """
+        with cls._lock:
+            for session in cls._sessions.values():
+                session.close()
+            cls._sessions = {}
+
+    @staticmethod
+    def _get_origin(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    @classmethod
+    def _create_session(cls, origin: str) -> requests.Session:
+        pool_size = int(os.getenv("HTTP_POOL_SIZE", "10"))
+        keep_alive = os.getenv("HTTP_KEEP_ALIVE", "true").lower() == "true"
+        warmup = os.getenv("HTTP_WARMUP", "false").lower() == "true"
+
+        session = requests.Session()
+        session.cookies.set_policy(_RejectAllCookiePolicy())
+        adapter = TimedHTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=False)
+        session.mount(f"{origin}/", adapter)
+
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+
+        if warmup:
+            cls._warmup(session, origin)
+
+        return session
+
+    @staticmethod
+    def _warmup(session: requests.Session, origin: str):
+        """
+        Устанавливает соединение с хостом заранее, чтобы первый запрос теста не платил за handshake.
+        Ошибки прогрева игнорируются: реальный запрос всё равно сообщит о проблеме.
+        """
+        try:
+            session.head(origin, timeout=5)
+        except requests.RequestException:
+            pass
@@ -0,0 +1,67 @@
+import os
+from collections import Counter
+
+
+class SwaggerCoverageRecorder:
+    """
+    Накопитель вызовов API для отчёта Swagger Coverage.
+
+    На горячем пути выполняется только добавление кортежа в список (без блокировок и ввода-вывода);
+    группировка и запись на диск происходят один раз за процесс в конце сессии.
+    Включается переменной SWAGGER_COVERAGE=True.
+    """
+
+    _records: list = []
+    _enabled = None
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        if cls._enabled is None:
+            cls._enabled = os.getenv("SWAGGER_COVERAGE", "false").lower() == "true"
+        return cls._enabled
+
+    @classmethod
+    def record(cls, method: str, path_template: str, status: int, params: dict = None, body=None):
+        """
+        Сохраняет факт вызова операции.
+
+        :param method: HTTP-метод.
+        :param path_template: Полный шаблон пути (например, '/login/{hash_code}/domain').
+        :param status: HTTP-статус ответа.
+        :param params: Query-параметры запроса (сохраняются только имена).
+        :param body: Тело запроса (для словаря сохраняются только имена полей).
+        :return: None
+        """
+        if not cls.is_enabled():
+            return
+        cls._records.append((
+            method,
+            path_template,
+            status,
+            tuple(params) if params else (),
+            tuple(body) if isinstance(body, dict) else ()
+        ))
+
+    @classmethod
+    def drain(cls) -> list:
+        """
+        Группирует накопленные вызовы и очищает накопитель.
+
+        :return: Список словарей {method, path, status, params, body, count}.
+        """
+        records, cls._records = cls._records, []
+        counter = Counter(
+            (method, path, status, tuple(sorted(params)), tuple(sorted(body)))
+            for method, path, status, params, body in records
+        )
+        return [
+            {
+                "method": method,
+                "path": path,
+                "status": status,
+                "params": list(params),
+                "body": list(body),
+                "count": count
+            }
+            for (method, path, status, params, body), count in counter.items()
+        ]
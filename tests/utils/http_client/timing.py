@@ -0,0 +1,121 @@
+import threading
+
+_connect_state = threading.local()
+
+
+def reset_connect_time():
+    """
+    Сбрасывает накопленное время установки соединения для текущего потока.
+
+    :return: None
+    """
+    _connect_state.seconds = 0.0
+
+
+def add_connect_time(seconds: float):
+    """
+    Добавляет время установки соединения (TCP + TLS) для текущего потока.
+
+    :param seconds: Длительность в секундах.
+    :return: None
+    """
+    _connect_state.seconds = getattr(_connect_state, "seconds", 0.0) + seconds
+
+
+def pop_connect_time() -> float:
+    """
+    Возвращает и сбрасывает время установки соединения для текущего потока.
+
+    :return: Длительность в секундах (0.0, если соединение было переиспользовано).
+    """
+    seconds = getattr(_connect_state, "seconds", 0.0)
+    _connect_state.seconds = 0.0
+    return seconds
+
+
+def parse_server_timing(header: str) -> dict:
+    """
+    Разбирает заголовок Server-Timing в словарь {метрика: длительность в мс}.
+
+    Пример: 'db;dur=53, app;desc="App";dur=47.2' -> {'db': 53.0, 'app': 47.2}
+
+    :param header: Значение заголовка Server-Timing (может быть None).
+    :return: Словарь метрик; метрики без dur пропускаются.
+    """
+    metrics = {}
+    if not header:
+        return metrics
+
+    for entry in header.split(","):
+        name, *params = [part.strip() for part in entry.split(";")]
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "dur" and name:
+                try:
+                    metrics[name] = float(value.strip().strip('"'))
+                except ValueError:
+                    pass
+    return metrics
+
+
+class TimingRecorder:
+    """
+    Накопитель замеров HTTP-запросов внутри процесса.
+
+    Каждый замер хранится как словарь и ключуется методом, контроллером и шаблоном эндпоинта
+    (например, 'GET login /{hash_code}/domain'), чтобы запросы с разными параметрами пути
+    попадали в одну группу.
+    """
+
+    _records: list = []
+    _lock = threading.Lock()
+
+    @classmethod
+    def record(
+        cls,
+        controller: str,
+        method: str,
+        endpoint: str,
+        status: int,
+        connect: float,
+        ttfb: float,
+        total: float,
+        size: int,
+        server_timing: str = None
+    ):
+        """
+        Сохраняет замер одного запроса.
+
+        :param controller: Контроллер (например, 'login').
+        :param method: HTTP-метод.
+        :param endpoint: Шаблон эндпоинта (например, '/{hash_code}/domain').
+        :param status: HTTP-статус ответа.
+        :param connect: Время установки соединения в секундах.
+        :param ttfb: Время до первого байта ответа в секундах.
+        :param total: Полное время запроса в секундах.
+        :param size: Размер тела ответа в байтах.
+        :param server_timing: Значение заголовка Server-Timing (если есть).
+        :return: None
+        """
+        record = {
+            "key": f"{method} {controller} {endpoint}",
+            "status": status,
+            "connect": connect,
+            "ttfb": ttfb,
+            "total": total,
+            "size": size,
+            "server_timing": parse_server_timing(server_timing)
+        }
+        with cls._lock:
+            cls._records.append(record)
+
+    @classmethod
+    def drain(cls) -> list:
+        """
+        Возвращает накопленные замеры и очищает накопитель.
+
+        :return: Список замеров.
+        """
+        with cls._lock:
+            records, cls._records = cls._records, []
+        return records
@@ -0,0 +1,67 @@
+import json
+
+from tests.utils.plugins.xdist_reports import (
+    dump_part,
+    get_reports_dir,
+    is_xdist_worker,
+    load_parts,
+    reset_parts,
+)
+from tests.utils.ui_settings.adaptive_timeouts import AdaptiveTimeouts
+
+REPORT_NAME = "wait_history"
+HISTORY_FILE = "wait_history.json"
+
+
+def pytest_configure(config):
+    reset_parts(config, REPORT_NAME)
+    config._adaptive_timeouts_summary = None
+    if AdaptiveTimeouts.get_mode() != "off":
+        AdaptiveTimeouts.load_history(get_reports_dir(config) / HISTORY_FILE)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    if AdaptiveTimeouts.get_mode() == "off":
+        return
+
+    data = AdaptiveTimeouts.drain()
+    if data["samples"] or data["saved_s"]:
+        dump_part(config, REPORT_NAME, data)
+
+    if is_xdist_worker(config):
+        return
+
+    parts = load_parts(config, REPORT_NAME)
+    samples = [sample for part in parts for sample in part["samples"]]
+    if not samples:
+        return
+
+    history_path = get_reports_dir(config) / HISTORY_FILE
+    history = {}
+    if history_path.exists():
+        with open(history_path, encoding="utf-8") as file:
+            history = json.load(file)
+    history = AdaptiveTimeouts.merge_history(history, samples)
+    with open(history_path, "w", encoding="utf-8") as file:
+        json.dump(history, file, ensure_ascii=False, indent=2)
+
+    config._adaptive_timeouts_summary = {
+        "mode": AdaptiveTimeouts.get_mode(),
+        "samples": len(samples),
+        "locators": len(history),
+        "saved_s": sum(part["saved_s"] for part in parts)
+    }
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    summary = getattr(config, "_adaptive_timeouts_summary", None)
+    if not summary:
+        return
+
+    terminalreporter.write_sep("=", "Adaptive timeouts")
+    terminalreporter.write_line(
+        f"Режим {summary['mode']}: записано ожиданий {summary['samples']}, локаторов в истории {summary['locators']}, "
+        f"отрицательные проверки сэкономили {summary['saved_s']:.1f} с"
+    )
+    terminalreporter.write_line(f"История: {get_reports_dir(config) / HISTORY_FILE}")
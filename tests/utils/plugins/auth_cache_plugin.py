@@ -0,0 +1,40 @@
+import pytest
+
+from tests.api.api_helpers.auth_helper_api import AuthHelperApi
+from tests.utils.plugins.xdist_reports import get_reports_dir, is_xdist_worker
+from tests.utils.shared_store import SharedStore
+
+CACHE_FILE = ".cache/auth_cache.json"
+
+
+def get_auth_cache(config) -> SharedStore:
+    """
+    Возвращает хранилище результатов авторизации текущего прогона.
+
+    :param config: Объект pytest.Config.
+    :return: Объект SharedStore.
+    """
+    return SharedStore(get_reports_dir(config) / CACHE_FILE)
+
+
+def pytest_configure(config):
+    # Кэш живёт в пределах одного прогона: master очищает его до старта воркеров
+    if not is_xdist_worker(config):
+        get_auth_cache(config).clear()
+
+
+@pytest.fixture(scope="session")
+def auth_cache(request) -> SharedStore:
+    """
+    Хранилище результатов авторизации, общее для всех воркеров прогона.
+    """
+    return get_auth_cache(request.config)
+
+
+@pytest.fixture
+def auth_helper_api(request, auth_cache) -> AuthHelperApi:
+    """
+    Хелпер авторизации по API с кэшем. Тесты с маркером fresh_login авторизуются заново.
+    """
+    fresh = request.node.get_closest_marker("fresh_login") is not None
+    return AuthHelperApi(store=auth_cache, fresh=fresh)
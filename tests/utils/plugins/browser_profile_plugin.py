@@ -0,0 +1,115 @@
+import json
+import os
+import time
+
+import pytest
+
+from tests.utils.plugins.xdist_reports import (
+    dump_part,
+    get_reports_dir,
+    is_xdist_worker,
+    load_parts,
+    reset_parts,
+    write_report,
+)
+
+REPORT_NAME = "browser_profile"
+REPORT_FILE = "browser_profile.json"
+HISTORY_FILE = "browser_profile_history.json"
+
+_durations = {}
+_failed = set()
+
+
+def pytest_configure(config):
+    reset_parts(config, REPORT_NAME)
+    config._browser_profile_summary = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    if "browser" not in getattr(item, "fixturenames", ()):
+        yield
+        return
+
+    started = time.perf_counter()
+    yield
+    _durations[item.nodeid] = time.perf_counter() - started
+
+
+def pytest_runtest_logreport(report):
+    if report.failed:
+        _failed.add(report.nodeid)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    passed = {nodeid: duration for nodeid, duration in _durations.items() if nodeid not in _failed}
+    if passed:
+        dump_part(config, REPORT_NAME, passed)
+
+    if is_xdist_worker(config):
+        return
+
+    durations = {}
+    for part in load_parts(config, REPORT_NAME):
+        durations.update(part)
+    if not durations:
+        return
+
+    profile = os.getenv("WEBDRIVER_PROFILE", "full").lower()
+    history_path = get_reports_dir(config) / HISTORY_FILE
+    history = {}
+    if history_path.exists():
+        with open(history_path, encoding="utf-8") as file:
+            history = json.load(file)
+    history.setdefault(profile, {}).update(durations)
+    with open(history_path, "w", encoding="utf-8") as file:
+        json.dump(history, file, ensure_ascii=False, indent=2)
+
+    summary = build_profile_summary(history)
+    summary["current_profile"] = profile
+    write_report(config, REPORT_FILE, summary)
+    config._browser_profile_summary = summary
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    summary = getattr(config, "_browser_profile_summary", None)
+    if not summary:
+        return
+
+    terminalreporter.write_sep("=", "Browser profile")
+    if not summary["compared_tests"]:
+        terminalreporter.write_line(
+            f"Профиль '{summary['current_profile']}'. Для сравнения прогоните UI-тесты "
+            f"и с WEBDRIVER_PROFILE=fast, и с WEBDRIVER_PROFILE=full."
+        )
+        return
+    terminalreporter.write_line(
+        f"Профиль fast экономит {summary['avg_saving_s']:.2f} с на тест "
+        f"({summary['avg_saving_percent']:.0f}%, сравнено тестов: {summary['compared_tests']}, "
+        f"всего {summary['total_saving_s']:.1f} с)"
+    )
+
+
+def build_profile_summary(history: dict) -> dict:
+    """
+    Сравнивает последние известные длительности UI-тестов в профилях full и fast.
+
+    :param history: История {профиль: {nodeid: длительность в секундах}}.
+    :return: Средняя и суммарная экономия по тестам, которые есть в обоих профилях.
+    """
+    full = history.get("full", {})
+    fast = history.get("fast", {})
+    common = sorted(set(full) & set(fast))
+
+    per_test = {nodeid: full[nodeid] - fast[nodeid] for nodeid in common}
+    total_full = sum(full[nodeid] for nodeid in common)
+    total_saving = sum(per_test.values())
+    return {
+        "compared_tests": len(common),
+        "avg_saving_s": total_saving / len(common) if common else 0.0,
+        "avg_saving_percent": total_saving / total_full * 100 if total_full else 0.0,
+        "total_saving_s": total_saving,
+        "per_test_saving_s": dict(sorted(per_test.items(), key=lambda entry: entry[1], reverse=True))
+    }
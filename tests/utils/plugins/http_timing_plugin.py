@@ -0,0 +1,102 @@
+from tests.utils.http_client.timing import TimingRecorder
+from tests.utils.plugins.xdist_reports import (
+    dump_part,
+    get_reports_dir,
+    is_xdist_worker,
+    load_parts,
+    reset_parts,
+    write_report,
+)
+from tests.utils.utils import percentile
+
+REPORT_NAME = "http_timings"
+REPORT_FILE = "http_timings.json"
+
+
+def pytest_configure(config):
+    reset_parts(config, REPORT_NAME)
+    config._http_timing_summary = None
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    records = TimingRecorder.drain()
+    if records:
+        dump_part(config, REPORT_NAME, records)
+
+    if is_xdist_worker(config):
+        return
+
+    all_records = [record for part in load_parts(config, REPORT_NAME) for record in part]
+    if not all_records:
+        return
+
+    summary = build_timing_summary(all_records)
+    write_report(config, REPORT_FILE, summary)
+    config._http_timing_summary = summary
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    summary = getattr(config, "_http_timing_summary", None)
+    if not summary:
+        return
+
+    terminalreporter.write_sep("=", "HTTP timings (ms)")
+    terminalreporter.write_line(
+        f"{'endpoint':<45} {'count':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'ttfb p50':>9} {'connect':>8}"
+    )
+    for key, stats in summary.items():
+        terminalreporter.write_line(
+            f"{key:<45} {stats['count']:>6} "
+            f"{stats['total']['p50']:>8.1f} {stats['total']['p95']:>8.1f} {stats['total']['p99']:>8.1f} "
+            f"{stats['ttfb']['p50']:>9.1f} {stats['connect']['p50']:>8.1f}"
+        )
+    terminalreporter.write_line(f"Отчёт: {get_reports_dir(config) / REPORT_FILE}")
+
+
+def _percentiles_ms(values: list) -> dict:
+    return {
+        "p50": percentile(values, 50) * 1000,
+        "p95": percentile(values, 95) * 1000,
+        "p99": percentile(values, 99) * 1000,
+        "max": max(values) * 1000 if values else 0.0
+    }
+
+
+def build_timing_summary(records: list) -> dict:
+    """
+    Группирует замеры по эндпоинтам и считает перцентили.
+
+    :param records: Замеры из TimingRecorder всех процессов.
+    :return: Словарь {ключ эндпоинта: статистика}, отсортированный по p95 полного времени.
+    """
+    grouped = {}
+    for record in records:
+        grouped.setdefault(record["key"], []).append(record)
+
+    summary = {}
+    for key, items in grouped.items():
+        server_timing = {}
+        for item in items:
+            for name, duration in item["server_timing"].items():
+                server_timing.setdefault(name, []).append(duration / 1000)
+
+        summary[key] = {
+            "count": len(items),
+            "statuses": sorted({item["status"] for item in items}),
+            "total": _percentiles_ms([item["total"] for item in items]),
+            "ttfb": _percentiles_ms([item["ttfb"] for item in items]),
+            "connect": _percentiles_ms([item["connect"] for item in items]),
+            "new_connections": sum(1 for item in items if item["connect"] > 0),
+            "size_bytes": _size_stats([item["size"] for item in items]),
+            "server_timing": {name: _percentiles_ms(values) for name, values in server_timing.items()}
+        }
+
+    return dict(sorted(summary.items(), key=lambda entry: entry[1]["total"]["p95"], reverse=True))
+
+
+def _size_stats(sizes: list) -> dict:
+    return {
+        "avg": sum(sizes) / len(sizes),
+        "max": max(sizes)
+    }
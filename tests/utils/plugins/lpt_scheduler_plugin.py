@@ -0,0 +1,233 @@
+import json
+import os
+import time
+
+import pytest
+from xdist.scheduler import LoadScheduling
+
+from tests.utils.plugins.xdist_reports import get_reports_dir, is_xdist_worker
+from tests.utils.test_logger import get_test_metadata
+from tests.utils.utils import percentile
+
+HISTORY_FILE = "test_durations.json"
+USER_PROPERTY = "duration_key"
+SHARED_SETUP_PROPERTY = "shared_setup_s"
+# Вес последнего прогона в сглаженной длительности теста
+SMOOTHING = 0.5
+
+# {nodeid: {"key": ключ истории, "seconds": setup + call + teardown}}
+_durations = {}
+_skipped = set()
+_worker_ids = set()
+# Границы выполнения тестов (без запуска воркеров и коллекции)
+_window = {"start": None, "stop": None}
+# Время setup фикстур шире функции (session/module/class) у текущего теста воркера
+_shared_setup = {"seconds": 0.0, "depth": 0}
+
+
+def _is_enabled() -> bool:
+    return os.getenv("XDIST_LPT", "True").lower() == "true"
+
+
+def get_duration_key(item) -> str:
+    """
+    Ключ истории длительностей: ID из TestMetadata (у параметризованных тестов — с ID набора
+    параметров, так как ID общий для всех наборов), а для неразмеченных тестов — nodeid.
+
+    :param item: pytest.Item.
+    :return: Ключ теста.
+    """
+    test_id = get_test_metadata(item).get("id")
+    if not test_id:
+        return item.nodeid
+    callspec = getattr(item, "callspec", None)
+    return f"{test_id}[{callspec.id}]" if callspec is not None else test_id
+
+
+def load_history(config) -> dict:
+    """
+    :param config: Объект pytest.Config.
+    :return: История {ключ теста: сглаженная длительность в секундах}.
+    """
+    path = get_reports_dir(config) / HISTORY_FILE
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def get_default_estimate(history: dict) -> float:
+    """
+    Оценка для тестов без истории: медиана известных длительностей или XDIST_LPT_DEFAULT_S.
+
+    :param history: История длительностей.
+    :return: Оценка в секундах.
+    """
+    if history:
+        return percentile(list(history.values()), 50)
+    return float(os.getenv("XDIST_LPT_DEFAULT_S", "10"))
+
+
+class LPTScheduling(LoadScheduling):
+    """
+    Раздача тестов воркерам по одному в порядке коллекции (Longest Processing Time first).
+
+    Коллекция на каждом воркере уже отсортирована по убыванию ожидаемой длительности
+    (pytest_collection_modifyitems), поэтому освободившийся воркер всегда получает самый длинный
+    из оставшихся тестов. У воркера в очереди держится ровно два теста: выполняемый и следующий
+    (xdist запускает тест, только когда знает следующий), вместо пачек, которые раздаёт LoadScheduling.
+    """
+
+    QUEUE_DEPTH = 2
+
+    def check_schedule(self, node, duration: float = 0) -> None:
+        if node.shutting_down:
+            return
+        if not self.pending:
+            node.shutdown()
+            return
+        missing = self.QUEUE_DEPTH - len(self.node2pending[node])
+        if missing > 0:
+            self._send_tests(node, missing)
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        self.pending[:] = range(len(self.collection))
+        if not self.collection:
+            return
+
+        # Второй тест очереди раздаётся «змейкой»: воркер с самым длинным первым тестом получает самый короткий второй
+        for node in self.nodes:
+            self._send_tests(node, 1)
+        for node in reversed(self.nodes):
+            self._send_tests(node, 1)
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if _is_enabled() and config.getvalue("dist") == "load":
+        return LPTScheduling(config, log)
+    return None
+
+
+def pytest_configure(config):
+    config._lpt_summary = None
+
+
+def pytest_collection_modifyitems(session, config, items):
+    # Сортируем только на воркерах: все они читают одну историю, поэтому коллекции остаются одинаковыми
+    if not _is_enabled() or not is_xdist_worker(config):
+        return
+
+    history = load_history(config)
+    default = get_default_estimate(history)
+    items.sort(key=lambda item: history.get(get_duration_key(item), default), reverse=True)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    _shared_setup["seconds"] = 0.0
+    if not any(name == USER_PROPERTY for name, _ in item.user_properties):
+        item.user_properties.append((USER_PROPERTY, get_duration_key(item)))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    # Общие фикстуры (браузер воркера, пул воркспейсов и т.п.) создаются в setup того теста, который
+    # попал на воркер первым. Если записать это время в его длительность, тест снова уйдёт первым
+    # и будет расти из прогона в прогон, поэтому учитываем только внешний вызов и вычитаем его
+    if fixturedef.scope == "function" or _shared_setup["depth"]:
+        yield
+        return
+
+    _shared_setup["depth"] += 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _shared_setup["depth"] -= 1
+        _shared_setup["seconds"] += time.perf_counter() - started
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    if call.when == "setup" and _shared_setup["seconds"]:
+        # user_properties сериализуются xdist вместе с отчётом
+        item.user_properties.append((SHARED_SETUP_PROPERTY, _shared_setup["seconds"]))
+    yield
+
+
+def pytest_runtest_logreport(report):
+    properties = dict(report.user_properties)
+    key = properties.get(USER_PROPERTY)
+    if key is None:
+        return
+    if report.skipped:
+        # Пропущенный тест не попадает в историю ни одной фазой (его teardown проходит успешно)
+        _skipped.add(report.nodeid)
+        return
+    duration = report.duration
+    if report.when == "setup":
+        duration = max(0.0, duration - properties.get(SHARED_SETUP_PROPERTY, 0.0))
+    entry = _durations.setdefault(report.nodeid, {"key": key, "seconds": 0.0})
+    entry["seconds"] += duration
+    _window["start"] = min(report.start, _window["start"] or report.start)
+    _window["stop"] = max(report.stop, _window["stop"] or report.stop)
+    node = getattr(report, "node", None)
+    if node is not None:
+        _worker_ids.add(node.gateway.id)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    durations = {nodeid: entry for nodeid, entry in _durations.items() if nodeid not in _skipped}
+    if not _is_enabled() or is_xdist_worker(config) or not durations:
+        return
+
+    # Один ключ на несколько nodeid (одинаковый ID в TestMetadata у разных тестов) — берём самый долгий
+    measured = {}
+    for entry in durations.values():
+        measured[entry["key"]] = max(measured.get(entry["key"], 0.0), entry["seconds"])
+
+    history = load_history(config)
+    for key, duration in measured.items():
+        history[key] = history[key] * (1 - SMOOTHING) + duration * SMOOTHING if key in history else duration
+    with open(get_reports_dir(config) / HISTORY_FILE, "w", encoding="utf-8") as file:
+        json.dump(dict(sorted(history.items())), file, ensure_ascii=False, indent=2)
+
+    seconds = [entry["seconds"] for entry in durations.values()]
+    workers = max(1, len(_worker_ids))
+    config._lpt_summary = {
+        "tests": len(durations),
+        "workers": workers,
+        "ideal_s": sum(seconds) / workers,
+        "longest_s": max(seconds),
+        "wall_s": _window["stop"] - _window["start"]
+    }
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    summary = getattr(config, "_lpt_summary", None)
+    if not summary or summary["workers"] < 2:
+        return
+
+    terminalreporter.write_sep("=", "LPT scheduling")
+    terminalreporter.write_line(
+        f"Тестов: {summary['tests']}, воркеров: {summary['workers']}. "
+        f"Нижняя граница: {max(summary['ideal_s'], summary['longest_s']):.1f} с "
+        f"(сумма/воркеры {summary['ideal_s']:.1f} с, самый длинный тест {summary['longest_s']:.1f} с), "
+        f"фактически тесты выполнялись {summary['wall_s']:.1f} с"
+    )
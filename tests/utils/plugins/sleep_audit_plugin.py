@@ -0,0 +1,161 @@
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from tests.utils.plugins.xdist_reports import get_reports_dir, is_xdist_worker, write_report
+
+REPORT_FILE = "sleep_audit.json"
+USER_PROPERTY = "sleep_audit"
+
+# Каталоги фреймворка, где ожидание является частью механики (поллинг, пейсинг нагрузки, стаб),
+# а не «жёстким» sleep в тестах или page object-ах.
+EXCLUDED_DIRS = ("utils", os.path.join("api", "api_load"), os.path.join("api", "api_stub"))
+WRAPPER_FILES = (os.path.join("utils", "ui_settings", "browser_settings.py"),)
+
+_original_sleep = time.sleep
+_current_calls = None
+_root = None
+_audit = {}
+
+
+def _find_call_site():
+    """
+    Возвращает место вызова sleep в коде тестов или None, если вызов пришёл из фреймворка/библиотек.
+
+    Вызовы через обёртку browser_settings.wait_seconds атрибутируются коду, который её вызвал.
+    """
+    frame = sys._getframe(2)
+    while frame is not None:
+        path = Path(frame.f_code.co_filename)
+        try:
+            relative = str(path.relative_to(_root))
+        except ValueError:
+            return None
+        if not relative.endswith(WRAPPER_FILES):
+            if relative.startswith(EXCLUDED_DIRS):
+                return None
+            return f"{relative}:{frame.f_lineno}"
+        frame = frame.f_back
+    return None
+
+
+def _audited_sleep(seconds):
+    calls = _current_calls
+    if calls is not None and threading.current_thread() is threading.main_thread():
+        site = _find_call_site()
+        if site is not None:
+            calls.append({"site": site, "seconds": float(seconds)})
+    _original_sleep(seconds)
+
+
+def _get_budget():
+    value = os.getenv("SLEEP_BUDGET_S", "").strip()
+    return float(value) if value else None
+
+
+def pytest_configure(config):
+    global _root
+    _root = Path(config.rootpath)
+    config._sleep_audit_summary = None
+    if os.getenv("SLEEP_AUDIT", "True").lower() == "true":
+        time.sleep = _audited_sleep
+
+
+def pytest_unconfigure(config):
+    time.sleep = _original_sleep
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    global _current_calls
+    _current_calls = []
+    try:
+        yield
+    finally:
+        _current_calls = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    if call.when == "teardown" and _current_calls:
+        # user_properties сериализуются xdist вместе с отчётом, поэтому данные доходят до мастера без файлов
+        item.user_properties.append((USER_PROPERTY, list(_current_calls)))
+
+    outcome = yield
+    budget = _get_budget()
+    if call.when != "call" or budget is None or not _current_calls:
+        return
+
+    report = outcome.get_result()
+    slept = sum(entry["seconds"] for entry in _current_calls)
+    if report.passed and slept > budget:
+        report.outcome = "failed"
+        report.longrepr = (
+            f"Превышен бюджет sleep: {slept:.2f} с при SLEEP_BUDGET_S={budget:g}. "
+            f"Вызовы: {', '.join(entry['site'] for entry in _current_calls)}"
+        )
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown":
+        return
+    for name, calls in report.user_properties:
+        if name == USER_PROPERTY:
+            _audit[report.nodeid] = calls
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    if is_xdist_worker(config) or not _audit:
+        return
+
+    summary = build_sleep_summary(_audit)
+    write_report(config, REPORT_FILE, summary)
+    config._sleep_audit_summary = summary
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    summary = getattr(config, "_sleep_audit_summary", None)
+    if not summary:
+        return
+
+    terminalreporter.write_sep("=", "Sleep audit")
+    terminalreporter.write_line(
+        f"Всего в sleep: {summary['total_slept_s']:.2f} с, вызовов: {summary['total_calls']}, "
+        f"тестов со sleep: {len(summary['per_test'])}"
+    )
+    for nodeid, stats in list(summary["per_test"].items())[:10]:
+        terminalreporter.write_line(f"{stats['slept_s']:>7.2f} с  {stats['calls']:>3}  {nodeid}")
+    terminalreporter.write_line(f"Отчёт: {get_reports_dir(config) / REPORT_FILE}")
+
+
+def build_sleep_summary(audit: dict) -> dict:
+    """
+    Агрегирует вызовы sleep по тестам и по местам вызова.
+
+    :param audit: Словарь {nodeid: [{"site": файл:строка, "seconds": длительность}]}.
+    :return: Итоги, тесты и места вызова, отсортированные по суммарному времени sleep.
+    """
+    per_test = {}
+    per_site = {}
+    for nodeid, calls in audit.items():
+        per_test[nodeid] = {
+            "slept_s": sum(call["seconds"] for call in calls),
+            "calls": len(calls),
+            "sites": sorted({call["site"] for call in calls})
+        }
+        for call in calls:
+            site = per_site.setdefault(call["site"], {"slept_s": 0.0, "calls": 0})
+            site["slept_s"] += call["seconds"]
+            site["calls"] += 1
+
+    return {
+        "total_slept_s": sum(stats["slept_s"] for stats in per_test.values()),
+        "total_calls": sum(stats["calls"] for stats in per_test.values()),
+        "per_test": dict(sorted(per_test.items(), key=lambda entry: entry[1]["slept_s"], reverse=True)),
+        "per_site": dict(sorted(per_site.items(), key=lambda entry: entry[1]["slept_s"], reverse=True))
+    }
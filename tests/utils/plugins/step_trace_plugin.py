@@ -0,0 +1,183 @@
+import json
+import os
+import re
+import shutil
+
+import pytest
+
+from tests.utils.plugins.xdist_reports import get_reports_dir, get_worker_id, is_xdist_worker
+from tests.utils.step_logger import StepTracer
+from tests.utils.test_logger import get_test_metadata
+
+TRACES_DIR = "traces"
+RUN_TRACE_FILE = "run.json"
+
+_events = []
+_failed = set()
+
+
+def _is_enabled() -> bool:
+    return os.getenv("STEP_TRACE", "False").lower() == "true"
+
+
+def _get_pid(worker_id: str) -> int:
+    return int(worker_id[2:]) if worker_id.startswith("gw") else 0
+
+
+def _get_traces_dir(config):
+    path = get_reports_dir(config) / TRACES_DIR
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _write_trace(path, events: list) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file, ensure_ascii=False)
+
+
+def to_trace_events(spans: list, worker_id: str) -> list:
+    """
+    Преобразует спаны StepTracer в события Chrome Trace Event Format (полные события, ph='X').
+
+    :param spans: Закрытые спаны.
+    :param worker_id: Идентификатор воркера ('gw0', ... или 'master'); становится процессом в трейсе.
+    :return: Список событий, открываемый в chrome://tracing или Perfetto.
+    """
+    pid = _get_pid(worker_id)
+    events = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": worker_id}}]
+    for span in spans:
+        events.append({
+            "name": span["name"],
+            "cat": span["category"],
+            "ph": "X",
+            "ts": span["start_us"],
+            "dur": span["duration_us"],
+            "pid": pid,
+            "tid": span["thread_id"],
+            "args": {
+                "test_id": span["test_id"],
+                "nodeid": span["nodeid"],
+                "status": span["status"],
+                "span_id": span["id"],
+                "parent_id": span["parent_id"],
+                "depth": span["depth"]
+            }
+        })
+    return events
+
+
+def pytest_configure(config):
+    config._step_trace_summary = None
+    if _is_enabled() and not is_xdist_worker(config):
+        shutil.rmtree(get_reports_dir(config) / TRACES_DIR, ignore_errors=True)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    if not _is_enabled():
+        yield
+        return
+
+    metadata = get_test_metadata(item)
+    StepTracer.start_test(item.nodeid, metadata.get("id"), metadata.get("name"))
+    span = StepTracer.begin(metadata.get("name") or item.name, category="test")
+    yield
+    StepTracer.end(span, failed=item.nodeid in _failed)
+
+    worker_id = get_worker_id(item.config)
+    events = to_trace_events(StepTracer.finish_test(), worker_id)
+    test_dir = _get_traces_dir(item.config) / worker_id
+    test_dir.mkdir(exist_ok=True)
+    file_name = re.sub(r"[^\w.-]+", "_", item.nodeid)[-150:]
+    _write_trace(test_dir / f"{file_name}.json", events)
+    _events.extend(events[1:] if _events else events)
+
+
+def _trace_phase(phase: str):
+    if not _is_enabled():
+        yield
+        return
+
+    span = StepTracer.begin(phase, category="phase")
+    outcome = yield
+    StepTracer.end(span, failed=outcome.excinfo is not None)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    yield from _trace_phase("setup")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    yield from _trace_phase("call")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    yield from _trace_phase("teardown")
+
+
+def pytest_runtest_logreport(report):
+    if report.failed:
+        _failed.add(report.nodeid)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    if not _is_enabled():
+        return
+
+    traces_dir = _get_traces_dir(config)
+    if _events:
+        _write_trace(traces_dir / f"{get_worker_id(config)}.json", _events)
+
+    if is_xdist_worker(config):
+        return
+
+    run_events = []
+    for worker_trace in sorted(traces_dir.glob("*.json")):
+        if worker_trace.name == RUN_TRACE_FILE:
+            continue
+        with open(worker_trace, encoding="utf-8") as file:
+            run_events.extend(json.load(file)["traceEvents"])
+    if not run_events:
+        return
+
+    _write_trace(traces_dir / RUN_TRACE_FILE, run_events)
+    config._step_trace_summary = build_step_summary(run_events)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    summary = getattr(config, "_step_trace_summary", None)
+    if not summary:
+        return
+
+    terminalreporter.write_sep("=", "Step trace")
+    terminalreporter.write_line(f"{'step':<70} {'count':>6} {'total s':>8} {'avg s':>7}")
+    for name, stats in list(summary.items())[:10]:
+        terminalreporter.write_line(
+            f"{name[:70]:<70} {stats['count']:>6} {stats['total_s']:>8.2f} {stats['avg_s']:>7.2f}"
+        )
+    terminalreporter.write_line(
+        f"Трейс прогона (chrome://tracing, ui.perfetto.dev): {get_reports_dir(config) / TRACES_DIR / RUN_TRACE_FILE}"
+    )
+
+
+def build_step_summary(events: list) -> dict:
+    """
+    Суммирует длительность шагов StepLogger по названию.
+
+    :param events: События трейса всех воркеров.
+    :return: Словарь {шаг: count, total_s, avg_s}, отсортированный по суммарному времени.
+    """
+    summary = {}
+    for event in events:
+        if event.get("cat") != "step":
+            continue
+        stats = summary.setdefault(event["name"], {"count": 0, "total_s": 0.0})
+        stats["count"] += 1
+        stats["total_s"] += event["dur"] / 1_000_000
+    for stats in summary.values():
+        stats["avg_s"] = stats["total_s"] / stats["count"]
+    return dict(sorted(summary.items(), key=lambda entry: entry[1]["total_s"], reverse=True))
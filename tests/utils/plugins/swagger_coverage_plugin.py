@@ -0,0 +1,202 @@
+import json
+import os
+import re
+from urllib.parse import urlsplit
+
+from tests.utils.http_client.swagger_coverage import SwaggerCoverageRecorder
+from tests.utils.plugins.xdist_reports import (
+    dump_part,
+    get_reports_dir,
+    is_xdist_worker,
+    load_parts,
+    reset_parts,
+    write_report,
+)
+
+REPORT_NAME = "swagger_coverage"
+REPORT_FILE = "swagger_coverage.json"
+HTTP_METHODS = {"get", "post", "put", "delete", "patch", "head", "options"}
+PATH_PARAM_PATTERN = re.compile(r"\{[^}]+\}")
+
+
+def pytest_configure(config):
+    reset_parts(config, REPORT_NAME)
+    config._swagger_coverage_summary = None
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not SwaggerCoverageRecorder.is_enabled():
+        return
+
+    config = session.config
+    calls = SwaggerCoverageRecorder.drain()
+    if calls:
+        dump_part(config, REPORT_NAME, calls)
+
+    if is_xdist_worker(config):
+        return
+
+    all_calls = [call for part in load_parts(config, REPORT_NAME) for call in part]
+    spec_path = os.getenv("SWAGGER_SPEC_PATH", "")
+    operations = load_spec_operations(spec_path) if spec_path and os.path.exists(spec_path) else {}
+
+    summary = build_coverage_summary(all_calls, operations)
+    write_report(config, REPORT_FILE, summary)
+    config._swagger_coverage_summary = summary
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    summary = getattr(config, "_swagger_coverage_summary", None)
+    if not summary:
+        return
+
+    terminalreporter.write_sep("=", "Swagger coverage")
+    if summary["total_operations"]:
+        terminalreporter.write_line(
+            f"Покрыто операций: {summary['covered_operations']} из {summary['total_operations']} "
+            f"({summary['coverage_percent']:.1f}%)"
+        )
+        for operation in summary["uncovered"]:
+            terminalreporter.write_line(f"  не покрыто: {operation}")
+    else:
+        terminalreporter.write_line("Спецификация не задана (SWAGGER_SPEC_PATH), выводятся только вызванные операции.")
+    for operation in summary["undocumented"]:
+        terminalreporter.write_line(f"  нет в спецификации: {operation}")
+    terminalreporter.write_line(f"Отчёт: {get_reports_dir(config) / REPORT_FILE}")
+
+
+def _normalize_path(path: str) -> str:
+    return PATH_PARAM_PATTERN.sub("{}", "/" + path.strip("/"))
+
+
+def load_spec_operations(spec_path: str) -> dict:
+    """
+    Загружает операции из OpenAPI/Swagger спецификации в формате JSON.
+
+    Префикс пути из servers[0].url (OpenAPI 3) или basePath (Swagger 2) отбрасывается,
+    имена параметров пути нормализуются, чтобы '{hash}' и '{hash_code}' совпадали.
+
+    :param spec_path: Путь к файлу спецификации.
+    :return: Словарь {'METHOD /normalized/path': {'path': исходный путь, 'params': [...]}}.
+    """
+    with open(spec_path, encoding="utf-8") as file:
+        spec = json.load(file)
+
+    if spec.get("servers"):
+        prefix = urlsplit(spec["servers"][0].get("url", "")).path
+    else:
+        prefix = spec.get("basePath", "")
+    prefix = prefix.rstrip("/")
+
+    operations = {}
+    for path, path_item in spec.get("paths", {}).items():
+        common_params = path_item.get("parameters", [])
+        for method, operation in path_item.items():
+            if method not in HTTP_METHODS:
+                continue
+            params = [
+                param.get("name")
+                for param in common_params + operation.get("parameters", [])
+                if param.get("in") == "query"
+            ]
+            key = f"{method.upper()} {_normalize_path(path)}"
+            operations[key] = {"path": f"{prefix}{path}", "params": params}
+    return operations
+
+
+def _segments_match(path_segments: list, template_segments: list) -> bool:
+    return len(path_segments) == len(template_segments) and all(
+        segment == template or "{}" in (segment, template)
+        for segment, template in zip(path_segments, template_segments)
+    )
+
+
+def find_operation(method: str, path: str, operations: dict):
+    """
+    Находит операцию спецификации для вызова посегментным сравнением шаблонов путей.
+
+    Вызов может быть записан как без префикса спецификации (servers/basePath), так и с ним.
+    Параметр пути ('{}') совпадает с любым сегментом; если подходят несколько операций,
+    выбирается та, у которой больше совпавших литеральных сегментов.
+
+    :param method: HTTP-метод вызова.
+    :param path: Нормализованный путь вызова.
+    :param operations: Операции спецификации из load_spec_operations.
+    :return: Ключ операции или None.
+    """
+    path_segments = path.strip("/").split("/")
+    best_key, best_score = None, -1
+    for operation_key, operation in operations.items():
+        operation_method, operation_path = operation_key.split(" ", 1)
+        if operation_method != method:
+            continue
+        for template in (operation_path, _normalize_path(operation["path"])):
+            template_segments = template.strip("/").split("/")
+            if not _segments_match(path_segments, template_segments):
+                continue
+            score = sum(segment == expected != "{}" for segment, expected in zip(path_segments, template_segments))
+            if score > best_score:
+                best_key, best_score = operation_key, score
+    return best_key
+
+
+def build_coverage_summary(calls: list, operations: dict) -> dict:
+    """
+    Сопоставляет вызовы со спецификацией.
+
+    :param calls: Сгруппированные вызовы из SwaggerCoverageRecorder всех процессов.
+    :param operations: Операции спецификации из load_spec_operations (может быть пустым).
+    :return: Итоговый отчёт покрытия.
+    """
+    called = {}
+    for call in calls:
+        key = f"{call['method']} {_normalize_path(call['path'])}"
+        entry = called.setdefault(key, {"path": call["path"], "count": 0, "statuses": {}, "params": set(), "body": set()})
+        entry["count"] += call["count"]
+        entry["statuses"][str(call["status"])] = entry["statuses"].get(str(call["status"]), 0) + call["count"]
+        entry["params"].update(call["params"])
+        entry["body"].update(call["body"])
+
+    covered = {}
+    undocumented = []
+    for key, entry in called.items():
+        method, path = key.split(" ", 1)
+        operation_key = find_operation(method, path, operations) if operations else None
+        if operations and operation_key is None:
+            undocumented.append(f"{method} {entry['path']}")
+            continue
+        # Разные шаблоны вызова (например, с префиксом и без) могут попасть в одну операцию — суммируем
+        declared_params = operations[operation_key]["params"] if operation_key else []
+        operation = covered.setdefault(operation_key or key, {
+            "path": entry["path"],
+            "count": 0,
+            "statuses": {},
+            "params_used": set(),
+            "params_unused": set(declared_params),
+            "body_fields": set()
+        })
+        operation["count"] += entry["count"]
+        for status, count in entry["statuses"].items():
+            operation["statuses"][status] = operation["statuses"].get(status, 0) + count
+        operation["params_used"].update(entry["params"])
+        operation["params_unused"].difference_update(entry["params"])
+        operation["body_fields"].update(entry["body"])
+
+    for operation in covered.values():
+        for field in ("params_used", "params_unused", "body_fields"):
+            operation[field] = sorted(operation[field])
+
+    uncovered = [
+        f"{key.split(' ', 1)[0]} {operation['path']}"
+        for key, operation in operations.items()
+        if key not in covered
+    ]
+    total = len(operations)
+    return {
+        "total_operations": total,
+        "covered_operations": total - len(uncovered) if total else len(covered),
+        "coverage_percent": (total - len(uncovered)) / total * 100 if total else 0.0,
+        "covered": covered,
+        "uncovered": sorted(uncovered),
+        "undocumented": sorted(undocumented)
+    }
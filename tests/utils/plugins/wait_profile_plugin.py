@@ -0,0 +1,106 @@
+from tests.utils.plugins.xdist_reports import (
+    dump_part,
+    get_reports_dir,
+    is_xdist_worker,
+    load_parts,
+    reset_parts,
+    write_report,
+)
+from tests.utils.ui_settings.wait_profiler import WaitProfiler
+from tests.utils.utils import percentile
+
+REPORT_NAME = "wait_profile"
+REPORT_FILE = "wait_profile.json"
+
+
+def pytest_configure(config):
+    reset_parts(config, REPORT_NAME)
+    config._wait_profile_summary = None
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    records = WaitProfiler.drain()
+    if records:
+        dump_part(config, REPORT_NAME, records)
+
+    if is_xdist_worker(config):
+        return
+
+    all_records = [record for part in load_parts(config, REPORT_NAME) for record in part]
+    if not all_records:
+        return
+
+    summary = build_wait_summary(all_records)
+    write_report(config, REPORT_FILE, summary)
+    config._wait_profile_summary = summary
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    summary = getattr(config, "_wait_profile_summary", None)
+    if not summary:
+        return
+
+    terminalreporter.write_sep("=", "Element waits (s)")
+    terminalreporter.write_line(
+        f"Всего в ожиданиях: {summary['total_waited_s']:.1f} с, "
+        f"из них отрицательные проверки и таймауты: {summary['negative_waited_s']:.1f} с"
+    )
+    terminalreporter.write_line(f"{'locator':<70} {'calls':>6} {'total':>7} {'p95':>6} {'timeouts':>9}")
+    for locator, stats in list(summary["hot_locators"].items())[:10]:
+        terminalreporter.write_line(
+            f"{locator[:70]:<70} {stats['calls']:>6} {stats['total_waited_s']:>7.1f} "
+            f"{stats['p95_s']:>6.2f} {stats['timeouts']:>9}"
+        )
+    if summary["negative_checks"]:
+        terminalreporter.write_line("Отрицательные проверки (сколько времени сожгли):")
+        for caller, stats in list(summary["negative_checks"].items())[:10]:
+            terminalreporter.write_line(f"  {stats['total_waited_s']:>7.1f} с  {stats['calls']:>4}  {caller}")
+    terminalreporter.write_line(f"Отчёт: {get_reports_dir(config) / REPORT_FILE}")
+
+
+def build_wait_summary(records: list) -> dict:
+    """
+    Ранжирует локаторы по суммарному времени ожидания и собирает отрицательные проверки.
+
+    :param records: Замеры WaitProfiler всех процессов.
+    :return: Итоги, hot_locators (по локатору) и negative_checks (по вызывающему методу) по убыванию времени.
+    """
+    hot_locators = {}
+    negative_checks = {}
+    for record in records:
+        stats = hot_locators.setdefault(record["locator"], {"waits": [], "timeouts": 0, "callers": set()})
+        stats["waits"].append(record["waited"])
+        stats["timeouts"] += record["outcome"] == "timeout"
+        stats["callers"].add(record["caller"])
+
+        if record["outcome"] != "found":
+            check = negative_checks.setdefault(record["caller"], {
+                "calls": 0, "total_waited_s": 0.0, "timeouts": 0, "action": record["action"],
+                "locator": record["locator"]
+            })
+            check["calls"] += 1
+            check["total_waited_s"] += record["waited"]
+            check["timeouts"] += record["outcome"] == "timeout"
+
+    for locator, stats in hot_locators.items():
+        waits = stats.pop("waits")
+        stats.update({
+            "calls": len(waits),
+            "total_waited_s": sum(waits),
+            "p50_s": percentile(waits, 50),
+            "p95_s": percentile(waits, 95),
+            "max_s": max(waits),
+            "callers": sorted(stats["callers"])
+        })
+
+    return {
+        "total_waited_s": sum(record["waited"] for record in records),
+        "negative_waited_s": sum(check["total_waited_s"] for check in negative_checks.values()),
+        "hot_locators": dict(
+            sorted(hot_locators.items(), key=lambda entry: entry[1]["total_waited_s"], reverse=True)
+        ),
+        "negative_checks": dict(
+            sorted(negative_checks.items(), key=lambda entry: entry[1]["total_waited_s"], reverse=True)
+        )
+    }
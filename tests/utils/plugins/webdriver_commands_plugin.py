@@ -0,0 +1,102 @@
+import pytest
+
+from tests.utils.plugins.xdist_reports import get_reports_dir, is_xdist_worker, write_report
+from tests.utils.ui_settings.command_listener import CommandListener
+
+REPORT_FILE = "webdriver_commands.json"
+USER_PROPERTY = "webdriver_commands"
+
+_per_test = {}
+
+
+def pytest_configure(config):
+    config._webdriver_commands_summary = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    CommandListener.reset()
+    yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    if call.when == "teardown":
+        stats = CommandListener.drain()
+        if stats:
+            # user_properties сериализуются xdist вместе с отчётом и попадают в JUnit XML
+            item.user_properties.append((USER_PROPERTY, stats))
+            item.add_report_section("teardown", "webdriver commands", format_test_stats(stats))
+    yield
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown":
+        return
+    for name, stats in report.user_properties:
+        if name == USER_PROPERTY:
+            _per_test[report.nodeid] = stats
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    if is_xdist_worker(config) or not _per_test:
+        return
+
+    summary = build_commands_summary(_per_test)
+    write_report(config, REPORT_FILE, summary)
+    config._webdriver_commands_summary = summary
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    summary = getattr(config, "_webdriver_commands_summary", None)
+    if not summary:
+        return
+
+    terminalreporter.write_sep("=", "WebDriver commands")
+    terminalreporter.write_line(
+        f"Всего команд: {summary['count']}, суммарная задержка {summary['latency_s']:.1f} с"
+    )
+    terminalreporter.write_line(f"{'step':<70} {'count':>6} {'latency s':>10}")
+    for step, stats in list(summary["by_step"].items())[:10]:
+        terminalreporter.write_line(f"{step[:70]:<70} {stats['count']:>6} {stats['latency_s']:>10.2f}")
+    terminalreporter.write_line(f"Отчёт: {get_reports_dir(config) / REPORT_FILE}")
+
+
+def format_test_stats(stats: dict) -> str:
+    """
+    :param stats: Статистика команд одного теста.
+    :return: Текстовая сводка для секции отчёта pytest.
+    """
+    lines = [f"Команд: {stats['count']}, задержка {stats['latency_s']:.2f} с"]
+    for group in ("by_command", "by_step"):
+        ordered = sorted(stats[group].items(), key=lambda entry: entry[1]["count"], reverse=True)
+        lines.extend(f"  {entry['count']:>5}  {entry['latency_s']:>7.2f} с  {key}" for key, entry in ordered)
+    return "\n".join(lines)
+
+
+def build_commands_summary(per_test: dict) -> dict:
+    """
+    Агрегирует команды WebDriver по тестам, типам команд и шагам StepLogger.
+
+    :param per_test: Словарь {nodeid: статистика теста}.
+    :return: Итоги и группировки, отсортированные по числу команд.
+    """
+    totals = {"by_command": {}, "by_step": {}}
+    for stats in per_test.values():
+        for group in totals:
+            for key, entry in stats[group].items():
+                total = totals[group].setdefault(key, {"count": 0, "latency_s": 0.0})
+                total["count"] += entry["count"]
+                total["latency_s"] += entry["latency_s"]
+
+    def by_count(items: dict) -> dict:
+        return dict(sorted(items.items(), key=lambda entry: entry[1]["count"], reverse=True))
+
+    return {
+        "count": sum(stats["count"] for stats in per_test.values()),
+        "latency_s": sum(stats["latency_s"] for stats in per_test.values()),
+        "by_command": by_count(totals["by_command"]),
+        "by_step": by_count(totals["by_step"]),
+        "per_test": by_count(per_test)
+    }
@@ -0,0 +1,67 @@
+import math
+import os
+
+import pytest
+
+from tests.api.api_helpers.auth_helper_api import AuthHelperApi
+from tests.api.api_helpers.workspace_pool import WorkspacePool
+from tests.api.data.auth_data import AuthData
+from tests.utils.plugins.auth_cache_plugin import get_auth_cache
+
+POOL_FIXTURES = {"workspace_pool", "pooled_workspace"}
+
+
+def pytest_configure(config):
+    config._workspace_pool = None
+
+
+def pytest_collection_finish(session):
+    # Пул стартует сразу после сбора, если он нужен хотя бы одному тесту этого воркера,
+    # чтобы воркспейсы создавались, пока выполняются первые тесты. Считаем по session.items —
+    # уже после отбора -m/-k, иначе пул создавал бы воркспейсы для невыбранных тестов
+    config = session.config
+    demand = sum(
+        1 for item in session.items
+        if POOL_FIXTURES & set(getattr(item, "fixturenames", ())) and not item.get_closest_marker("skip")
+    )
+    if demand and not config.option.collectonly:
+        # Воркер xdist собирает все тесты, а выполняет только свою долю
+        workers = getattr(config, "workerinput", {}).get("workercount", 1)
+        _get_pool(config, demand=math.ceil(demand / workers)).start()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session, exitstatus):
+    # Останавливаем пул раньше, чем закрываются HTTP-сессии и локальный стенд
+    pool = getattr(session.config, "_workspace_pool", None)
+    if pool is not None:
+        pool.stop()
+
+
+def _get_pool(config, demand: int = None) -> WorkspacePool:
+    if config._workspace_pool is None:
+        auth_data = AuthData()
+        config._workspace_pool = WorkspacePool(
+            size=int(os.getenv("WORKSPACE_POOL_SIZE", "3")),
+            email=auth_data.email,
+            code=auth_data.code,
+            auth_helper=AuthHelperApi(store=get_auth_cache(config)),
+            demand=demand
+        )
+    return config._workspace_pool
+
+
+@pytest.fixture(scope="session")
+def workspace_pool(request) -> WorkspacePool:
+    """
+    Пул заранее созданных воркспейсов текущего воркера.
+    """
+    return _get_pool(request.config)
+
+
+@pytest.fixture
+def pooled_workspace(workspace_pool) -> dict:
+    """
+    Готовый воркспейс из пула: {domain, invite_token, hash_code, email}.
+    """
+    return workspace_pool.checkout(timeout=float(os.getenv("WORKSPACE_POOL_TIMEOUT_S", "60")))
@@ -0,0 +1,106 @@
+import json
+import shutil
+from pathlib import Path
+
+REPORTS_DIR_NAME = "reports"
+PARTS_DIR_NAME = ".parts"
+
+
+def is_xdist_worker(config) -> bool:
+    """
+    Проверяет, выполняется ли код в воркере pytest-xdist.
+
+    :param config: Объект pytest.Config.
+    :return: True, если это воркер xdist, иначе False (master или запуск без xdist).
+    """
+    return hasattr(config, "workerinput")
+
+
+def get_worker_id(config) -> str:
+    """
+    Возвращает идентификатор воркера xdist ('gw0', 'gw1', ...) или 'master'.
+
+    :param config: Объект pytest.Config.
+    :return: Идентификатор текущего процесса.
+    """
+    return getattr(config, "workerinput", {}).get("workerid", "master")
+
+
+def get_reports_dir(config) -> Path:
+    """
+    Возвращает директорию для итоговых отчётов прогона (создаёт при необходимости).
+
+    :param config: Объект pytest.Config.
+    :return: Путь к директории отчётов.
+    """
+    path = Path(config.rootpath) / REPORTS_DIR_NAME
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _get_parts_dir(config, name: str) -> Path:
+    return get_reports_dir(config) / PARTS_DIR_NAME / name
+
+
+def reset_parts(config, name: str):
+    """
+    Удаляет частичные отчёты предыдущего прогона. Вызывается только в master-процессе,
+    до старта воркеров (pytest_configure).
+
+    :param config: Объект pytest.Config.
+    :param name: Имя отчёта (например, 'http_timings').
+    :return: None
+    """
+    if is_xdist_worker(config):
+        return
+    shutil.rmtree(_get_parts_dir(config, name), ignore_errors=True)
+
+
+def dump_part(config, name: str, data):
+    """
+    Сохраняет частичный отчёт текущего процесса на диск.
+
+    :param config: Объект pytest.Config.
+    :param name: Имя отчёта.
+    :param data: JSON-сериализуемые данные.
+    :return: None
+    """
+    parts_dir = _get_parts_dir(config, name)
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    part_path = parts_dir / f"{get_worker_id(config)}.json"
+    with open(part_path, "w", encoding="utf-8") as file:
+        json.dump(data, file, ensure_ascii=False)
+
+
+def load_parts(config, name: str) -> list:
+    """
+    Загружает частичные отчёты всех процессов текущего прогона.
+
+    :param config: Объект pytest.Config.
+    :param name: Имя отчёта.
+    :return: Список данных из каждого частичного отчёта.
+    """
+    parts_dir = _get_parts_dir(config, name)
+    if not parts_dir.exists():
+        return []
+
+    parts = []
+    for part_path in sorted(parts_dir.glob("*.json")):
+        with open(part_path, encoding="utf-8") as file:
+            parts.append(json.load(file))
+    return parts
+
+
+def write_report(config, file_name: str, data) -> Path:
+    """
+    Записывает итоговый JSON-отчёт в директорию отчётов.
+
+    :param config: Объект pytest.Config.
+    :param file_name: Имя файла отчёта.
+    :param data: JSON-сериализуемые данные.
+    :return: Путь к записанному отчёту.
+    """
+    report_path = get_reports_dir(config) / file_name
+    with open(report_path, "w", encoding="utf-8") as file:
+        json.dump(data, file, ensure_ascii=False, indent=2)
+    return report_path
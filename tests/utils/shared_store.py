@@ -0,0 +1,111 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from filelock import FileLock
+
+
+class SharedStore:
+    """
+    JSON-хранилище на диске, общее для всех воркеров pytest-xdist.
+
+    Чтение и запись защищены файловой блокировкой, записи могут иметь TTL.
+    get_or_create дополнительно блокирует конкретный ключ, поэтому дорогое значение
+    (например, авторизация по OTP) вычисляется одним воркером, а остальные ждут и читают результат.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: Путь к JSON-файлу хранилища.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = FileLock(f"{self.path}.lock")
+
+    def get(self, key: str):
+        """
+        Возвращает значение по ключу.
+
+        :param key: Ключ записи.
+        :return: Значение или None, если записи нет или истёк её TTL.
+        """
+        with self._lock:
+            entry = self._read().get(key)
+        return self._unwrap(entry)
+
+    def set(self, key: str, value, ttl: float = None):
+        """
+        Сохраняет значение.
+
+        :param key: Ключ записи.
+        :param value: JSON-сериализуемое значение.
+        :param ttl: Время жизни записи в секундах (None — бессрочно).
+        :return: None
+        """
+        with self._lock:
+            data = self._read()
+            data[key] = {"value": value, "expires_at": time.time() + ttl if ttl else None}
+            self._write(data)
+
+    def delete(self, key: str):
+        """
+        Удаляет запись.
+
+        :param key: Ключ записи.
+        :return: None
+        """
+        with self._lock:
+            data = self._read()
+            if data.pop(key, None) is not None:
+                self._write(data)
+
+    def get_or_create(self, key: str, factory, ttl: float = None):
+        """
+        Возвращает значение по ключу, вычисляя и сохраняя его при отсутствии.
+
+        :param key: Ключ записи.
+        :param factory: Функция без аргументов, вычисляющая значение.
+        :param ttl: Время жизни записи в секундах.
+        :return: Значение из хранилища или результат factory.
+        """
+        key_hash = hashlib.sha256(key.encode()).hexdigest()[:16]
+        with FileLock(f"{self.path}.{key_hash}.lock"):
+            value = self.get(key)
+            if value is None:
+                value = factory()
+                self.set(key, value, ttl)
+        return value
+
+    def clear(self):
+        """
+        Удаляет все записи хранилища.
+
+        :return: None
+        """
+        with self._lock:
+            self._write({})
+
+    @staticmethod
+    def _unwrap(entry):
+        if entry is None:
+            return None
+        if entry["expires_at"] is not None and entry["expires_at"] < time.time():
+            return None
+        return entry["value"]
+
+    def _read(self) -> dict:
+        if not self.path.exists():
+            return {}
+        with open(self.path, encoding="utf-8") as file:
+            try:
+                return json.load(file)
+            except ValueError:
+                return {}
+
+    def _write(self, data: dict):
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
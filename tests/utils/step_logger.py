@@ -1,16 +1,121 @@
+import itertools
 import logging
+import threading
+import time
 
 # Убираем слово "INFO" из логов
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
+class StepTracer:
+    """
+    Накопитель спанов (шагов с длительностью и вложенностью) текущего теста внутри процесса.
+
+    Спаны открываются StepLogger-ом и плагином step_trace_plugin (тест целиком, фазы setup/call/teardown).
+    Закрытые спаны сохраняются, только пока идёт сбор для теста (start_test/finish_test).
+    Стек открытых спанов хранится отдельно для каждого потока, поэтому вложенность шагов восстанавливается
+    автоматически; у каждого спана есть id родителя и id теста из TestMetadata.
+    """
+
+    _ids = itertools.count(1)
+    _local = threading.local()
+    _lock = threading.Lock()
+    _spans: list = []
+    _test = {}
+
+    @classmethod
+    def start_test(cls, nodeid: str, test_id: str = None, test_name: str = None) -> None:
+        """
+        Начинает сбор спанов для теста.
+
+        :param nodeid: nodeid pytest.
+        :param test_id: ID из TestMetadata (если задан).
+        :param test_name: Название из TestMetadata (если задано).
+        :return: None
+        """
+        with cls._lock:
+            cls._spans = []
+            cls._test = {"nodeid": nodeid, "test_id": test_id, "test_name": test_name}
+
+    @classmethod
+    def finish_test(cls) -> list:
+        """
+        Завершает сбор спанов теста.
+
+        :return: Закрытые спаны теста в порядке завершения.
+        """
+        with cls._lock:
+            spans, cls._spans, cls._test = cls._spans, [], {}
+        return spans
+
+    @classmethod
+    def _stack(cls) -> list:
+        if not hasattr(cls._local, "stack"):
+            cls._local.stack = []
+        return cls._local.stack
+
+    @classmethod
+    def begin(cls, name: str, category: str = "step") -> dict:
+        """
+        Открывает спан; он становится дочерним для последнего открытого спана потока.
+
+        :param name: Название спана (текст шага).
+        :param category: Категория: test, phase или step.
+        :return: Открытый спан.
+        """
+        stack = cls._stack()
+        span = {
+            "id": next(cls._ids),
+            "parent_id": stack[-1]["id"] if stack else None,
+            "name": name,
+            "category": category,
+            "depth": len(stack),
+            "test_id": cls._test.get("test_id"),
+            "nodeid": cls._test.get("nodeid"),
+            "thread_id": threading.get_native_id(),
+            "start_us": time.time_ns() // 1000,
+            "_started": time.perf_counter()
+        }
+        stack.append(span)
+        return span
+
+    @classmethod
+    def end(cls, span: dict, failed: bool = False) -> None:
+        """
+        Закрывает спан и сохраняет его длительность.
+
+        :param span: Спан, возвращённый begin.
+        :param failed: True, если внутри спана было исключение.
+        :return: None
+        """
+        span["duration_us"] = int((time.perf_counter() - span.pop("_started")) * 1_000_000)
+        span["status"] = "failed" if failed else "passed"
+        stack = cls._stack()
+        for index, opened in enumerate(stack):
+            if opened is span:
+                del stack[index:]
+                break
+        with cls._lock:
+            if cls._test:
+                cls._spans.append(span)
+
+    @classmethod
+    def current_span(cls):
+        """
+        :return: Самый вложенный открытый спан текущего потока или None.
+        """
+        stack = cls._stack()
+        return stack[-1] if stack else None
+
+
 class StepLogger:
     """
     Вспомогательный класс для логирования шагов в тестах.
 
     Логи выводятся в понятном формате, что упрощает отслеживание
     последовательности действий во время выполнения теста.
+    Каждый шаг также записывается в StepTracer как спан с длительностью и родительским шагом.
     """
 
     def __init__(self, step_message: str):
@@ -20,14 +125,16 @@ class StepLogger:
         :param step_message: Описание выполняемого шага.
         """
         self.step_message = step_message
+        self.span = None
 
     def __enter__(self):
         """
-        Логирует сообщение при входе в контекст.
+        Логирует сообщение при входе в контекст и открывает спан шага.
 
         :return: self
         """
         logger.info(f"{self.step_message}")
+        self.span = StepTracer.begin(self.step_message)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
@@ -39,6 +146,7 @@ class StepLogger:
         :param traceback: Трассировка исключения (если есть).
         :return: False (исключения продолжают распространяться).
         """
+        StepTracer.end(self.span, failed=exc_type is not None)
         if exc_type is None:
             pass  # Дополнительный лог не требуется при успешном выполнении
         else:
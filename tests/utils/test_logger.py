@@ -9,6 +9,8 @@ def TestMetadata(name: str, id: str):
     """
     Декоратор для установки метаданных теста (имя и ID) и логирования перед выполнением.
 
+    Метаданные доступны плагинам через атрибут test_metadata функции теста (см. get_test_metadata).
+
     :param name: Название теста.
     :param id: Уникальный идентификатор теста.
     :return: Обёрнутая функция с логированием метаданных перед запуском.
@@ -19,5 +21,16 @@ def TestMetadata(name: str, id: str):
             # Логируем метаданные теста перед выполнением
             test_logger.info(f"\nНазвание: {name}\nID: {id}\n")
             return func(*args, **kwargs)
+        wrapper.test_metadata = {"name": name, "id": id}
         return wrapper
     return decorator
+
+
+def get_test_metadata(item) -> dict:
+    """
+    Возвращает метаданные TestMetadata для элемента pytest.
+
+    :param item: pytest.Item.
+    :return: Словарь {"name", "id"} или пустой словарь, если тест не размечен.
+    """
+    return getattr(getattr(item, "function", None), "test_metadata", {})
@@ -0,0 +1,132 @@
+import json
+import os
+import threading
+
+from tests.utils.utils import percentile
+
+
+class AdaptiveTimeouts:
+    """
+    Таймауты ожиданий, выведенные из истории успешных ожиданий по локатору.
+
+    Режим задаётся UI_ADAPTIVE_TIMEOUTS:
+        off   — история не ведётся, используются заданные таймауты;
+        learn — успешные ожидания записываются в историю, таймауты не меняются;
+        on    — история ведётся, а отрицательные проверки (is_visible, is_enabled, wait_until_enabled
+                с expect_absent=True) ждут не дольше UI_ADAPTIVE_PERCENTILE-го перцентиля истории
+                + UI_ADAPTIVE_MARGIN_S.
+
+    Адаптивный таймаут никогда не превышает заданный в вызове и не опускается ниже UI_ADAPTIVE_MIN_TIMEOUT_S.
+    Позитивные проверки и ожидания, которые при неудаче бросают исключение, всегда ждут заданный таймаут:
+    так позитивные шаги не становятся флаки, а отрицательные проверки перестают сжигать полный таймаут.
+    В историю попадают только ожидания с полным таймаутом, урезанные — нет.
+    """
+
+    HISTORY_LIMIT = 50
+
+    _history = {}
+    _samples = []
+    _saved_seconds = 0.0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_mode() -> str:
+        return os.getenv("UI_ADAPTIVE_TIMEOUTS", "off").lower()
+
+    @staticmethod
+    def make_key(condition: str, locator) -> str:
+        """
+        :param condition: Условие ожидания: present, visible, clickable, enabled или text.
+        :param locator: Кортеж локатора.
+        :return: Ключ истории, например 'visible //h2'.
+        """
+        by, value = locator
+        return f"{condition} {value}" if by == "xpath" else f"{condition} {by}={value}"
+
+    @classmethod
+    def load_history(cls, path) -> None:
+        """
+        Загружает историю ожиданий прошлых прогонов.
+
+        :param path: Путь к JSON-файлу истории {ключ: [длительности в секундах]}.
+        :return: None
+        """
+        history = {}
+        if path.exists():
+            with open(path, encoding="utf-8") as file:
+                history = json.load(file)
+        with cls._lock:
+            cls._history = history
+
+    @classmethod
+    def record(cls, condition: str, locator, seconds: float) -> None:
+        """
+        Сохраняет длительность успешного ожидания.
+
+        :param condition: Условие ожидания.
+        :param locator: Кортеж локатора.
+        :param seconds: Сколько ждали, в секундах.
+        :return: None
+        """
+        if cls.get_mode() == "off":
+            return
+        with cls._lock:
+            cls._samples.append([cls.make_key(condition, locator), seconds])
+
+    @classmethod
+    def get_timeout(cls, condition: str, locator, timeout: float) -> float:
+        """
+        Возвращает таймаут для проверки-булевой.
+
+        :param condition: Условие ожидания.
+        :param locator: Кортеж локатора.
+        :param timeout: Заданный (максимальный) таймаут в секундах.
+        :return: Адаптивный таймаут или заданный, если режим не 'on' либо истории мало.
+        """
+        if cls.get_mode() != "on":
+            return timeout
+        samples = cls._history.get(cls.make_key(condition, locator), [])
+        if len(samples) < int(os.getenv("UI_ADAPTIVE_MIN_SAMPLES", "5")):
+            return timeout
+
+        learned = (
+            percentile(samples, float(os.getenv("UI_ADAPTIVE_PERCENTILE", "99")))
+            + float(os.getenv("UI_ADAPTIVE_MARGIN_S", "2"))
+        )
+        return min(timeout, max(learned, float(os.getenv("UI_ADAPTIVE_MIN_TIMEOUT_S", "1"))))
+
+    @classmethod
+    def record_saving(cls, seconds: float) -> None:
+        """
+        Учитывает время, сэкономленное отрицательной проверкой благодаря адаптивному таймауту.
+
+        :param seconds: Разница между заданным и адаптивным таймаутом.
+        :return: None
+        """
+        with cls._lock:
+            cls._saved_seconds += seconds
+
+    @classmethod
+    def drain(cls) -> dict:
+        """
+        Возвращает накопленные замеры процесса и очищает накопитель.
+
+        :return: Словарь {"samples": [[ключ, секунды]], "saved_s": сэкономлено секунд}.
+        """
+        with cls._lock:
+            data = {"samples": cls._samples, "saved_s": cls._saved_seconds}
+            cls._samples, cls._saved_seconds = [], 0.0
+        return data
+
+    @classmethod
+    def merge_history(cls, history: dict, samples: list) -> dict:
+        """
+        Добавляет новые замеры в историю, оставляя по HISTORY_LIMIT последних на ключ.
+
+        :param history: История {ключ: [секунды]}.
+        :param samples: Новые замеры [[ключ, секунды]].
+        :return: Обновлённая история.
+        """
+        for key, seconds in samples:
+            history.setdefault(key, []).append(seconds)
+        return {key: values[-cls.HISTORY_LIMIT:] for key, values in history.items()}
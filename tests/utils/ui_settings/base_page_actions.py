@@ -1,15 +1,47 @@
+import os
+import time
+from pathlib import Path
+
 from selenium.webdriver.support.select import Select
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    JavascriptException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from tests.utils.ui_settings.adaptive_timeouts import AdaptiveTimeouts
+from tests.utils.ui_settings.wait_profiler import profiled_wait
+
+SCRIPTS_DIR = Path(__file__).parent
+DOM_HELPERS_JS = (SCRIPTS_DIR / "dom_helpers.js").read_text(encoding="utf-8")
+ELEMENT_WAIT_JS = DOM_HELPERS_JS + (SCRIPTS_DIR / "element_wait.js").read_text(encoding="utf-8")
+ELEMENT_STATE_JS = DOM_HELPERS_JS + (SCRIPTS_DIR / "element_state.js").read_text(encoding="utf-8")
 
 
 class ElementActions:
     """
     Утилитный класс для обёртки часто используемых действий с элементами в Selenium.
+
+    Ожидания по умолчанию выполняются внутри браузера через MutationObserver (UI_WAIT_BACKEND=observer):
+    один execute_async_script вместо find_element каждые 500 мс. Если скрипты недоступны
+    или локатор не поддерживается, используется обычный поллинг WebDriverWait (UI_WAIT_BACKEND=polling).
+
+    Найденные элементы кэшируются по локатору (UI_ELEMENT_CACHE=True), поэтому click/fill_input/get_text
+    после wait_until_clickable не ищут элемент повторно. Кэш сбрасывается при навигации через
+    SeleniumFramework, а устаревший элемент (StaleElementReferenceException) ищется заново.
     """
 
+    # Счётчик навигаций хранится на драйвере, чтобы его видели все page object-ы одного браузера
+    NAVIGATION_COUNTER_ATTR = "_lenza_navigation_id"
+
+    # Максимальная длительность одного execute_async_script, чтобы не упереться в script timeout сессии
+    WAIT_CALL_BUDGET_MS = 5000
+
     def __init__(self, browser):
         """
         Инициализирует объект действий с элементами.
@@ -17,6 +49,57 @@ class ElementActions:
         :param browser: Экземпляр Selenium WebDriver.
         """
         self.browser = browser
+        self.wait_backend = os.getenv("UI_WAIT_BACKEND", "observer").lower()
+        self.cache_enabled = os.getenv("UI_ELEMENT_CACHE", "True").lower() == "true"
+        self._element_cache = {}
+        self._cache_navigation_id = None
+        # Ожидание урезано адаптивным таймаутом: его длительность не попадает в историю
+        self._capped_wait = False
+
+    @classmethod
+    def invalidate_cache(cls, browser) -> None:
+        """
+        Помечает, что в браузере произошла навигация: кэши элементов всех страниц будут сброшены.
+
+        :param browser: Экземпляр Selenium WebDriver.
+        :return: None
+        """
+        setattr(browser, cls.NAVIGATION_COUNTER_ATTR, getattr(browser, cls.NAVIGATION_COUNTER_ATTR, 0) + 1)
+
+    def _sync_cache_with_navigation(self) -> None:
+        """Сбрасывает кэш элементов, если после его заполнения в браузере была навигация."""
+        navigation_id = getattr(self.browser, self.NAVIGATION_COUNTER_ATTR, 0)
+        if navigation_id != self._cache_navigation_id:
+            self._element_cache.clear()
+            self._cache_navigation_id = navigation_id
+
+    def _get_cached_element(self, locator):
+        self._sync_cache_with_navigation()
+        return self._element_cache.get(locator)
+
+    def _remember_element(self, locator, element) -> None:
+        if self.cache_enabled and isinstance(element, WebElement):
+            self._sync_cache_with_navigation()
+            self._element_cache[locator] = element
+
+    def _with_element(self, locator, timeout, action):
+        """
+        Выполняет действие над элементом, по возможности без повторного поиска.
+
+        Если элемент из кэша устарел, он ищется заново и действие повторяется один раз.
+
+        :param locator: Кортеж локатора.
+        :param timeout: Максимальное время ожидания элемента в секундах.
+        :param action: Функция, принимающая WebElement.
+        :return: Результат action.
+        """
+        element = self._get_cached_element(locator) if self.cache_enabled else None
+        if element is not None:
+            try:
+                return action(element)
+            except StaleElementReferenceException:
+                self._element_cache.pop(locator, None)
+        return action(self.wait_for_element(locator, timeout))
 
     def _ensure_xpath(self, locator):
         """
@@ -27,6 +110,117 @@ class ElementActions:
         """
         return (By.XPATH, locator) if isinstance(locator, str) else locator
 
+    @staticmethod
+    def _to_script_locator(locator):
+        """
+        Приводит локатор к виду, который понимают скрипты страницы (xpath, css selector или id).
+
+        :param locator: Кортеж локатора.
+        :return: Кортеж (by, value) или None, если локатор нельзя выразить без WebDriver (например, link text).
+        """
+        by, value = locator
+        if by in (By.XPATH, By.CSS_SELECTOR, By.ID):
+            return by, value
+        if by == By.NAME:
+            return By.CSS_SELECTOR, f'[name="{value}"]'
+        if by == By.CLASS_NAME:
+            return By.CSS_SELECTOR, f".{value}"
+        if by == By.TAG_NAME:
+            return By.CSS_SELECTOR, value
+        return None
+
+    def _wait(self, locator, condition: str, expected_condition, timeout, expected_text: str = None):
+        """
+        Ожидает условие через MutationObserver, а при его недоступности — поллингом WebDriverWait.
+
+        :param locator: Кортеж локатора.
+        :param condition: Условие для браузера: present, visible, clickable или text.
+        :param expected_condition: Эквивалентное условие из expected_conditions для поллинга.
+        :param timeout: Максимальное время ожидания в секундах.
+        :param expected_text: Ожидаемый текст для условия text.
+        :return: Результат условия (WebElement или True).
+        """
+        started = time.monotonic()
+        deadline = started + timeout
+        script_locator = self._to_script_locator(locator)
+        result = None
+        if self.wait_backend == "observer" and script_locator is not None:
+            result = self._wait_with_observer(script_locator, condition, deadline, expected_text)
+
+        if result is None:
+            # Поллинг на оставшееся время; если observer уже исчерпал таймаут — одна финальная проверка
+            remaining = max(0.0, deadline - time.monotonic())
+            result = WebDriverWait(self.browser, remaining).until(expected_condition)
+
+        if not self._capped_wait:
+            AdaptiveTimeouts.record(condition, locator, time.monotonic() - started)
+        self._remember_element(locator, result)
+        return result
+
+    def _check_with_adaptive_timeout(self, condition: str, locator, timeout, check, expect_absent: bool) -> bool:
+        """
+        Выполняет проверку-булеву; для отрицательных проверок — с адаптивным таймаутом (см. AdaptiveTimeouts).
+
+        Позитивные проверки всегда ждут заданный таймаут, чтобы медленный, но успешный шаг не стал падением.
+        Урезанные ожидания не пополняют историю: иначе она смещалась бы к собственному ограничению.
+
+        :param condition: Условие, по истории которого выбирается таймаут.
+        :param locator: Кортеж локатора.
+        :param timeout: Заданный (максимальный) таймаут в секундах.
+        :param check: Функция, принимающая таймаут и возвращающая bool (TimeoutException означает False).
+        :param expect_absent: True для отрицательной проверки (ожидается, что условие не наступит).
+        :return: Результат проверки.
+        """
+        effective_timeout = AdaptiveTimeouts.get_timeout(condition, locator, timeout) if expect_absent else timeout
+        self._capped_wait = effective_timeout < timeout
+        try:
+            result = check(effective_timeout)
+        except TimeoutException:
+            result = False
+        finally:
+            self._capped_wait = False
+        if not result and effective_timeout < timeout:
+            AdaptiveTimeouts.record_saving(timeout - effective_timeout)
+        return result
+
+    def _wait_with_observer(self, locator, condition: str, deadline: float, expected_text: str = None):
+        """
+        Блокируется в execute_async_script, пока условие не выполнится в браузере.
+
+        :return: WebElement/True или None (таймаут либо нужен переход на поллинг).
+        """
+        by, value = locator
+        while True:
+            budget_ms = min(self.WAIT_CALL_BUDGET_MS, (deadline - time.monotonic()) * 1000)
+            if budget_ms <= 0:
+                return None
+            try:
+                result = self.browser.execute_async_script(
+                    ELEMENT_WAIT_JS, by, value, condition, expected_text, budget_ms
+                )
+            except JavascriptException as error:
+                if "unload" in str(error):
+                    # Документ сменился во время ожидания — ждём уже в новом
+                    continue
+                # Ошибка конкретного локатора (например, невалидный XPath) — поллинг покажет её как обычно
+                return None
+            except WebDriverException:
+                # Например, script timeout: этот вызов дожидается поллингом, следующие снова пробуют observer
+                return None
+
+            if not result:
+                continue
+            try:
+                if condition == "visible" and not result.is_displayed():
+                    return None
+                if condition == "clickable" and not (result.is_displayed() and result.is_enabled()):
+                    return None
+            except StaleElementReferenceException:
+                # Страница успела заменить найденный элемент — ждём условие на новом
+                continue
+            return result
+
+    @profiled_wait
     def wait_for_element(self, locator, timeout=10):
         """
         Ожидает появления элемента в DOM.
@@ -36,10 +230,9 @@ class ElementActions:
         :return: Найденный WebElement.
         """
         locator = self._ensure_xpath(locator)
-        return WebDriverWait(self.browser, timeout).until(
-            EC.presence_of_element_located(locator)
-        )
+        return self._wait(locator, "present", EC.presence_of_element_located(locator), timeout)
 
+    @profiled_wait
     def wait_until_visible(self, locator, timeout=10):
         """
         Ожидает, что элемент станет видимым.
@@ -49,9 +242,7 @@ class ElementActions:
         :return: Видимый WebElement.
         """
         locator = self._ensure_xpath(locator)
-        return WebDriverWait(self.browser, timeout).until(
-            EC.visibility_of_element_located(locator)
-        )
+        return self._wait(locator, "visible", EC.visibility_of_element_located(locator), timeout)
 
     def click(self, locator, timeout=10):
         """
@@ -60,8 +251,7 @@ class ElementActions:
         :param locator: XPath или кортеж локатора.
         :param timeout: Максимальное время ожидания в секундах.
         """
-        element = self.wait_for_element(locator, timeout)
-        element.click()
+        self._with_element(self._ensure_xpath(locator), timeout, lambda element: element.click())
 
     def fill_input(self, locator, value, timeout=10):
         """
@@ -71,9 +261,11 @@ class ElementActions:
         :param value: Значение, которое нужно ввести.
         :param timeout: Максимальное время ожидания в секундах.
         """
-        element = self.wait_for_element(locator, timeout)
-        element.clear()
-        element.send_keys(value)
+        def fill(element):
+            element.clear()
+            element.send_keys(value)
+
+        self._with_element(self._ensure_xpath(locator), timeout, fill)
 
     def get_text(self, locator, timeout=10):
         """
@@ -83,22 +275,26 @@ class ElementActions:
         :param timeout: Максимальное время ожидания в секундах.
         :return: Строка с текстом элемента.
         """
-        element = self.wait_for_element(locator, timeout)
-        return element.text
+        return self._with_element(self._ensure_xpath(locator), timeout, lambda element: element.text)
 
-    def is_visible(self, locator, timeout=10):
+    @profiled_wait
+    def is_visible(self, locator, timeout=10, expect_absent: bool = False):
         """
         Проверяет, виден ли элемент.
 
         :param locator: XPath или кортеж локатора.
         :param timeout: Максимальное время ожидания в секундах.
+        :param expect_absent: Отрицательная проверка (ожидается, что элемент не появится):
+                              при UI_ADAPTIVE_TIMEOUTS=on ждёт по истории локатора, а не весь таймаут.
         :return: True, если элемент виден, иначе False.
         """
-        try:
-            self.wait_until_visible(locator, timeout)
-            return True
-        except TimeoutException:
-            return False
+        return self._check_with_adaptive_timeout(
+            "visible",
+            self._ensure_xpath(locator),
+            timeout,
+            lambda effective_timeout: bool(self.wait_until_visible(locator, effective_timeout)),
+            expect_absent
+        )
 
     def wait_text_to_be_present_in_element(self, locator, expected_text: str, timeout: int = 10) -> bool:
         """
@@ -110,8 +306,8 @@ class ElementActions:
         :return: True, если текст стал ожидаемым, иначе выбрасывает исключение.
         """
         locator = self._ensure_xpath(locator)
-        return WebDriverWait(self.browser, timeout).until(
-            EC.text_to_be_present_in_element(locator, expected_text)
+        return self._wait(
+            locator, "text", EC.text_to_be_present_in_element(locator, expected_text), timeout, expected_text
         )
 
     def find_elements(self, locator, timeout=10):
@@ -129,6 +325,7 @@ class ElementActions:
         return self.browser.find_elements(*locator)
 
 
+    @profiled_wait
     def wait_until_clickable(self, locator, timeout=10):
         """
         Ожидает, что элемент станет кликабельным.
@@ -138,9 +335,7 @@ class ElementActions:
         :return: Элемент, если он становится кликабельным.
         """
         locator = self._ensure_xpath(locator)
-        return WebDriverWait(self.browser, timeout).until(
-            EC.element_to_be_clickable(locator)
-        )
+        return self._wait(locator, "clickable", EC.element_to_be_clickable(locator), timeout)
 
     def wait_for_elements(self, locator, timeout=10):
         """
@@ -160,24 +355,105 @@ class ElementActions:
         Выполняет скролл до элемента на странице.
         """
         locator = (by, locator) if isinstance(locator, str) else locator
-        WebDriverWait(self.browser, timeout).until(EC.presence_of_element_located(locator))
-        element = self.browser.find_element(*locator)
-        self.browser.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+        self._with_element(
+            locator,
+            timeout,
+            lambda element: self.browser.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+        )
 
-    def is_enabled(self, locator, timeout=10) -> bool:
+    @profiled_wait
+    def is_enabled(self, locator, timeout=10, expect_absent: bool = False) -> bool:
         """
         Проверяет, активен ли элемент (доступен ли для взаимодействия).
 
         :param locator: XPath или кортеж локатора.
         :param timeout: Максимальное время ожидания.
+        :param expect_absent: Отрицательная проверка (ожидается, что элемента нет): адаптивный таймаут.
         :return: True, если элемент доступен.
         """
+        return self._check_with_adaptive_timeout(
+            "present",
+            self._ensure_xpath(locator),
+            timeout,
+            lambda effective_timeout: self.wait_for_element(locator, effective_timeout).is_enabled(),
+            expect_absent
+        )
+
+    @profiled_wait
+    def wait_until_enabled(self, locator, timeout=10, expect_absent: bool = False) -> bool:
+        """
+        Ожидает, что элемент станет активным (например, кнопка после валидации формы).
+
+        :param locator: XPath или кортеж локатора.
+        :param timeout: Максимальное время ожидания в секундах.
+        :param expect_absent: Отрицательная проверка (ожидается, что элемент останется неактивным):
+                              адаптивный таймаут.
+        :return: True, если элемент стал активным, иначе False.
+        """
+        locator = self._ensure_xpath(locator)
+
+        def element_enabled(browser):
+            try:
+                elements = browser.find_elements(*locator)
+                return bool(elements) and elements[0].is_enabled()
+            except StaleElementReferenceException:
+                # Экран перерисовался между поиском и проверкой — проверим на следующей итерации
+                return False
+
+        def wait_enabled(effective_timeout):
+            started = time.monotonic()
+            WebDriverWait(self.browser, effective_timeout).until(element_enabled)
+            if not self._capped_wait:
+                AdaptiveTimeouts.record("enabled", locator, time.monotonic() - started)
+            return True
+
+        return self._check_with_adaptive_timeout("enabled", locator, timeout, wait_enabled, expect_absent)
+
+    def wait_for_text_change(self, locator, previous_text: str, timeout=10) -> bool:
+        """
+        Ожидает, что текст элемента изменится или элемент исчезнет (например, смена экрана).
+
+        :param locator: XPath или кортеж локатора.
+        :param previous_text: Текст элемента до действия.
+        :param timeout: Максимальное время ожидания в секундах.
+        :return: True, если текст изменился, иначе False.
+        """
+        locator = self._ensure_xpath(locator)
+
+        def text_changed(browser):
+            try:
+                elements = browser.find_elements(*locator)
+                return not elements or elements[0].text != previous_text
+            except StaleElementReferenceException:
+                return False
+
         try:
-            element = self.wait_for_element(locator, timeout)
-            return element.is_enabled()
+            return WebDriverWait(self.browser, timeout).until(text_changed)
         except TimeoutException:
             return False
 
+    def get_elements_state(self, locators, attributes=()) -> dict:
+        """
+        Возвращает состояние нескольких элементов одним вызовом execute_script, без ожидания.
+
+        :param locators: Словарь {имя: локатор} или список локаторов (тогда ключами будут сами локаторы).
+        :param attributes: Имена атрибутов, которые нужно прочитать ('value' читается как свойство поля ввода).
+        :return: Словарь {имя: {"present", "visible", "enabled", "text", "attributes"}};
+                 для отсутствующего элемента text равен None.
+        """
+        if not isinstance(locators, dict):
+            locators = {locator: locator for locator in locators}
+
+        script_locators = []
+        for name, locator in locators.items():
+            script_locator = self._to_script_locator(self._ensure_xpath(locator))
+            if script_locator is None:
+                raise ValueError(f"Локатор '{name}' не поддерживается пакетным запросом: {locator}")
+            script_locators.append(list(script_locator))
+
+        states = self.browser.execute_script(ELEMENT_STATE_JS, script_locators, list(attributes))
+        return dict(zip(locators, states))
+
     def select_by_value(self, locator, value: str, timeout: int = 10) -> None:
         """
         Выбирает значение из выпадающего списка по атрибуту `value`.
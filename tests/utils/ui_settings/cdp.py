@@ -0,0 +1,51 @@
+import logging
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+CDP_EXECUTE_COMMAND = "executeCdpCommand"
+CDP_AVAILABLE_ATTR = "_lenza_cdp_available"
+
+
+def execute_cdp(browser: WebDriver, cmd: str, params: dict = None) -> dict:
+    """
+    Выполняет команду Chrome DevTools Protocol как для локального, так и для удалённого (Selenoid) драйвера.
+
+    :param browser: Экземпляр WebDriver.
+    :param cmd: Имя CDP-команды (например, 'Network.clearBrowserCookies').
+    :param params: Параметры команды.
+    :return: Результат команды.
+    """
+    if hasattr(browser, "execute_cdp_cmd"):
+        return browser.execute_cdp_cmd(cmd, params or {})
+
+    # webdriver.Remote не знает CDP-эндпоинт chromedriver, регистрируем его вручную
+    executor = browser.command_executor
+    if CDP_EXECUTE_COMMAND not in executor._commands:
+        executor.add_command(CDP_EXECUTE_COMMAND, "POST", "/session/$sessionId/goog/cdp/execute")
+    return browser.execute(CDP_EXECUTE_COMMAND, {"cmd": cmd, "params": params or {}})["value"]
+
+
+def is_cdp_available(browser: WebDriver) -> bool:
+    """
+    Проверяет один раз на драйвер, что CDP-команды доходят до браузера.
+
+    Selenoid и другие хабы могут не проксировать /goog/cdp/execute: тогда возможности, которые
+    опираются на CDP, отключаются с предупреждением, а не падают на первом вызове в тесте.
+
+    :param browser: Экземпляр WebDriver.
+    :return: True, если Browser.getVersion вернул ответ браузера.
+    """
+    available = getattr(browser, CDP_AVAILABLE_ATTR, None)
+    if available is None:
+        try:
+            available = "product" in (execute_cdp(browser, "Browser.getVersion") or {})
+        except WebDriverException as error:
+            logger.warning(f"CDP-эндпоинт драйвера не поддерживается: {error.msg}")
+            available = False
+        if not available:
+            logger.warning("Возможности, использующие CDP, отключены для этого драйвера")
+        setattr(browser, CDP_AVAILABLE_ATTR, available)
+    return available
@@ -0,0 +1,91 @@
+import os
+import threading
+import time
+
+from tests.utils.step_logger import StepTracer
+
+OUTSIDE_STEP = "<вне шага>"
+
+
+class CommandListener:
+    """
+    Учёт команд WebDriver текущего теста: каждая команда — это HTTP-запрос к драйверу (или к Selenoid).
+
+    Слушатель подменяет метод execute у экземпляра драйвера, поэтому видит все команды
+    (findElement, clickElement, executeScript, executeCdpCommand, ...) без обёрток над WebElement.
+    Команда относится к самому вложенному открытому шагу StepLogger.
+    """
+
+    _lock = threading.Lock()
+    _stats = None
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return os.getenv("WEBDRIVER_COMMAND_STATS", "True").lower() == "true"
+
+    @classmethod
+    def install(cls, browser):
+        """
+        Подключает учёт команд к драйверу.
+
+        :param browser: Экземпляр Selenium WebDriver.
+        :return: Тот же драйвер.
+        """
+        if not cls.is_enabled() or getattr(browser, "_command_listener_installed", False):
+            return browser
+
+        original_execute = browser.execute
+
+        def execute(driver_command, params=None):
+            started = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                cls.record(driver_command, time.perf_counter() - started)
+
+        browser.execute = execute
+        browser._command_listener_installed = True
+        return browser
+
+    @classmethod
+    def _empty_stats(cls) -> dict:
+        return {"count": 0, "latency_s": 0.0, "by_command": {}, "by_step": {}}
+
+    @classmethod
+    def record(cls, command: str, seconds: float) -> None:
+        """
+        Учитывает одну команду.
+
+        :param command: Имя команды WebDriver (например, 'findElement').
+        :param seconds: Время round trip в секундах.
+        :return: None
+        """
+        span = StepTracer.current_span()
+        step = span["name"] if span is not None and span["category"] == "step" else OUTSIDE_STEP
+        with cls._lock:
+            if cls._stats is None:
+                cls._stats = cls._empty_stats()
+            stats = cls._stats
+            stats["count"] += 1
+            stats["latency_s"] += seconds
+            for group, key in (("by_command", command), ("by_step", step)):
+                entry = stats[group].setdefault(key, {"count": 0, "latency_s": 0.0})
+                entry["count"] += 1
+                entry["latency_s"] += seconds
+
+    @classmethod
+    def reset(cls) -> None:
+        """Начинает учёт для нового теста."""
+        with cls._lock:
+            cls._stats = None
+
+    @classmethod
+    def drain(cls):
+        """
+        Возвращает статистику текущего теста и сбрасывает её.
+
+        :return: Словарь {count, latency_s, by_command, by_step} или None, если команд не было.
+        """
+        with cls._lock:
+            stats, cls._stats = cls._stats, None
+        return stats
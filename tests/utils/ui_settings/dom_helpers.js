@@ -0,0 +1,23 @@
+// Общие функции поиска и проверки видимости, которые подключаются перед element_wait.js и element_state.js.
+function lenzaFind(by, value) {
+    if (by === 'xpath') {
+        return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    if (by === 'id') {
+        return document.getElementById(value);
+    }
+    return document.querySelector(value);
+}
+
+function lenzaIsVisible(element) {
+    if (!element.isConnected || element.getClientRects().length === 0) {
+        return false;
+    }
+    for (var node = element; node && node.nodeType === Node.ELEMENT_NODE; node = node.parentElement) {
+        var style = window.getComputedStyle(node);
+        if (style.display === 'none' || style.opacity === '0') {
+            return false;
+        }
+    }
+    return window.getComputedStyle(element).visibility !== 'hidden';
+}
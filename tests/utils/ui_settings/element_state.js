@@ -0,0 +1,22 @@
+// Состояние набора элементов одним вызовом (функции lenzaFind/lenzaIsVisible — из dom_helpers.js).
+// Аргументы: список [by, value], список имён атрибутов. Возвращает список состояний в том же порядке.
+var locators = arguments[0], attributes = arguments[1];
+
+return locators.map(function (locator) {
+    var element = lenzaFind(locator[0], locator[1]);
+    if (!element) {
+        return {present: false, visible: false, enabled: false, text: null, attributes: {}};
+    }
+    var values = {};
+    attributes.forEach(function (name) {
+        values[name] = name === 'value' && 'value' in element ? element.value : element.getAttribute(name);
+    });
+    var visible = lenzaIsVisible(element);
+    return {
+        present: true,
+        visible: visible,
+        enabled: !element.disabled,
+        text: visible ? element.innerText : '',
+        attributes: values
+    };
+});
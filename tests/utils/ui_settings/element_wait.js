@@ -0,0 +1,56 @@
+// Ожидание элемента внутри страницы: MutationObserver + редкая страховочная проверка
+// (видимость может меняться CSS-анимацией без мутаций DOM). lenzaFind/lenzaIsVisible — из dom_helpers.js.
+// Аргументы: by ('xpath' | 'css selector' | 'id'), value, condition ('present' | 'visible' | 'clickable' | 'text'),
+// expectedText, budgetMs, callback. Возвращает найденный элемент, true (для 'text') или null по истечении бюджета.
+var by = arguments[0], value = arguments[1], condition = arguments[2];
+var expectedText = arguments[3], budgetMs = arguments[4];
+var done = arguments[arguments.length - 1];
+
+function evaluate() {
+    var element = lenzaFind(by, value);
+    if (!element) {
+        return null;
+    }
+    switch (condition) {
+        case 'visible':
+            return lenzaIsVisible(element) ? element : null;
+        case 'clickable':
+            return lenzaIsVisible(element) && !element.disabled ? element : null;
+        case 'text':
+            return (element.innerText || element.textContent || '').indexOf(expectedText) !== -1 ? true : null;
+        default:
+            return element;
+    }
+}
+
+var result = evaluate();
+if (result) {
+    done(result);
+    return;
+}
+
+var finished = false;
+var observer = new MutationObserver(check);
+var safetyTimer = setInterval(check, 100);
+var budgetTimer = setTimeout(function () { finish(null); }, budgetMs);
+observer.observe(document.documentElement || document, {
+    childList: true, subtree: true, attributes: true, characterData: true
+});
+
+function check() {
+    var found = evaluate();
+    if (found) {
+        finish(found);
+    }
+}
+
+function finish(value) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    observer.disconnect();
+    clearInterval(safetyTimer);
+    clearTimeout(budgetTimer);
+    done(value);
+}
@@ -0,0 +1,116 @@
+// Замер XPath-локаторов и подбор эквивалентных CSS-селекторов на текущем DOM.
+// Аргументы: список [имя, xpath], число повторов замера.
+// Возвращает список {name, matches, xpath_ms, suggestions: [{css, ms}]}; CSS-кандидат попадает в suggestions,
+// только если querySelectorAll возвращает ровно те же элементы и в том же порядке, что и XPath.
+var locators = arguments[0], iterations = arguments[1];
+var CANDIDATE_ATTRIBUTES = ['data-testid', 'data-test', 'data-qa', 'name', 'placeholder', 'aria-label', 'for', 'type', 'role'];
+
+function evaluateXpath(xpath) {
+    var snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < snapshot.snapshotLength; i++) {
+        nodes.push(snapshot.snapshotItem(i));
+    }
+    return nodes;
+}
+
+function measure(callback) {
+    var started = performance.now();
+    for (var i = 0; i < iterations; i++) {
+        callback();
+    }
+    return (performance.now() - started) / iterations;
+}
+
+function simpleSelector(element) {
+    var tag = element.tagName.toLowerCase();
+    var classes = Array.prototype.map.call(element.classList, function (name) { return '.' + CSS.escape(name); }).join('');
+    return classes ? tag + classes : null;
+}
+
+function ownSelectors(element) {
+    var tag = element.tagName.toLowerCase();
+    var selectors = [];
+    if (element.id) {
+        selectors.push('#' + CSS.escape(element.id));
+    }
+    CANDIDATE_ATTRIBUTES.forEach(function (attribute) {
+        var value = element.getAttribute(attribute);
+        if (value) {
+            selectors.push(tag + '[' + attribute + '="' + value.replace(/(["\\])/g, '\\$1') + '"]');
+        }
+    });
+    var byClass = simpleSelector(element);
+    if (byClass) {
+        selectors.push(byClass);
+    }
+    selectors.push(tag);
+    return selectors;
+}
+
+function candidates(element) {
+    var own = ownSelectors(element);
+    var result = own.slice();
+    if (element.parentElement) {
+        var parent = simpleSelector(element.parentElement);
+        if (parent) {
+            own.forEach(function (selector) { result.push(parent + ' > ' + selector); });
+        }
+    }
+    for (var ancestor = element.parentElement; ancestor && ancestor !== document.documentElement; ancestor = ancestor.parentElement) {
+        var scope = ancestor.id ? '#' + CSS.escape(ancestor.id) : simpleSelector(ancestor);
+        if (scope) {
+            own.forEach(function (selector) { result.push(scope + ' ' + selector); });
+        }
+        if (ancestor.id || result.length > 60) {
+            break;
+        }
+    }
+    return result;
+}
+
+function sameNodes(list, nodes) {
+    if (list.length !== nodes.length) {
+        return false;
+    }
+    for (var i = 0; i < nodes.length; i++) {
+        if (list[i] !== nodes[i]) {
+            return false;
+        }
+    }
+    return true;
+}
+
+return locators.map(function (locator) {
+    var name = locator[0], xpath = locator[1];
+    var nodes;
+    try {
+        nodes = evaluateXpath(xpath);
+    } catch (error) {
+        return {name: name, matches: 0, xpath_ms: null, error: String(error), suggestions: []};
+    }
+    var xpathMs = measure(function () { evaluateXpath(xpath); });
+    if (!nodes.length || nodes[0].nodeType !== Node.ELEMENT_NODE) {
+        return {name: name, matches: nodes.length, xpath_ms: xpathMs, suggestions: []};
+    }
+
+    var seen = {};
+    var suggestions = [];
+    candidates(nodes[0]).forEach(function (css) {
+        if (seen[css]) {
+            return;
+        }
+        seen[css] = true;
+        var list;
+        try {
+            list = document.querySelectorAll(css);
+        } catch (error) {
+            return;
+        }
+        if (sameNodes(list, nodes)) {
+            suggestions.push({css: css, ms: measure(function () { document.querySelectorAll(css); })});
+        }
+    });
+    suggestions.sort(function (first, second) { return first.ms - second.ms || first.css.length - second.css.length; });
+    return {name: name, matches: nodes.length, xpath_ms: xpathMs, suggestions: suggestions.slice(0, 3)};
+});
@@ -0,0 +1,202 @@
+"""
+Анализ производительности локаторов page object-ов.
+
+Собирает все атрибуты locator_* у страниц, замеряет вычисление XPath на живом или сохранённом DOM,
+помечает дорогие конструкции и предлагает CSS/ID-селекторы, проверенные на том же DOM
+(возвращают те же элементы в том же порядке).
+
+Запуск из корня репозитория:
+    python -m tests.utils.ui_settings.locator_analyzer --interactive --save-dom ./dom
+    python -m tests.utils.ui_settings.locator_analyzer --html ./dom/*.html
+"""
+import argparse
+import json
+import os
+import re
+from pathlib import Path
+from string import Formatter
+
+from dotenv import dotenv_values
+
+TESTS_DIR = Path(__file__).resolve().parents[2]
+REPORT_PATH = TESTS_DIR / "reports" / "locator_analysis.json"
+ANALYZER_JS = (Path(__file__).parent / "locator_analyzer.js").read_text(encoding="utf-8")
+
+# Значения по умолчанию для шаблонных локаторов (экран даты рождения)
+TEMPLATE_SAMPLES = {"label": "Day", "value": "10"}
+
+# Снимок DOM без скриптов: сохранённая страница не должна перерисовываться SPA при открытии из файла
+SNAPSHOT_DOM_JS = """
+var clone = document.documentElement.cloneNode(true);
+clone.querySelectorAll('script').forEach(function (script) { script.remove(); });
+return '<!DOCTYPE html>' + clone.outerHTML;
+"""
+
+
+class LocatorAnalyzer:
+    """
+    Замеряет локаторы на одном или нескольких DOM и собирает итоговый отчёт.
+    """
+
+    EXPENSIVE_PATTERNS = (
+        (re.compile(r"^\(?//"), "поиск по всему документу (ведущий //)"),
+        (re.compile(r"\[[^\]]*\.//"), "поиск потомков внутри предиката ([.//...])"),
+        (re.compile(r"(ancestor|preceding|following)(-sibling)?::"), "обход по осям ancestor/preceding/following"),
+        (re.compile(r"text\(\)"), "сравнение по text() (сканирование текстовых узлов)"),
+        (re.compile(r"name\(\)\s*="), "проверка name() у каждого узла"),
+        (re.compile(r"//\*"), "wildcard //* по всем элементам"),
+    )
+
+    def __init__(self, browser, locators: dict, iterations: int = 50):
+        """
+        :param browser: Экземпляр Selenium WebDriver.
+        :param locators: Словарь {"Страница.locator_имя": xpath}.
+        :param iterations: Сколько раз вычислять каждый локатор при замере.
+        """
+        self.browser = browser
+        self.locators = locators
+        self.iterations = iterations
+        self.results = {
+            name: {"xpath": xpath, "patterns": self.find_expensive_patterns(xpath), "snapshots": []}
+            for name, xpath in locators.items()
+        }
+
+    @classmethod
+    def find_expensive_patterns(cls, xpath: str) -> list:
+        """
+        :param xpath: XPath-локатор.
+        :return: Описания дорогих конструкций, найденных в локаторе.
+        """
+        return [description for pattern, description in cls.EXPENSIVE_PATTERNS if pattern.search(xpath)]
+
+    def analyze_current_dom(self, source: str) -> None:
+        """
+        Замеряет все локаторы на DOM, открытом в браузере.
+
+        :param source: Название снимка для отчёта (URL или путь к файлу).
+        """
+        measurements = self.browser.execute_script(
+            ANALYZER_JS, [[name, xpath] for name, xpath in self.locators.items()], self.iterations
+        )
+        for measurement in measurements:
+            name = measurement.pop("name")
+            if measurement["matches"]:
+                self.results[name]["snapshots"].append({"source": source, **measurement})
+
+    def build_report(self) -> dict:
+        """
+        :return: Отчёт {локатор: xpath, паттерны, лучший замер и проверенные CSS}, отсортированный по времени XPath.
+        """
+        report = {}
+        for name, result in self.results.items():
+            snapshots = result["snapshots"]
+            best = max(snapshots, key=lambda snapshot: len(snapshot["suggestions"])) if snapshots else None
+            report[name] = {
+                "xpath": result["xpath"],
+                "patterns": result["patterns"],
+                "found_in": [snapshot["source"] for snapshot in snapshots],
+                "matches": best["matches"] if best else 0,
+                "xpath_ms": max(snapshot["xpath_ms"] for snapshot in snapshots) if snapshots else None,
+                "suggestions": best["suggestions"] if best else []
+            }
+        return dict(sorted(report.items(), key=lambda entry: entry[1]["xpath_ms"] or -1, reverse=True))
+
+
+def collect_locators(page_classes, samples: dict = None) -> dict:
+    """
+    Собирает строковые атрибуты locator_* у page object-ов.
+
+    Шаблоны вида "...text()='{label}'..." подставляются значениями из samples;
+    шаблоны, для которых значений нет, пропускаются.
+
+    :param page_classes: Классы страниц, создаваемые без браузера.
+    :param samples: Значения для шаблонов локаторов, например {"label": "Day"}.
+    :return: Словарь {"Страница.locator_имя": xpath}.
+    """
+    samples = {**TEMPLATE_SAMPLES, **(samples or {})}
+    locators = {}
+    for page_class in page_classes:
+        page = page_class(browser=None)
+        for attribute, value in vars(page).items():
+            if not attribute.startswith("locator_") or not isinstance(value, str):
+                continue
+            fields = {field for _, field, _, _ in Formatter().parse(value) if field}
+            if not fields <= samples.keys():
+                continue
+            locators[f"{page_class.__name__}.{attribute}"] = value.format(**samples) if fields else value
+    return locators
+
+
+def print_report(report: dict) -> None:
+    print(f"{'локатор':<50} {'найден':>6} {'xpath ms':>9} {'css ms':>8}  предложение")
+    for name, entry in report.items():
+        suggestion = entry["suggestions"][0] if entry["suggestions"] else None
+        xpath_ms = f"{entry['xpath_ms']:.3f}" if entry["xpath_ms"] is not None else "-"
+        css_ms = f"{suggestion['ms']:.3f}" if suggestion else "-"
+        print(f"{name:<50} {entry['matches']:>6} {xpath_ms:>9} {css_ms:>8}  {suggestion['css'] if suggestion else '-'}")
+        for pattern in entry["patterns"]:
+            print(f"{'':<50}   ! {pattern}")
+    print(f"Отчёт: {REPORT_PATH}")
+
+
+def main(argv=None):
+    for key, value in dotenv_values(TESTS_DIR / "configuration" / "example.env").items():
+        os.environ.setdefault(key, value)
+
+    from tests.ui.ui_pages.auth_page import AuthPage
+    from tests.ui.ui_pages.workspace_page import WorkspacePage
+    from tests.utils.ui_settings.browser_settings import get_browser
+
+    parser = argparse.ArgumentParser(description="Замер локаторов AuthPage/WorkspacePage и подбор CSS-селекторов")
+    parser.add_argument("--url", default=AuthPage(browser=None).PAGE_PATH, help="Страница для живого анализа")
+    parser.add_argument("--html", nargs="*", default=[], help="Сохранённые снимки DOM вместо живой страницы")
+    parser.add_argument("--interactive", action="store_true",
+                        help="Анализировать несколько экранов: переходите в браузере и нажимайте Enter")
+    parser.add_argument("--save-dom", help="Каталог для сохранения проанализированных экранов")
+    parser.add_argument("--locator", action="append", default=[], help="Дополнительный локатор ИМЯ=XPATH")
+    parser.add_argument("--sample", action="append", default=[],
+                        help="Значение для шаблонного локатора ПОЛЕ=ЗНАЧЕНИЕ (по умолчанию label=Day, value=10)")
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    samples = dict(sample.partition("=")[::2] for sample in args.sample)
+    locators = collect_locators((AuthPage, WorkspacePage), samples)
+    for extra in args.locator:
+        name, _, xpath = extra.partition("=")
+        locators[name] = xpath
+
+    browser = get_browser()
+    analyzer = LocatorAnalyzer(browser, locators, args.iterations)
+    try:
+        if args.html:
+            for path in args.html:
+                browser.get(Path(path).resolve().as_uri())
+                analyzer.analyze_current_dom(path)
+        else:
+            browser.get(args.url)
+            screen = 0
+            while True:
+                if args.interactive and input("Откройте экран и нажмите Enter (q — завершить): ").strip() == "q":
+                    break
+                screen += 1
+                source = f"{browser.current_url}#screen{screen}"
+                analyzer.analyze_current_dom(source)
+                if args.save_dom:
+                    Path(args.save_dom).mkdir(parents=True, exist_ok=True)
+                    (Path(args.save_dom) / f"screen{screen}.html").write_text(
+                        browser.execute_script(SNAPSHOT_DOM_JS), encoding="utf-8"
+                    )
+                if not args.interactive:
+                    break
+    finally:
+        browser.quit()
+
+    report = analyzer.build_report()
+    REPORT_PATH.parent.mkdir(exist_ok=True)
+    with open(REPORT_PATH, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+// Трекер готовности SPA: считает незавершённые fetch/XHR и смены маршрута.
+// Скрипт идемпотентен: повторная установка на той же странице ничего не делает.
+(function (ignorePattern) {
+    if (window.__lenzaReadiness) {
+        return;
+    }
+    var ignore = ignorePattern ? new RegExp(ignorePattern) : null;
+    var state = window.__lenzaReadiness = {
+        inflight: 0,
+        lastActivity: performance.now()
+    };
+
+    function touch() {
+        state.lastActivity = performance.now();
+    }
+
+    function isIgnored(url) {
+        return ignore !== null && ignore.test(String(url));
+    }
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function (input) {
+            var url = input && input.url ? input.url : input;
+            if (isIgnored(url)) {
+                return originalFetch.apply(this, arguments);
+            }
+            state.inflight++;
+            touch();
+            return originalFetch.apply(this, arguments).finally(function () {
+                state.inflight--;
+                touch();
+            });
+        };
+    }
+
+    var originalOpen = XMLHttpRequest.prototype.open;
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__lenzaIgnored = isIgnored(url);
+        return originalOpen.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function () {
+        if (!this.__lenzaIgnored) {
+            state.inflight++;
+            touch();
+            this.addEventListener("loadend", function () {
+                state.inflight--;
+                touch();
+            });
+        }
+        return originalSend.apply(this, arguments);
+    };
+
+    ["pushState", "replaceState"].forEach(function (name) {
+        var original = history[name];
+        history[name] = function () {
+            touch();
+            return original.apply(this, arguments);
+        };
+    });
+    window.addEventListener("popstate", touch);
+    window.addEventListener("hashchange", touch);
+})(arguments.length ? arguments[0] : null);
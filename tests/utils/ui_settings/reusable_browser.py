@@ -0,0 +1,135 @@
+import logging
+import os
+from urllib.parse import urlsplit
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from tests.utils.ui_settings.base_page_actions import ElementActions
+from tests.utils.ui_settings.cdp import execute_cdp, is_cdp_available
+
+logger = logging.getLogger(__name__)
+
+
+class ReusableBrowser:
+    """
+    Один WebDriver на воркер xdist с быстрым сбросом состояния между тестами.
+
+    Между тестами очищаются cookies, localStorage/sessionStorage, закрываются лишние вкладки и
+    открывается about:blank. Драйвер пересоздаётся, если он перестал отвечать, если отработал
+    max_tests тестов (WEBDRIVER_REUSE_MAX_TESTS) или если после сброса осталось состояние.
+    """
+
+    def __init__(self, factory, max_tests: int = None):
+        """
+        :param factory: Функция, создающая новый WebDriver (например, get_browser).
+        :param max_tests: Количество тестов, после которого драйвер пересоздаётся.
+        """
+        self.factory = factory
+        self.max_tests = max_tests or int(os.getenv("WEBDRIVER_REUSE_MAX_TESTS", "50"))
+        self.browser = None
+        self.tests_run = 0
+
+    def acquire(self) -> WebDriver:
+        """
+        Возвращает живой драйвер, при необходимости создавая новый.
+
+        :return: Экземпляр WebDriver.
+        """
+        if self.browser is not None and not self._is_alive():
+            logger.warning("WebDriver не отвечает, пересоздаём")
+            self._drop()
+
+        if self.browser is None:
+            self.browser = self.factory()
+            self.tests_run = 0
+            # Проверяем CDP сразу: без него сброс идёт через JS и delete_all_cookies
+            is_cdp_available(self.browser)
+        return self.browser
+
+    def release(self):
+        """
+        Сбрасывает состояние браузера после теста или пересоздаёт драйвер, если сброс невозможен.
+
+        :return: None
+        """
+        if self.browser is None:
+            return
+
+        self.tests_run += 1
+        if self.tests_run >= self.max_tests:
+            self._drop()
+            return
+
+        try:
+            self._reset()
+            leak = self._find_leak()
+        except Exception as error:
+            # Упавший драйвер может отвечать не WebDriverException, а ошибкой соединения urllib3
+            leak = f"ошибка сброса состояния: {error}"
+
+        if leak:
+            logger.warning(f"Пересоздаём WebDriver: {leak}")
+            self._drop()
+
+    def quit(self):
+        """
+        Завершает работу драйвера.
+
+        :return: None
+        """
+        self._drop()
+
+    def _is_alive(self) -> bool:
+        try:
+            self.browser.current_window_handle
+            return True
+        except Exception:
+            return False
+
+    def _reset(self):
+        cdp = is_cdp_available(self.browser)
+        origins = set()
+        handles = self.browser.window_handles
+        for handle in reversed(handles):
+            self.browser.switch_to.window(handle)
+            url = urlsplit(self.browser.current_url)
+            if url.scheme in ("http", "https"):
+                origins.add(f"{url.scheme}://{url.netloc}")
+                # sessionStorage привязан к вкладке, поэтому чистим его до ухода со страницы
+                self.browser.execute_script("localStorage.clear(); sessionStorage.clear();")
+                if not cdp:
+                    # Без CDP cookies удаляются только для хоста открытой страницы
+                    self.browser.delete_all_cookies()
+            if handle != handles[0]:
+                self.browser.close()
+        self.browser.switch_to.window(handles[0])
+
+        if cdp:
+            execute_cdp(self.browser, "Network.clearBrowserCookies")
+            for origin in origins:
+                execute_cdp(self.browser, "Storage.clearDataForOrigin", {
+                    "origin": origin,
+                    "storageTypes": "local_storage,indexeddb,cache_storage,service_workers,websql"
+                })
+
+        ElementActions.invalidate_cache(self.browser)
+        self.browser.get("about:blank")
+
+    def _find_leak(self):
+        if len(self.browser.window_handles) != 1:
+            return "остались открытые вкладки"
+        if self.browser.current_url != "about:blank":
+            return f"не удалось открыть about:blank ({self.browser.current_url})"
+        if is_cdp_available(self.browser) and execute_cdp(self.browser, "Network.getAllCookies").get("cookies"):
+            return "остались cookies"
+        return None
+
+    def _drop(self):
+        if self.browser is None:
+            return
+        try:
+            self.browser.quit()
+        except Exception:
+            pass
+        self.browser = None
+        self.tests_run = 0
@@ -1,6 +1,52 @@
+import json
+import logging
+import os
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.remote.webdriver import WebDriver
 import time
 
+from tests.utils.ui_settings.base_page_actions import ElementActions
+from tests.utils.ui_settings.cdp import execute_cdp
+
+logger = logging.getLogger(__name__)
+
+READINESS_TRACKER_JS = (Path(__file__).parent / "readiness.js").read_text(encoding="utf-8")
+
+# Ждёт внутри браузера (одним вызовом) загрузки документа и тишины в сети.
+# Возвращает 'ready', 'busy' (бюджет вызова исчерпан) или 'no-tracker' (трекер не установлен).
+WAIT_FOR_IDLE_JS = """
+var done = arguments[arguments.length - 1];
+var quietMs = arguments[0], pollMs = arguments[1], budgetMs = arguments[2];
+var started = performance.now();
+(function check() {
+    var state = window.__lenzaReadiness;
+    if (!state) {
+        done('no-tracker');
+        return;
+    }
+    var idleFor = performance.now() - state.lastActivity;
+    if (document.readyState === 'complete' && state.inflight <= 0 && idleFor >= quietMs) {
+        done('ready');
+    } else if (performance.now() - started >= budgetMs) {
+        done('busy');
+    } else {
+        setTimeout(check, pollMs);
+    }
+})();
+"""
+
+# Запросы, которые по природе не завершаются (long polling, SSE, транспорты WebSocket-библиотек):
+# трекер готовности их не считает, иначе сеть никогда не «замолчит»
+DEFAULT_READINESS_IGNORE_URLS = r"long-?poll|/poll\b|/sockjs|/socket\.io|/ws\b|/websocket|/events?\b|/stream|/sse\b|/connection/"
+
+READINESS_STATE_JS = (
+    "return {readyState: document.readyState, "
+    "inflight: window.__lenzaReadiness ? window.__lenzaReadiness.inflight : null};"
+)
+
 
 class SeleniumFramework:
     """
@@ -9,6 +55,10 @@ class SeleniumFramework:
     Предоставляет базовые методы для открытия страницы и ожидания её полной загрузки.
     """
 
+    # Максимальная длительность одного execute_async_script, чтобы не упереться в script timeout сессии
+    WAIT_CALL_BUDGET_MS = 5000
+    POLL_INTERVAL_MS = 50
+
     def __init__(self, browser: WebDriver, timeout: int = 30):
         """
         Инициализирует фреймворк Selenium.
@@ -18,6 +68,8 @@ class SeleniumFramework:
         """
         self.browser = browser
         self.timeout = timeout
+        self.quiet_window_ms = int(os.getenv("UI_NETWORK_IDLE_MS", "300"))
+        self.ignored_urls = os.getenv("UI_READINESS_IGNORE_URLS", DEFAULT_READINESS_IGNORE_URLS) or None
 
     def open_page(self, url: str):
         """
@@ -26,18 +78,116 @@ class SeleniumFramework:
         :param url: Адрес страницы, которую необходимо открыть.
         :return: None
         """
+        self._install_tracker_on_new_documents()
+        ElementActions.invalidate_cache(self.browser)
         self.browser.get(url)
 
     def wait_until_loaded(self):
         """
-        Ожидает полной загрузки страницы.
+        Ожидает готовности SPA: document.readyState == 'complete', нет незавершённых fetch/XHR
+        и сеть «молчит» не меньше UI_NETWORK_IDLE_MS миллисекунд.
 
-        :raises TimeoutError: Если страница не загрузилась за отведённое время.
+        Проверка выполняется внутри браузера с шагом 50 мс, поэтому ожидание завершается
+        сразу после наступления тишины, а не на следующей секунде. Долгоживущие запросы
+        (UI_READINESS_IGNORE_URLS, по умолчанию long polling/SSE/WebSocket-транспорты) не учитываются.
+        Если документ загружен, но сеть так и не затихла, ожидание завершается с предупреждением,
+        как прежняя проверка document.readyState.
+
+        :raises TimeoutError: Если document.readyState не стал 'complete' за отведённое время.
         :return: None
         """
-        for _ in range(self.timeout):
-            state = self.browser.execute_script("return document.readyState")
-            if state == "complete":
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            budget_ms = min(self.WAIT_CALL_BUDGET_MS, (deadline - time.monotonic()) * 1000)
+            try:
+                result = self.browser.execute_async_script(
+                    WAIT_FOR_IDLE_JS, self.quiet_window_ms, self.POLL_INTERVAL_MS, budget_ms
+                )
+            except WebDriverException:
+                # Страница перезагрузилась во время ожидания — повторяем на новом документе
+                time.sleep(self.POLL_INTERVAL_MS / 1000)
+                continue
+
+            if result == "ready":
                 return
-            time.sleep(1)
-        raise TimeoutError("Страница не загрузилась (document.readyState != 'complete')")
+            if result == "no-tracker":
+                self._inject_tracker()
+
+        state = self.browser.execute_script(READINESS_STATE_JS)
+        if state["readyState"] == "complete":
+            logger.warning(
+                f"Сеть не затихла за {self.timeout} с (незавершённых запросов: {state['inflight']}), "
+                f"продолжаем по document.readyState. Добавьте долгоживущие запросы в UI_READINESS_IGNORE_URLS"
+            )
+            return
+        raise TimeoutError(
+            "Страница не загрузилась (document.readyState != 'complete' или остались незавершённые запросы)"
+        )
+
+    def _install_tracker_on_new_documents(self):
+        """
+        Регистрирует трекер через CDP, чтобы он появлялся в каждом новом документе до скриптов SPA.
+        Если CDP недоступен, трекер внедряется в wait_until_loaded.
+        """
+        if getattr(self.browser, "_readiness_tracker_installed", False):
+            return
+        try:
+            execute_cdp(self.browser, "Page.addScriptToEvaluateOnNewDocument", {
+                "source": f"(function () {{ {READINESS_TRACKER_JS} }})({json.dumps(self.ignored_urls)});"
+            })
+        except WebDriverException:
+            return
+        self.browser._readiness_tracker_installed = True
+
+    def _inject_tracker(self):
+        """
+        Внедряет трекер в уже загруженную страницу (запросы, начатые до внедрения, не учитываются).
+        """
+        self.browser.execute_script(READINESS_TRACKER_JS, self.ignored_urls)
+
+    def add_cookies(self, cookies: list):
+        """
+        Добавляет cookies в текущую сессию браузера.
+
+        Переносятся только cookies, домен которых совпадает с хостом открытой страницы или является
+        его родительским доменом; cookies других хостов (например, хоста API) пропускаются.
+
+        :param cookies: Список словарей {name, value, domain, path}.
+        :return: Количество добавленных cookies.
+        """
+        current_host = urlsplit(self.browser.current_url).hostname or ""
+        added = 0
+        for cookie in cookies:
+            domain = (cookie.get("domain") or "").lstrip(".")
+            if not domain or not (current_host == domain or current_host.endswith(f".{domain}")):
+                logger.debug(f"Cookie '{cookie['name']}' домена '{domain}' не относится к {current_host}, пропускаем")
+                continue
+            self.browser.add_cookie({
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "path": cookie.get("path") or "/",
+                "domain": cookie["domain"]
+            })
+            added += 1
+        return added
+
+    def set_local_storage(self, items: dict):
+        """
+        Записывает значения в localStorage текущей страницы одним вызовом.
+
+        :param items: Словарь {ключ: значение}.
+        :return: None
+        """
+        self.browser.execute_script(
+            "for (const [key, value] of Object.entries(arguments[0])) { localStorage.setItem(key, value); }",
+            items
+        )
+
+    def refresh(self):
+        """
+        Перезагружает текущую страницу.
+
+        :return: None
+        """
+        ElementActions.invalidate_cache(self.browser)
+        self.browser.refresh()
@@ -3,19 +3,40 @@ from datetime import datetime
 from pathlib import Path
 
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.remote.webdriver import WebDriver
-from webdriver_manager.chrome import ChromeDriverManager
 from dotenv import load_dotenv
 
+from tests.utils.ui_settings.command_listener import CommandListener
+from tests.utils.ui_settings.selenoid.chromedriver_cache import ChromeDriverCache
+from tests.utils.ui_settings.selenoid.chromedriver_service import SharedChromeDriverService
+
 env_path = Path(__file__).resolve().parent.parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
+FAST_PROFILE_ARGUMENTS = [
+    "--headless=new",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--no-first-run",
+    "--window-size=1920,1080",
+]
+
 
 class ChromeBrowserConfig:
     def __init__(self):
         self.browser = None
         self.launch_mode = os.getenv("WEBDRIVER_LAUNCH_MODE", "local").lower()
+        self.profile = os.getenv("WEBDRIVER_PROFILE", "full").lower()
+        self.fast_block = {
+            item.strip() for item in os.getenv("WEBDRIVER_FAST_BLOCK", "images,fonts").lower().split(",") if item.strip()
+        }
         self.browser_version = os.getenv("WEBDRIVER_VERSION", "")
         self.browser_name = os.getenv("WEBDRIVER_BROWSER", "chrome")
         self.selenoid_url = os.getenv("SELENOID_URL", "")
@@ -32,7 +53,7 @@ class ChromeBrowserConfig:
 
         # Set base_url after driver is created
         driver.base_url = os.getenv("BASE_URL", "")
-        return driver
+        return CommandListener.install(driver)
 
     def _get_common_options(self):
         dt_now = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -42,15 +63,32 @@ class ChromeBrowserConfig:
             "download.default_directory": self.download_dir,
             "profile.password_manager_leak_detection": False
         }
+        if self.profile == "fast":
+            self._apply_fast_profile(options, prefs)
         options.add_experimental_option("prefs", prefs)
         options.set_capability("browserName", self.browser_name)
 
         if self.launch_mode == "remote" and self.browser_version:
             options.set_capability("browserVersion", self.browser_version)
 
-        options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+        options.set_capability("goog:loggingPrefs", {"browser": "SEVERE" if self.profile == "fast" else "ALL"})
         return options, dt_now
 
+    def _apply_fast_profile(self, options, prefs: dict):
+        """
+        Облегчённый профиль (WEBDRIVER_PROFILE=fast): headless, стратегия загрузки eager,
+        без расширений, фоновых сетевых запросов, синхронизации и обновления компонентов.
+        Картинки и веб-шрифты (WEBDRIVER_FAST_BLOCK) отключаются на уровне браузера — настройкой профиля
+        и флагом --disable-remote-fonts, поэтому блокировка действует и во вкладках, открытых во время теста.
+        """
+        for argument in FAST_PROFILE_ARGUMENTS:
+            options.add_argument(argument)
+        options.page_load_strategy = "eager"
+        if "images" in self.fast_block:
+            prefs["profile.managed_default_content_settings.images"] = 2
+        if "fonts" in self.fast_block:
+            options.add_argument("--disable-remote-fonts")
+
     def _remote(self) -> WebDriver:
         options, dt_now = self._get_common_options()
 
@@ -75,6 +113,18 @@ class ChromeBrowserConfig:
 
     def _local(self) -> WebDriver | None:
         options, _ = self._get_common_options()
-        service = Service(executable_path=ChromeDriverManager().install())
+
+        if os.getenv("WEBDRIVER_SHARED_SERVICE", "true").lower() == "true":
+            self.browser = self._local_shared_service(options)
+            return self.browser
+
+        service = Service(executable_path=ChromeDriverCache.get_driver_path())
         self.browser = webdriver.Chrome(service=service, options=options)
         return self.browser
+
+    def _local_shared_service(self, options) -> WebDriver:
+        # Сессия открывается на общем chromedriver воркера; если он упал между проверкой и запросом — перезапускаем один раз
+        try:
+            return webdriver.Remote(command_executor=SharedChromeDriverService.get_url(), options=options)
+        except (WebDriverException, OSError):
+            return webdriver.Remote(command_executor=SharedChromeDriverService.restart(), options=options)
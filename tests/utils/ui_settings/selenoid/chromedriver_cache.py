@@ -0,0 +1,61 @@
+import os
+import threading
+from pathlib import Path
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+from tests.utils.shared_store import SharedStore
+
+
+class ChromeDriverCache:
+    """
+    Кэш пути к chromedriver, общий для всех тестов и воркеров xdist на машине.
+
+    Путь определяется один раз на пару (ОС, мажорная версия Chrome) и хранится в файле
+    с блокировкой (CHROMEDRIVER_CACHE_PATH, по умолчанию ~/.wdm/lenza_chromedriver_cache.json).
+    Быстрый путь полностью офлайн: версия Chrome читается из локальной установки, и если бинарник
+    из кэша существует, ChromeDriverManager не вызывается. Загрузку выполняет только один воркер,
+    остальные ждут её результат.
+    """
+
+    _resolved = {}
+    _key = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_driver_path(cls) -> str:
+        """
+        Возвращает путь к chromedriver, подходящему к установленному Chrome.
+
+        :return: Путь к исполняемому файлу chromedriver.
+        """
+        key = cls._get_key()
+        with cls._lock:
+            path = cls._resolved.get(key)
+            if path and os.path.exists(path):
+                return path
+
+            store = SharedStore(os.getenv(
+                "CHROMEDRIVER_CACHE_PATH",
+                str(Path.home() / ".wdm" / "lenza_chromedriver_cache.json")
+            ))
+            path = store.get_or_create(key, ChromeDriverManager().install)
+            if not os.path.exists(path):
+                # Бинарник удалён (например, очищен ~/.wdm) — определяем заново
+                store.delete(key)
+                path = store.get_or_create(key, ChromeDriverManager().install)
+
+            cls._resolved[key] = path
+            return path
+
+    @classmethod
+    def _get_key(cls) -> str:
+        # Версия локального Chrome определяется запуском бинарника, поэтому один раз на процесс.
+        # WEBDRIVER_VERSION не используется: это версия браузера в Selenoid, а не на этой машине.
+        if cls._key is None:
+            os_manager = OperationSystemManager()
+            browser_version = os_manager.get_browser_version_from_os(ChromeType.GOOGLE)
+            major_version = (browser_version or "latest").split(".")[0]
+            cls._key = f"{os_manager.get_os_type()}:chrome-{major_version}"
+        return cls._key
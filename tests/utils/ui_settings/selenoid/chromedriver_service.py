@@ -0,0 +1,78 @@
+import logging
+import threading
+
+from selenium.webdriver.chrome.service import Service
+
+from tests.utils.ui_settings.selenoid.chromedriver_cache import ChromeDriverCache
+
+logger = logging.getLogger(__name__)
+
+
+class SharedChromeDriverService:
+    """
+    Один процесс chromedriver на воркер xdist.
+
+    Новые браузерные сессии открываются через webdriver.Remote к уже запущенному сервису,
+    поэтому quit() завершает только сессию, а не процесс chromedriver. Перед каждой сессией
+    проверяется, что процесс жив и принимает соединения; упавший сервис перезапускается.
+    """
+
+    _service = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_url(cls) -> str:
+        """
+        Возвращает адрес работающего сервиса, запуская или перезапуская его при необходимости.
+
+        :return: URL chromedriver (например, 'http://localhost:9515').
+        """
+        with cls._lock:
+            if cls._service is not None and not cls._is_healthy():
+                logger.warning("chromedriver не отвечает, перезапускаем сервис")
+                cls._stop_service()
+
+            if cls._service is None:
+                service = Service(executable_path=ChromeDriverCache.get_driver_path())
+                service.start()
+                cls._service = service
+            return cls._service.service_url
+
+    @classmethod
+    def restart(cls) -> str:
+        """
+        Принудительно перезапускает сервис.
+
+        :return: URL нового сервиса.
+        """
+        with cls._lock:
+            cls._stop_service()
+        return cls.get_url()
+
+    @classmethod
+    def stop(cls):
+        """
+        Останавливает сервис (в конце сессии pytest).
+
+        :return: None
+        """
+        with cls._lock:
+            cls._stop_service()
+
+    @classmethod
+    def _is_healthy(cls) -> bool:
+        try:
+            cls._service.assert_process_still_running()
+        except Exception:
+            return False
+        return cls._service.is_connectable()
+
+    @classmethod
+    def _stop_service(cls):
+        if cls._service is None:
+            return
+        try:
+            cls._service.stop()
+        except Exception:
+            pass
+        cls._service = None
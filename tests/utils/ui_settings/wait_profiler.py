@@ -0,0 +1,131 @@
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+
+_state = threading.local()
+
+# Файлы, кадры которых пропускаются при поиске вызывающего page object-а
+INTERNAL_FILES = ("base_page_actions.py", "wait_profiler.py")
+
+
+class WaitProfiler:
+    """
+    Накопитель замеров ожиданий ElementActions внутри процесса (включается UI_WAIT_PROFILE=True).
+
+    Для каждого вызова сохраняются локатор, метод page object-а, из которого он сделан, фактическое
+    время ожидания, таймаут и исход: found (условие выполнилось), false (проверка вернула False)
+    или timeout (таймаут истёк).
+    """
+
+    _records: list = []
+    _lock = threading.Lock()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return os.getenv("UI_WAIT_PROFILE", "False").lower() == "true"
+
+    @classmethod
+    def record(cls, action: str, locator: str, caller: str, waited: float, timeout: float, outcome: str):
+        """
+        Сохраняет замер одного ожидания.
+
+        :param action: Метод ElementActions (например, 'is_visible').
+        :param locator: Значение локатора.
+        :param caller: Метод page object-а или хелпера, вызвавший ожидание.
+        :param waited: Фактическое время ожидания в секундах.
+        :param timeout: Заданный таймаут в секундах.
+        :param outcome: found, false или timeout.
+        :return: None
+        """
+        record = {
+            "action": action,
+            "locator": locator,
+            "caller": caller,
+            "test": os.getenv("PYTEST_CURRENT_TEST", "").split(" ")[0],
+            "waited": waited,
+            "timeout": timeout,
+            "outcome": outcome
+        }
+        with cls._lock:
+            cls._records.append(record)
+
+    @classmethod
+    def drain(cls) -> list:
+        """
+        Возвращает накопленные замеры и очищает накопитель.
+
+        :return: Список замеров.
+        """
+        with cls._lock:
+            records, cls._records = cls._records, []
+        return records
+
+
+def _find_caller() -> str:
+    """
+    Возвращает первый метод за пределами ElementActions, например 'WorkspacePage.is_continue_button_enabled'.
+    """
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_code.co_filename.endswith(INTERNAL_FILES):
+        frame = frame.f_back
+    if frame is None:
+        return "<unknown>"
+    owner = frame.f_locals.get("self")
+    name = frame.f_code.co_name
+    return f"{type(owner).__name__}.{name}" if owner is not None else name
+
+
+def profiled_wait(method):
+    """
+    Декоратор метода ElementActions: замеряет внешний вызов (вложенные ожидания не записываются отдельно).
+
+    :param method: Метод с сигнатурой (self, locator, ..., timeout=...).
+    :return: Обёрнутый метод.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if getattr(_state, "depth", 0) or not WaitProfiler.is_enabled():
+            try:
+                return method(self, *args, **kwargs)
+            except TimeoutException:
+                _state.timed_out = True
+                raise
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        locator = bound.arguments["locator"]
+        caller = _find_caller()
+
+        _state.depth, _state.timed_out = 1, False
+        timeout = bound.arguments.get("timeout")
+        started = time.perf_counter()
+        outcome = "found"
+        try:
+            result = method(self, *args, **kwargs)
+            if result is False:
+                # False после полного таймаута — это исчерпанное ожидание, а не мгновенный отрицательный ответ
+                burned = timeout is not None and time.perf_counter() - started >= timeout
+                outcome = "timeout" if _state.timed_out or burned else "false"
+            return result
+        except TimeoutException:
+            outcome = "timeout"
+            raise
+        finally:
+            _state.depth = 0
+            WaitProfiler.record(
+                action=method.__name__,
+                locator=locator[1] if isinstance(locator, tuple) else locator,
+                caller=caller,
+                waited=time.perf_counter() - started,
+                timeout=timeout,
+                outcome=outcome
+            )
+
+    return wrapper
@@ -1,3 +1,4 @@
+import os
 from urllib.parse import urljoin
 
 from tests.utils.custom_assertions import assert_equal
@@ -7,10 +8,16 @@ def get_controller_url(name: str) -> str:
     """
     Формирует URL сервиса на основе базового адреса API и имени контроллера.
 
+    При API_STUB=True запросы направляются на локальный стенд (tests/api/api_stub).
+
     :param name: Имя контроллера (например, 'auth', 'pages').
     :return: Полный URL до контроллера.
     """
-    base_url = "https://api....com/"
+    if os.getenv("API_STUB", "false").lower() == "true":
+        from tests.api.api_stub.stub_server import StubServer
+        base_url = StubServer.ensure_started()
+    else:
+        base_url = "https://api....com/"
     if not base_url.endswith('/'):
         base_url += '/'
     return urljoin(base_url, name)
@@ -118,3 +125,21 @@ def verify_entity_count(
     )
 
     print(f"Проверка количества прошла успешно. Факт: {actual_count}, Ожидалось: {expected_count}.")
+
+
+def percentile(values: list, percent: float) -> float:
+    """
+    Вычисляет перцентиль с линейной интерполяцией между соседними значениями.
+
+    :param values: Список чисел (порядок не важен).
+    :param percent: Перцентиль от 0 до 100 (например, 95).
+    :return: Значение перцентиля или 0.0 для пустого списка.
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * percent / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)